@@ -46,6 +46,28 @@ class APIError(Exception):
         return msg
 
 
+class RequestTimeout(APIError):
+    """An Exception Raised When the API did not respond to a request in time. Requests only time out when a
+    timeout is given or set on the client (by default, requests wait forever)."""
+
+    def __init__(self, callback: CallBack, timeout: float):
+        self.timeout = timeout
+        super(RequestTimeout, self).__init__(
+            callback, error_msg=f"No response was received within {timeout} seconds."
+        )
+
+
+class ConnectionLost(APIError):
+    """An Exception Raised When the connection to the API was lost before a request that cannot be sent again was
+    answered. The API may or may not have applied the request."""
+
+    def __init__(self, callback: CallBack):
+        super(ConnectionLost, self).__init__(
+            callback, error_msg="The connection to IreneAPI was lost before a response was received. "
+                                "The request may or may not have been applied."
+        )
+
+
 class Empty(Exception):
     """An exception caused when an iterable is empty."""
 
@@ -1,17 +1,100 @@
 from datetime import date, datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 
-COMMON_TIMESTAMP_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
+COMMON_TIMESTAMP_FORMAT = "%a, %d %b %Y %H:%M:%S %Z"
+
+# fixed positions of 'Sun, 06 Nov 1994 08:49:37 GMT'
+_WEEKDAYS = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
+_MONTHS = {
+    month: index
+    for index, month in enumerate(
+        [
+            "Jan",
+            "Feb",
+            "Mar",
+            "Apr",
+            "May",
+            "Jun",
+            "Jul",
+            "Aug",
+            "Sep",
+            "Oct",
+            "Nov",
+            "Dec",
+        ],
+        start=1,
+    )
+}
+_TIMEZONES = {"GMT", "UTC"}
+_MAX_MEMOIZED_TIMESTAMPS = 8192
+# many objects share the same dates (ex: birthdates and game start dates), so they are only parsed once.
+_timestamps: Dict[str, datetime] = {}
+
+
+def _parse_common_timestamp(date_string: str) -> Optional[datetime]:
+    """Parse a timestamp in the common format by slicing fixed offsets, or return None if it is not that format."""
+    if (
+        len(date_string) != 29
+        or date_string[3:5] != ", "
+        or date_string[7] != " "
+        or date_string[11] != " "
+        or date_string[16] != " "
+        or date_string[19] != ":"
+        or date_string[22] != ":"
+        or date_string[25] != " "
+        or date_string[:3] not in _WEEKDAYS
+        or date_string[26:] not in _TIMEZONES
+    ):
+        return None
+
+    month = _MONTHS.get(date_string[8:11])
+    digits = (
+        date_string[5:7]
+        + date_string[12:16]
+        + date_string[17:19]
+        + date_string[20:22]
+        + date_string[23:25]
+    )
+    if month is None or not digits.isascii() or not digits.isdigit():
+        return None
+
+    return datetime(
+        int(date_string[12:16]),
+        month,
+        int(date_string[5:7]),
+        int(date_string[17:19]),
+        int(date_string[20:22]),
+        int(date_string[23:25]),
+    )
 
 
 def convert_to_timestamp(date_string: Optional[str]) -> Optional[datetime]:
     """
     Convert a string to a timestamp.
 
+    Strings in the common format (ex: 'Sun, 06 Nov 1994 08:49:37 GMT') are parsed by slicing and memoized.
+    Anything else falls back to :func:`datetime.strptime`.
+
     :param date_string: str
     :return: Optional[date]
     """
-    return datetime.strptime(date_string, COMMON_TIMESTAMP_FORMAT) if date_string else None
+    if not date_string:
+        return None
+
+    timestamp = _timestamps.get(date_string)
+    if timestamp is not None:
+        return timestamp
+
+    timestamp = (
+        _parse_common_timestamp(date_string) if isinstance(date_string, str) else None
+    )
+    if timestamp is None:
+        return datetime.strptime(date_string, COMMON_TIMESTAMP_FORMAT)
+
+    if len(_timestamps) >= _MAX_MEMOIZED_TIMESTAMPS:
+        _timestamps.clear()
+    _timestamps[date_string] = timestamp
+    return timestamp
 
 
 def convert_to_date(date_string: Optional[str]) -> Optional[date]:
@@ -43,14 +126,44 @@ def convert_to_common_timestring(timestamp: datetime):
 
 
 from .access import Access, GOD, OWNER, DEVELOPER, SUPER_PATRON, FRIEND, USER
-from .difficulty import get_difficulty, Difficulty, EASY, MEDIUM, HARD
-from .callback import CallBack, callbacks
+from .difficulty import (
+    get_difficulty,
+    get_difficulty_from_ratio,
+    Difficulty,
+    EASY,
+    MEDIUM,
+    HARD,
+)
+from IreneAPIWrapper.sections import (
+    Context,
+    ContextDict,
+    ContextLocal,
+    get_context,
+    use_context,
+)
+from .callback import CallBack, callbacks, NO_TIMEOUT
 from .base import (
     internal_fetch_all,
     internal_fetch,
     internal_delete,
     internal_insert,
+    internal_resolve,
+    internal_fetch_many,
     AbstractModel,
+    get_route_class,
+    Versioned,
+    get_version,
+    NegativeCache,
+    negative_cache,
+    FreshnessPolicy,
+    FreshnessTracker,
+    freshness,
+    ModelSet,
+    IdSet,
+    TokenBucket,
+    WriteBehindBuffer,
+    write_behind,
+    game_state_writes,
     MediaSource,
     Alias,
     File,
@@ -80,17 +193,31 @@ from .name import Name
 from .group import Group
 from .person import Person
 from .affiliation import Affiliation
+from .mediaindex import MediaDifficultyIndex, media_index
 from .media import Media
-from .user import User
+from .user import User, GG_FILTER_DIFF
 from .guild import Guild
 from .channel import Channel
 from .language import Language, PackMessage
-from .subscription import Subscription
+from .subscription import Subscription, SubscriptionIndex
 from .tiktokaccount import TikTokAccount
 from .twitchaccount import TwitchAccount
+from .twitchlivepoller import TwitchLivePoller, LiveStatusChange
+from .tiktokvideowatcher import TikTokVideoWatcher, NewVideoEvent
 from .preloadcache import Preload
+from .metrics import LatencyHistogram, RouteMetrics, ClientMetrics, PrometheusExporter
+from .tracing import (
+    Tracing,
+    RequestTrace,
+    ModelTrace,
+    OpenTelemetryTracing,
+    trace_context,
+)
+from .ratelimit import RateLimit, AIMDLimiter, RequestLimiter
+from .reconnect import ReconnectPolicy
 from .client import IreneAPIClient
 from .guessinggame import GuessingGame
 from .unscramblegame import UnscrambleGame
 from .userstatus import UserStatus
 from .mode import Mode, NORMAL, GROUP
+from .roundgenerator import RoundGenerator
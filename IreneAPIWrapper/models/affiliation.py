@@ -1,10 +1,12 @@
+import asyncio
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     MediaSource,
@@ -13,10 +15,12 @@ from . import (
     Group,
     internal_delete,
     internal_insert,
+    internal_resolve,
+    freshness,
 )
 
 
-class Affiliation(AbstractModel):
+class Affiliation(Versioned, AbstractModel):
     r"""Represents the connection between a Person and Group object.
 
     An Affiliation object inherits from :ref:`AbstractModel`.
@@ -49,6 +53,8 @@ class Affiliation(AbstractModel):
 
     """
 
+    _versioned_fields = ("person", "group", "stage_name")
+
     def __init__(
         self,
         affiliation_id: int,
@@ -72,6 +78,29 @@ class Affiliation(AbstractModel):
         return 2
 
     async def get_card(self, markdown=False, extra=True):
+        """
+        Get a list representing the Affiliation as a card.
+
+        The card is cached until the Affiliation, its Person, or its Group changes.
+
+        :param markdown: bool
+            Whether the returned list should support markdown.
+        :param extra: bool
+            Whether to include the Person and Group cards.
+        :return: List[str]
+        """
+        return await self.get_cached_card(
+            (markdown, extra),
+            lambda: self._get_card_dependencies(extra),
+            lambda: self._render_card(markdown, extra),
+        )
+
+    def _get_card_dependencies(self, extra=True):
+        if not extra:
+            return []
+        return [self.group, self.person, self.person.name if self.person else None]
+
+    async def _render_card(self, markdown=False, extra=True):
         card_data = []
         if self.id:
             card_data.append(f"Aff ID: {self.id}")
@@ -82,8 +111,7 @@ class Affiliation(AbstractModel):
             return card_data
 
         if self.group:
-            card_data.append(await self.group.get_card(markdown=markdown, extra=False)
-            )
+            card_data.append(await self.group.get_card(markdown=markdown, extra=False))
         if self.person:
             card_data.append(await self.person.get_card(markdown=markdown, extra=False))
 
@@ -102,38 +130,66 @@ class Affiliation(AbstractModel):
 
         :returns: :ref:`Affiliation`
         """
-        affiliation_id = kwargs.get("affiliationid")
+        return (await Affiliation.create_bulk([kwargs]))[0]
 
-        person_id = kwargs.get("personid")
-        person = await Person.get(person_id)
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Affiliation objects.
 
-        group_id = kwargs.get("groupid")
-        group = await Group.get(group_id)
+        All references are resolved from cache in one pass before any Affiliation is built.
+        Only the references missing from cache are fetched from the API.
 
-        position_ids = kwargs.get("positionids")
-        positions = (
-            []
-            if not position_ids
-            else [await Position.get(position_id) for position_id in position_ids]
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Affiliation`]
+        """
+        from .person import _persons
+        from .group import _groups
+        from .position import _positions
+
+        # the references missing from cache are fetched together, in one batch for all the models.
+        persons, groups, positions = await asyncio.gather(
+            internal_resolve(
+                Person, _persons, [row.get("personid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Group, _groups, [row.get("groupid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Position,
+                _positions,
+                [
+                    position_id
+                    for row in list_of_dicts
+                    for position_id in row.get("positionids") or []
+                ],
+            ),
         )
 
-        stage_name = kwargs.get("stagename")
-
-        Affiliation(affiliation_id, person, group, positions, stage_name)
-
-        # This is a hacky method. The affiliation lists are checked for objects with the same ID and will remove them.
-        # Then we add the new cached object.
-        obj_in_cache = _affiliations[affiliation_id]
-        if obj_in_cache in person.affiliations:
-            person.affiliations.remove(obj_in_cache)
-        if obj_in_cache in group.affiliations:
-            group.affiliations.remove(obj_in_cache)
+        affiliations = []
+        for _dictionary in list_of_dicts:
+            affiliation_id = _dictionary.get("affiliationid")
+            person = persons.get(_dictionary.get("personid"))
+            group = groups.get(_dictionary.get("groupid"))
+            position_ids = _dictionary.get("positionids") or []
+
+            Affiliation(
+                affiliation_id,
+                person,
+                group,
+                [positions.get(position_id) for position_id in position_ids],
+                _dictionary.get("stagename"),
+            )
 
-        # Add the current Affiliation to the Person and Group objects.
-        person.affiliations.append(obj_in_cache)
-        group.affiliations.append(obj_in_cache)
+            # an affiliation with the same ID is replaced by the cached object in place.
+            obj_in_cache = _affiliations[affiliation_id]
+            for entity in (person, group):
+                if entity:
+                    entity.affiliations.add(obj_in_cache)
+                    entity.bump_version()
 
-        return _affiliations[affiliation_id]
+            affiliations.append(obj_in_cache)
+        return affiliations
 
     async def delete(self) -> None:
         """
@@ -158,6 +214,32 @@ class Affiliation(AbstractModel):
         :returns: None
         """
         _affiliations.pop(self.id)
+        for entity in (self.person, self.group):
+            if entity:
+                entity.affiliations.discard(self)
+                entity.bump_version()
+
+    def _refresh_from(self, fresh: "Affiliation"):
+        """
+        Update the Affiliation object in place with a newer copy of it.
+
+        The fresh copy added itself to the affiliations of its person and group when it was created, so the
+        Affiliation object takes its place there again.
+
+        :param fresh: :ref:`Affiliation`
+            A newer copy of the Affiliation object.
+        """
+        previous = (self.person, self.group)
+        super(Affiliation, self)._refresh_from(fresh)
+        current = (self.person, self.group)
+        for entity in previous:
+            if entity and entity not in current:
+                entity.affiliations.discard(self)
+                entity.bump_version()
+        for entity in current:
+            if entity:
+                entity.affiliations.add(self)
+                entity.bump_version()
 
     @staticmethod
     async def insert(
@@ -197,9 +279,11 @@ class Affiliation(AbstractModel):
         group = await Group.get(group_id, fetch=False)
         person = await Person.get(person_id, fetch=False)
         if group:
-            group.affiliations.append(affiliation)
+            group.affiliations.add(affiliation)
+            group.bump_version()
         if person:
-            person.affiliations.append(affiliation)
+            person.affiliations.add(affiliation)
+            person.bump_version()
         return True
 
     @staticmethod
@@ -214,10 +298,7 @@ class Affiliation(AbstractModel):
         :returns: Optional[:ref:`Affiliation`]
             The affiliation object requested.
         """
-        existing = _affiliations.get(affiliation_id)
-        if not existing and fetch:
-            return await Affiliation.fetch(affiliation_id)
-        return existing
+        return await freshness.get(Affiliation, _affiliations, affiliation_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -256,8 +337,10 @@ class Affiliation(AbstractModel):
         .. NOTE:: affiliation objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Affiliation, request={"route": "affiliation", "method": "GET"}
+            obj=Affiliation,
+            request={"route": "affiliation", "method": "GET"},
+            bulk=True,
         )
 
 
-_affiliations: Dict[int, Affiliation] = dict()
+_affiliations: Dict[int, Affiliation] = ContextDict()
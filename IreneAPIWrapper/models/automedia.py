@@ -1,4 +1,5 @@
 from typing import Union, List, Optional, Dict
+from IreneAPIWrapper.sections import ContextDict
 
 from . import (
     AbstractModel,
@@ -6,13 +7,17 @@ from . import (
     internal_fetch_all,
     internal_delete,
     internal_insert,
+    ModelSet,
 )
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class AffiliationTime:
-    r"""Holds an affiliation ID and the number of hours before it gets posted."""
+    r"""Holds an affiliation ID and the number of hours before it gets posted.
+
+    It is immutable and hashable, so it can be stored in a :ref:`ModelSet`.
+    """
     affiliation_id: int
     hours_after: int
 
@@ -33,17 +38,17 @@ class AutoMedia(AbstractModel):
     ----------
     channel_id: int
         The Channel id.
-    aff_times: List[:ref:`AffiliationTime`]
-        The Affiliation Times.
+    aff_times: :ref:`ModelSet`
+        An insertion-ordered set of the Affiliation Times.
     """
 
     def __init__(
-            self,
-            channel_id: int,
-            aff_times: List[AffiliationTime],
+        self,
+        channel_id: int,
+        aff_times: List[AffiliationTime],
     ):
         super(AutoMedia, self).__init__(channel_id)
-        self.aff_times: List[AffiliationTime] = aff_times
+        self.aff_times: ModelSet = ModelSet(aff_times)
 
         if not _automedias.get(self.id):
             # we need to make sure not to override the current object in cache.
@@ -74,6 +79,30 @@ class AutoMedia(AbstractModel):
 
         return _automedias[channel_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create AutoMedia objects.
+
+        Rows that belong to the same channel are merged into a single AutoMedia object.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`AutoMedia`]
+        """
+        auto_medias = {}
+        for _dictionary in list_of_dicts:
+            channel_id = _dictionary.get("channelid")
+            aff_time = AffiliationTime(
+                _dictionary.get("affiliationid"), _dictionary.get("hoursafter")
+            )
+
+            existing_obj = _automedias.get(channel_id)
+            if not existing_obj:
+                existing_obj = AutoMedia(channel_id, [])
+            existing_obj.aff_times.add(aff_time)
+            auto_medias[channel_id] = existing_obj
+        return list(auto_medias.values())
+
     async def add_to_cache(self, aff_time: AffiliationTime):
         """
         Add an affiliation time to cache.
@@ -81,8 +110,7 @@ class AutoMedia(AbstractModel):
         :param aff_time: :ref:`AffiliationTime`
             The affiliation time to add to cache.
         """
-        if aff_time not in self.aff_times:
-            self.aff_times.append(aff_time)
+        self.aff_times.add(aff_time)
 
     async def remove_from_cache(self, aff_time: AffiliationTime):
         """
@@ -91,8 +119,7 @@ class AutoMedia(AbstractModel):
         :param aff_time: :ref:`AffiliationTime`
             The affiliation time to remove from cache.
         """
-        if aff_time in self.aff_times:
-            self.aff_times.remove(aff_time)
+        self.aff_times.discard(aff_time)
 
     async def delete_aff_time(self, aff_time: AffiliationTime) -> None:
         """Delete the :ref:`AffiliationTime` object from the database and remove it from cache.
@@ -133,7 +160,13 @@ class AutoMedia(AbstractModel):
             }
         )
         # insert into cache.
-        await AutoMedia.create(**{"channelid": channel_id, "affiliationid": affiliation_id, "hoursafter": hours_after})
+        await AutoMedia.create(
+            **{
+                "channelid": channel_id,
+                "affiliationid": affiliation_id,
+                "hoursafter": hours_after,
+            }
+        )
         return True
 
     @staticmethod
@@ -187,8 +220,10 @@ class AutoMedia(AbstractModel):
         .. NOTE:: automedia and affiliation objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=AutoMedia, request={"route": "affiliation/automedia", "method": "GET"}
+            obj=AutoMedia,
+            request={"route": "affiliation/automedia", "method": "GET"},
+            bulk=True,
         )
 
 
-_automedias: Dict[int, AutoMedia] = dict()
\ No newline at end of file
+_automedias: Dict[int, AutoMedia] = ContextDict()
@@ -1,4 +1,5 @@
-from typing import Dict
+from typing import Dict, List
+from IreneAPIWrapper.sections import ContextDict
 
 from . import (
     AbstractModel,
@@ -6,6 +7,7 @@ from . import (
     internal_fetch_all,
     internal_delete,
     internal_insert,
+    freshness,
 )
 
 
@@ -42,14 +44,7 @@ class BanPhrase(AbstractModel):
         Channel ID to post the logs.
     """
 
-    def __init__(
-        self,
-        phrase_id,
-        guild_id,
-        phrase,
-        punishment,
-        log_channel_id
-    ):
+    def __init__(self, phrase_id, guild_id, phrase, punishment, log_channel_id):
         super(BanPhrase, self).__init__(phrase_id)
         self.guild_id: int = guild_id
         self.phrase: str = phrase
@@ -68,10 +63,36 @@ class BanPhrase(AbstractModel):
         phrase = kwargs.get("phrase")
         log_channel_id = kwargs.get("logchannelid")
 
-        BanPhrase(phrase_id=phrase_id, guild_id=guild_id, phrase=phrase, punishment=punishment,
-                  log_channel_id=log_channel_id)
+        BanPhrase(
+            phrase_id=phrase_id,
+            guild_id=guild_id,
+            phrase=phrase,
+            punishment=punishment,
+            log_channel_id=log_channel_id,
+        )
         return _ban_phrases[phrase_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create BanPhrase objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`BanPhrase`]
+        """
+        ban_phrases = []
+        for _dictionary in list_of_dicts:
+            phrase_id = _dictionary.get("phraseid")
+            BanPhrase(
+                phrase_id=phrase_id,
+                guild_id=_dictionary.get("guildid"),
+                phrase=_dictionary.get("phrase"),
+                punishment=_dictionary.get("punishment"),
+                log_channel_id=_dictionary.get("logchannelid"),
+            )
+            ban_phrases.append(_ban_phrases[phrase_id])
+        return ban_phrases
+
     def __str__(self):
         return str(self.phrase)
 
@@ -100,12 +121,7 @@ class BanPhrase(AbstractModel):
         _ban_phrases.pop(self.id)
 
     @staticmethod
-    async def insert(
-        guild_id,
-        phrase,
-        punishment,
-        log_channel_id
-    ) -> int:
+    async def insert(guild_id, phrase, punishment, log_channel_id) -> int:
         r"""
         Insert a new BanPhrase into the database and cache.
 
@@ -141,7 +157,6 @@ class BanPhrase(AbstractModel):
         phrase_id = results["addbanphrase"]
         await BanPhrase.fetch(phrase_id)  # add object to cache.
 
-
     @staticmethod
     async def get(phrase_id: int, fetch=True):
         """Get a BanPhrase object.
@@ -153,10 +168,7 @@ class BanPhrase(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`BanPhrase`
         """
-        existing = _ban_phrases.get(phrase_id)
-        if not existing and fetch:
-            return await BanPhrase.fetch(phrase_id)
-        return existing
+        return await freshness.get(BanPhrase, _ban_phrases, phrase_id, fetch)
 
     @staticmethod
     async def get_all(guild_id=None):
@@ -202,8 +214,8 @@ class BanPhrase(AbstractModel):
         .. NOTE::: Ban phrase objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=BanPhrase, request={"route": "banphrases/", "method": "GET"}
+            obj=BanPhrase, request={"route": "banphrases/", "method": "GET"}, bulk=True
         )
 
 
-_ban_phrases: Dict[int, BanPhrase] = dict()
+_ban_phrases: Dict[int, BanPhrase] = ContextDict()
@@ -1,9 +1,19 @@
+from .route import get_route_class
 from .abstractmodel import AbstractModel
+from .versioned import Versioned, get_version
+from .negativecache import NegativeCache, negative_cache
+from .freshness import FreshnessPolicy, FreshnessTracker, freshness
+from .modelset import ModelSet
+from .idset import IdSet
+from .tokenbucket import TokenBucket
+from .writebehind import WriteBehindBuffer, write_behind, game_state_writes
 from .receiver import (
     internal_fetch,
     internal_fetch_all,
     internal_delete,
     internal_insert,
+    internal_resolve,
+    internal_fetch_many,
     basic_call,
 )
 from .file import File
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Iterable, Optional, Tuple
 
 
 class AbstractModel:
@@ -7,9 +7,11 @@ class AbstractModel:
 
         .. container:: operations
             .. describe:: x == y
-                Checks if two models have the same ID.
+                Checks if two models are of the same model and have the same ID.
             .. describe:: x != y
-                Checks if two models do not have the same ID.
+                Checks if two models are of different models or do not have the same ID.
+            .. describe:: hash(x)
+                Returns the hash of the model and its ID, so equal models can be used in sets and as dict keys.
 
         Arguments
         ---------
@@ -28,13 +30,17 @@ class AbstractModel:
         return 0
 
     def __hash__(self):
-        return id(self)
+        return hash((type(self), self.id))
 
     def __eq__(self, other):
-        return self.id == other.id
+        if not isinstance(other, AbstractModel):
+            return NotImplemented
+        return type(self) is type(other) and self.id == other.id
 
     def __ne__(self, other):
-        return self.id != other.id
+        if not isinstance(other, AbstractModel):
+            return NotImplemented
+        return type(self) is not type(other) or self.id != other.id
 
     async def delete(self):
         """Delete the current object from the database and remove it from cache."""
@@ -54,6 +60,21 @@ class AbstractModel:
         """Remove the current object from cache."""
         ...
 
+    def _refresh_from(self, fresh: "AbstractModel"):
+        """
+        Update the current object in place with the public attributes of a newer copy of it.
+
+        :param fresh: :ref:`AbstractModel`
+            A newer copy of the current object that was fetched from the API.
+        """
+        for name, value in vars(fresh).items():
+            if not name.startswith("_"):
+                setattr(self, name, value)
+
+    def _has_staged_writes(self) -> bool:
+        """Whether changes to the current object are staged in a :ref:`WriteBehindBuffer` and not sent yet."""
+        return False
+
     @staticmethod
     async def insert(*args, **kwargs):
         """Insert a new object into the database."""
@@ -74,9 +95,48 @@ class AbstractModel:
 
     @staticmethod
     async def get(unique_id: int, fetch: bool):
-        """Get an object if it exists in cache, otherwise fetch the object from the API."""
+        """Get an object if it exists in cache, otherwise fetch the object from the API.
+
+        Cached objects of a model with a :ref:`FreshnessPolicy` are refreshed once they are stale.
+        """
         ...
 
+    @classmethod
+    async def get_many(
+        cls, unique_ids: Iterable, fetch: bool = True, limit: Optional[int] = 32
+    ) -> Tuple[List, List]:
+        """Get several objects at once.
+
+        Objects found in cache are returned directly. All ids missing from cache are fetched from the API together
+        (with at most `limit` fetches pending at once) instead of one round trip after another.
+
+        :param unique_ids: Iterable
+            The ids of the objects to get/fetch.
+        :param fetch: bool
+            Whether to fetch the ids missing from cache from the API.
+        :param limit: Optional[int]
+            The maximum amount of fetches that may be pending at once. None sends them all at once.
+        :returns: Tuple[List[:ref:`AbstractModel`], List]
+            The objects found (in the same order as the ids were given) and the ids that could not be found.
+        """
+        from . import internal_fetch_many
+
+        unique_ids = list(unique_ids)
+        found = {}
+        for unique_id in unique_ids:
+            if unique_id not in found:
+                found[unique_id] = await cls.get(unique_id, fetch=False)
+
+        misses = [unique_id for unique_id, obj in found.items() if obj is None]
+        if misses and fetch:
+            found.update(await internal_fetch_many(cls, misses, limit=limit))
+
+        objects = [
+            found[unique_id] for unique_id in unique_ids if found[unique_id] is not None
+        ]
+        missing = [unique_id for unique_id in found if found[unique_id] is None]
+        return objects, missing
+
     @staticmethod
     async def fetch(unique_id: int):
         """Fetch the object from the API."""
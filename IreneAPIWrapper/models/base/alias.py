@@ -1,9 +1,9 @@
 from typing import Optional
 
-from . import AbstractModel
+from . import AbstractModel, Versioned
 
 
-class Alias(AbstractModel):
+class Alias(Versioned, AbstractModel):
     r"""Represents an Abstract Alias.
 
     An Alias object inherits from :ref:`AbstractModel`.
@@ -34,6 +34,8 @@ class Alias(AbstractModel):
          A guild ID that owns the alias if there is one.
     """
 
+    _versioned_fields = ("name",)
+
     def __init__(self, alias_id, alias_name, obj_id, guild_id):
         super(Alias, self).__init__(alias_id)
         self.name: str = alias_name
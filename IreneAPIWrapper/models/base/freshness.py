@@ -0,0 +1,322 @@
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from IreneAPIWrapper.sections import (
+    outer,
+    Context,
+    ContextDict,
+    get_context,
+    use_context,
+)
+from . import AbstractModel
+
+# the model, cache, and id of the object being refreshed by the current task.
+_refresh_target: ContextVar[Optional[Tuple[Any, dict, Any]]] = ContextVar(
+    "refresh_target", default=None
+)
+
+
+class _RefreshCache(dict):
+    r"""
+    The cache of a model as seen while the fresh copy of one of its objects is created.
+
+    The object being refreshed is hidden and its fresh copy is kept here, while every other ID reads and writes the
+    real cache. Constructors only cache an object if its ID is not cached yet, so this is where the fresh copy goes.
+    """
+
+    def __init__(self, cache: dict, unique_id):
+        super(_RefreshCache, self).__init__()
+        self._cache = cache
+        self._unique_id = unique_id
+
+    def get(self, key, default=None):
+        return (
+            super(_RefreshCache, self).get(key, default)
+            if key == self._unique_id
+            else self._cache.get(key, default)
+        )
+
+    def __getitem__(self, key):
+        return (
+            super(_RefreshCache, self).__getitem__(key)
+            if key == self._unique_id
+            else self._cache[key]
+        )
+
+    def __setitem__(self, key, value):
+        if key == self._unique_id:
+            super(_RefreshCache, self).__setitem__(key, value)
+        else:
+            self._cache[key] = value
+
+    def __contains__(self, key):
+        return (
+            super(_RefreshCache, self).__contains__(key)
+            if key == self._unique_id
+            else key in self._cache
+        )
+
+    def pop(self, key, *args):
+        return (
+            super(_RefreshCache, self).pop(key, *args)
+            if key == self._unique_id
+            else self._cache.pop(key, *args)
+        )
+
+
+class _RefreshValues(dict):
+    r"""The values of a :ref:`Context` with the cache being refreshed replaced by a :ref:`_RefreshCache`."""
+
+    def __init__(self, values: dict, cache: ContextDict, refresh_cache: _RefreshCache):
+        super(_RefreshValues, self).__init__()
+        self._values = values
+        self._cache = cache
+        self._refresh_cache = refresh_cache
+
+    def __getitem__(self, key):
+        return self._refresh_cache if key is self._cache else self._values[key]
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+
+
+class _RefreshContext(Context):
+    r"""The current :ref:`Context` as seen while the fresh copy of a cached object is created."""
+
+    def __init__(self, context: Context, cache: ContextDict, unique_id):
+        super(_RefreshContext, self).__init__()
+        self.client = context.client
+        self.refresh_cache = _RefreshCache(cache.resolve(), unique_id)
+        self._values = _RefreshValues(context._values, cache, self.refresh_cache)
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    r"""
+    How long cached objects of a model may be used before they are refreshed.
+
+    Parameters
+    ----------
+    soft_ttl: float
+        The age in seconds after which a cached object is refreshed in the background.
+    hard_ttl: Optional[float]
+        The age in seconds after which getting a cached object waits for it to be refreshed.
+        None never waits.
+    """
+
+    soft_ttl: float
+    hard_ttl: Optional[float] = None
+
+
+class FreshnessTracker:
+    r"""
+    A stale-while-revalidate read-through mode for :ref:`AbstractModel.get`.
+
+    Without a policy, getting an object returns whatever is cached, however old. With a :ref:`FreshnessPolicy`,
+    an object older than the soft TTL is still returned immediately, but one background fetch refreshes it in place.
+    An object older than the hard TTL waits for the refresh instead.
+
+    Refreshed objects are updated in place, so references held elsewhere (ex: by a running game) see the new values.
+    An object with writes still staged in a :ref:`WriteBehindBuffer` is not refreshed, as its local state is newer
+    than the API's.
+
+    The age of an object is counted from the last time it was fetched from the API. Objects that were created
+    without a fetch (ex: on insert) have no known age and are refreshed in the background the first time they
+    are read.
+    """
+
+    def __init__(self):
+        self._policies: Dict[str, FreshnessPolicy] = {}
+        self._fetched_at: Dict[str, Dict[Any, float]] = ContextDict()
+        self._refreshes: Dict[Tuple[str, Any], asyncio.Task] = ContextDict()
+        self._metrics: Dict[str, Dict[str, int]] = ContextDict()
+
+    def set_policy(
+        self, obj: AbstractModel, soft_ttl: float, hard_ttl: Optional[float] = None
+    ) -> None:
+        """
+        Set the freshness policy of a concrete model.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        :param soft_ttl: float
+            The age in seconds after which a cached object is refreshed in the background.
+        :param hard_ttl: Optional[float]
+            The age in seconds after which getting a cached object waits for it to be refreshed.
+        """
+        if hard_ttl is not None and hard_ttl < soft_ttl:
+            raise ValueError("The hard TTL can not be shorter than the soft TTL.")
+        self._policies[obj.__name__] = FreshnessPolicy(soft_ttl, hard_ttl)
+
+    def remove_policy(self, obj: AbstractModel) -> None:
+        """
+        Remove the freshness policy of a concrete model, so cached objects are used however old they are.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        """
+        self._policies.pop(obj.__name__, None)
+        self._fetched_at.pop(obj.__name__, None)
+
+    def get_policy(self, obj: AbstractModel) -> Optional[FreshnessPolicy]:
+        """
+        Get the freshness policy of a concrete model.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        :returns: Optional[:ref:`FreshnessPolicy`]
+        """
+        return self._policies.get(obj.__name__)
+
+    async def get(
+        self,
+        obj: AbstractModel,
+        cache: Dict[Any, AbstractModel],
+        unique_id,
+        fetch: bool = True,
+    ):
+        """
+        Get an object from cache, refreshing it according to the model's policy.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        :param cache: Dict[Any, :ref:`AbstractModel`]
+            The cache of the concrete model.
+        :param unique_id: Any
+            The ID of the object.
+        :param fetch: bool
+            Whether to fetch the object from the API if it is not cached or (with a policy) is stale.
+        :returns: Optional[:ref:`AbstractModel`]
+        """
+        existing = cache.get(unique_id)
+        if existing is None:
+            return await obj.fetch(unique_id) if fetch else None
+
+        policy = self._policies.get(obj.__name__)
+        if policy is None or not fetch:
+            return existing
+
+        fetched_at = self._fetched_at.get(obj.__name__, {}).get(existing.id)
+        age = None if fetched_at is None else monotonic() - fetched_at
+        if age is not None and age < policy.soft_ttl:
+            self._get_metrics(obj)["fresh"] += 1
+            return existing
+
+        task = self._refresh(obj, cache, unique_id)
+        if policy.hard_ttl is None or age is None or age < policy.hard_ttl:
+            self._get_metrics(obj)["stale"] += 1
+            return existing
+
+        self._get_metrics(obj)["expired"] += 1
+        # a failed refresh is logged, and the cached object is the best there is.
+        await asyncio.shield(task)
+        refreshed = cache.get(unique_id)
+        return existing if refreshed is None else refreshed
+
+    def mark_fetched(
+        self, obj: AbstractModel, objects: Iterable[AbstractModel]
+    ) -> None:
+        """
+        Record that objects of a concrete model were just fetched from the API.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        :param objects: Iterable[:ref:`AbstractModel`]
+            The fetched objects.
+        """
+        if obj.__name__ not in self._policies:
+            return
+
+        fetched_at = self._fetched_at.setdefault(obj.__name__, {})
+        now = monotonic()
+        for fetched in objects:
+            if fetched is not None:
+                fetched_at[fetched.id] = now
+
+    async def create(self, obj: AbstractModel, info: dict):
+        """
+        Create an object from fetched results, updating the cached object in place if it is being refreshed.
+
+        Model constructors only cache an object if its ID is not cached yet, so the fresh copy is created in a
+        context where the cached object is hidden from the task creating it, but still cached for everything else.
+        The cached object is then updated with the fresh copy. A cached object with staged writes is returned as is,
+        without creating the fresh copy.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        :param info: dict
+            The fetched results.
+        :returns: :ref:`AbstractModel`
+        """
+        target = _refresh_target.get()
+        if target is None or target[0] is not obj:
+            return await obj.create(**info)
+
+        _, cache, unique_id = target
+        existing = cache.get(unique_id)
+        if existing is None:
+            return await obj.create(**info)
+        if existing._has_staged_writes():
+            self._get_metrics(obj)["skipped"] += 1
+            return existing
+
+        context = _RefreshContext(get_context(), cache, unique_id)
+        with use_context(context):
+            await obj.create(**info)
+        fresh = context.refresh_cache.get(unique_id)
+        if fresh is not None and fresh is not existing:
+            existing._refresh_from(fresh)
+        return existing
+
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the freshness metrics of every model with a policy.
+
+        :return: Dict[str, Dict[str, int]]
+            The fresh, stale (refreshed in the background), and expired (waited for) reads, the refreshes,
+            the failed refreshes, and the refreshes skipped for staged writes by model name.
+        """
+        return {name: dict(metrics) for name, metrics in self._metrics.items()}
+
+    def _refresh(self, obj: AbstractModel, cache: dict, unique_id) -> asyncio.Task:
+        key = (obj.__name__, unique_id)
+        task = self._refreshes.get(key)
+        if task is None or task.done():
+            task = self._refreshes[key] = asyncio.get_running_loop().create_task(
+                self._run_refresh(obj, cache, unique_id)
+            )
+        return task
+
+    async def _run_refresh(self, obj: AbstractModel, cache: dict, unique_id) -> None:
+        # the task runs in a copy of the context, so the target is only seen by this refresh.
+        _refresh_target.set((obj, cache, unique_id))
+        metrics = self._get_metrics(obj)
+        metrics["refreshes"] += 1
+        try:
+            await obj.fetch(unique_id)
+        except Exception as e:
+            metrics["failures"] += 1
+            outer.client.logger.error(
+                f"Refreshing {obj.__name__} {unique_id} failed - {e}"
+            )
+        finally:
+            self._refreshes.pop((obj.__name__, unique_id), None)
+
+    def _get_metrics(self, obj: AbstractModel) -> Dict[str, int]:
+        metrics = self._metrics.get(obj.__name__)
+        if metrics is None:
+            metrics = self._metrics[obj.__name__] = {
+                "fresh": 0,
+                "stale": 0,
+                "expired": 0,
+                "refreshes": 0,
+                "failures": 0,
+                "skipped": 0,
+            }
+        return metrics
+
+
+freshness = FreshnessTracker()
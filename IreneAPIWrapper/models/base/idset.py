@@ -0,0 +1,147 @@
+from collections.abc import MutableSet
+from typing import Iterable, Optional, Set, Tuple
+
+
+class IdSet(MutableSet):
+    r"""
+    A set of integer IDs that can also be used as a bitset.
+
+    Membership is O(1). The bitset (an int with bit N set for ID N) and the sorted IDs are built lazily and cached
+    until the set changes, so repeated bitset checks against other ID sets (ex: the persons of an affiliation set)
+    do not rebuild them.
+
+    It iterates in ascending order and keeps `append` and `remove` so it can replace a list of IDs.
+
+    .. container:: operations
+        .. describe:: x in s
+            Checks if an ID is in the set.
+        .. describe:: s & t, s | t, s - t
+            Set algebra with any iterable of IDs, returning a new IdSet.
+
+    Parameters
+    ----------
+    ids: Optional[Iterable[int]]
+        The initial IDs.
+    """
+
+    __slots__ = ("_ids", "_bits", "_sorted")
+
+    def __init__(self, ids: Optional[Iterable[int]] = None):
+        self._ids: Set[int] = set(ids or [])
+        self._bits: Optional[int] = None
+        self._sorted: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def from_bits(cls, bits: int) -> "IdSet":
+        """
+        Create an IdSet from a bitset.
+
+        :param bits: int
+            An int with bit N set for ID N.
+        :returns: :ref:`IdSet`
+        """
+        ids = []
+        while bits:
+            lowest = bits & -bits
+            ids.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return cls(ids)
+
+    @property
+    def bits(self) -> int:
+        """The IDs as a bitset."""
+        if self._bits is None:
+            bits = 0
+            for _id in self._ids:
+                bits |= 1 << _id
+            self._bits = bits
+        return self._bits
+
+    @property
+    def sorted(self) -> Tuple[int, ...]:
+        """The IDs in ascending order."""
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self._ids))
+        return self._sorted
+
+    def __contains__(self, _id) -> bool:
+        return _id in self._ids
+
+    def __iter__(self):
+        return iter(self.sorted)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self.sorted)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, IdSet):
+            return self._ids == other._ids
+        return super(IdSet, self).__eq__(other)
+
+    def __and__(self, other):
+        return IdSet(self._ids.intersection(other))
+
+    def __or__(self, other):
+        return IdSet(self._ids.union(other))
+
+    def __sub__(self, other):
+        return IdSet(self._ids.difference(other))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __hash__ = None
+
+    def intersects(self, other: "IdSet") -> bool:
+        """
+        Check if any ID is shared with another IdSet using their bitsets.
+
+        :param other: :ref:`IdSet`
+        :returns: bool
+        """
+        return bool(self.bits & other.bits)
+
+    def diff(self, ids: Iterable[int]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Get the IDs that need to be added and removed to turn this set into other IDs.
+
+        :param ids: Iterable[int]
+            The desired IDs.
+        :returns: Tuple[Tuple[int, ...], Tuple[int, ...]]
+            The added IDs and the removed IDs in ascending order.
+        """
+        ids = set(ids)
+        return tuple(sorted(ids - self._ids)), tuple(sorted(self._ids - ids))
+
+    def add(self, _id: int) -> None:
+        """Add an ID."""
+        if _id not in self._ids:
+            self._ids.add(_id)
+            self._invalidate()
+
+    def discard(self, _id: int) -> None:
+        """Remove an ID if it exists."""
+        if _id in self._ids:
+            self._ids.discard(_id)
+            self._invalidate()
+
+    def remove(self, _id: int) -> None:
+        """Remove an ID. Raises a ValueError (like a list) if it does not exist."""
+        if _id not in self._ids:
+            raise ValueError(f"{_id} is not in the {self.__class__.__name__}.")
+        self.discard(_id)
+
+    def update(self, ids: Iterable[int]) -> None:
+        """Add several IDs."""
+        for _id in ids:
+            self.add(_id)
+
+    def _invalidate(self) -> None:
+        self._bits = None
+        self._sorted = None
+
+    # list compatibility
+    append = add
+    extend = update
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from . import File, basic_call
+from . import File, basic_call, Versioned
 
 
-class MediaSource(File):
+class MediaSource(Versioned, File):
     r"""Represents a MediaSource object.
 
     A MediaSource object inherits from :ref:`File`.
@@ -18,6 +18,8 @@ class MediaSource(File):
         The URL of the media.
     """
 
+    _versioned_fields = ("url",)
+
     def __init__(self, url, media_id: int = None, file_type=None):
         # TODO: file location
         super(MediaSource, self).__init__(file_type=file_type)
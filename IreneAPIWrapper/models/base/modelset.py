@@ -0,0 +1,84 @@
+from collections.abc import MutableSet
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional
+
+
+class ModelSet(MutableSet):
+    r"""
+    An insertion-ordered set of hashable objects (such as :ref:`AbstractModel` objects, which hash by their model
+    and ID).
+
+    It iterates like the list it replaces, but membership, adding, and removing are O(1). Indexing builds a list of
+    the objects once, which is kept until the set changes.
+    Adding an object that is equal to an existing one replaces the existing object without moving it.
+
+    .. container:: operations
+        .. describe:: x in s
+            Checks if an equal object (the same model with the same ID) is in the set.
+        .. describe:: len(s)
+            The amount of objects in the set.
+
+    Parameters
+    ----------
+    objects: Optional[Iterable[Hashable]]
+        The initial objects.
+    """
+
+    __slots__ = ("_objects", "_sequence")
+
+    def __init__(self, objects: Optional[Iterable[Hashable]] = None):
+        self._objects: Dict[Hashable, Hashable] = {}
+        # the objects as a list for indexing, or None if the set changed since it was built.
+        self._sequence: Optional[List[Hashable]] = None
+        if objects:
+            self.update(objects)
+
+    def __contains__(self, obj) -> bool:
+        try:
+            return obj in self._objects
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator:
+        return iter(self._objects.values())
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __getitem__(self, index):
+        if self._sequence is None:
+            self._sequence = list(self._objects.values())
+        return self._sequence[index]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self._objects.values())!r})"
+
+    def add(self, obj: Hashable) -> None:
+        """Add an object, replacing an equal object in place if there is one."""
+        self._objects[obj] = obj
+        self._sequence = None
+
+    def discard(self, obj: Hashable) -> None:
+        """Remove an object if it exists."""
+        self._objects.pop(obj, None)
+        self._sequence = None
+
+    def remove(self, obj: Hashable) -> None:
+        """Remove an object. Raises a ValueError (like a list) if it does not exist."""
+        if obj not in self._objects:
+            raise ValueError(f"{obj!r} is not in the {self.__class__.__name__}.")
+        del self._objects[obj]
+        self._sequence = None
+
+    def update(self, objects: Iterable[Hashable]) -> None:
+        """Add several objects."""
+        for obj in objects:
+            self._objects[obj] = obj
+        self._sequence = None
+
+    def get(self, obj: Hashable, default=None):
+        """Get the stored object that is equal to the object passed in."""
+        return self._objects.get(obj, default)
+
+    # list compatibility
+    append = add
+    extend = update
@@ -0,0 +1,228 @@
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+from IreneAPIWrapper.sections import ContextDict
+from . import AbstractModel, get_route_class
+
+
+class NegativeCache:
+    r"""
+    Remembers fetches that returned no results from the API.
+
+    A fetch for an id that does not exist (deleted objects, bad user input, stale references) is otherwise sent to
+    the API on every single miss. Known missing fetches are answered locally until their TTL expires.
+    Only responses that answered with empty results are remembered, not responses without results at all.
+
+    Entries are grouped by their route class (see :func:`get_route_class`) and by the route
+    parameters that identify the object (ex: the person ID). A write to an object (ex: 'person/$person_id')
+    invalidates the entries of that object only. A write to the root of a route (ex: an insert) invalidates the
+    entries of the objects its parameters identify, or of the whole route if it does not identify any, since the
+    API may have given the new object any ID.
+
+    Parameters
+    ----------
+    ttl: float
+        The default amount of seconds a missing object is remembered for.
+    max_size: int
+        The maximum amount of objects remembered per route.
+
+    Attributes
+    ----------
+    ttl: float
+        The default amount of seconds a missing object is remembered for.
+    max_size: int
+        The maximum amount of objects remembered per route.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._ttls: Dict[str, float] = {}
+        # the expiry of every fetch by route class, then by the parameters that identify the object.
+        self._entries: Dict[str, Dict[Tuple, Dict[Tuple, float]]] = ContextDict()
+        self._metrics: Dict[str, Dict[str, int]] = ContextDict()
+
+    def set_ttl(self, obj: AbstractModel, ttl: float) -> None:
+        """
+        Set the amount of seconds a missing object of a concrete model is remembered for.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model.
+        :param ttl: float
+            The amount of seconds. A TTL of 0 disables negative caching for the model.
+        """
+        self._ttls[obj.__name__] = ttl
+
+    def is_missing(self, obj: AbstractModel, request: dict) -> bool:
+        """
+        Check whether a fetch is known to return no results.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model being fetched.
+        :param request: dict
+            The fetch request.
+        :return: bool
+        """
+        if self._ttls.get(obj.__name__, self.ttl) <= 0:
+            return False
+
+        key = self._get_key(obj, request)
+        if key is None:
+            return False
+
+        metrics = self._get_metrics(obj)
+        metrics["lookups"] += 1
+
+        entries = self._entries.get(get_route_class(request))
+        fetches = None if not entries else entries.get(self._get_identity(request))
+        expiry = None if not fetches else fetches.get(key)
+        if expiry is None:
+            return False
+
+        if expiry < monotonic():
+            fetches.pop(key, None)
+            return False
+
+        metrics["hits"] += 1
+        return True
+
+    def add(self, obj: AbstractModel, request: dict) -> None:
+        """
+        Remember that a fetch returned no results.
+
+        :param obj: :ref:`AbstractModel`
+            The concrete model being fetched.
+        :param request: dict
+            The fetch request.
+        """
+        ttl = self._ttls.get(obj.__name__, self.ttl)
+        key = self._get_key(obj, request)
+        if key is None or ttl <= 0:
+            return
+
+        entries = self._entries.setdefault(get_route_class(request), {})
+        identity = self._get_identity(request)
+        if identity not in entries and len(entries) >= self.max_size:
+            now = monotonic()
+            for expired in [
+                _identity
+                for _identity, fetches in entries.items()
+                if all(expiry < now for expiry in fetches.values())
+            ]:
+                entries.pop(expired)
+            if len(entries) >= self.max_size:
+                entries.pop(next(iter(entries)))
+
+        entries.setdefault(identity, {})[key] = monotonic() + ttl
+        self._get_metrics(obj)["stores"] += 1
+
+    def invalidate(self, request: dict) -> None:
+        """
+        Forget the missing objects that a write may have created.
+
+        :param request: dict
+            The write request.
+        """
+        entries = self._entries.get(get_route_class(request))
+        if not entries:
+            return
+
+        identity = self._get_identity(request)
+        try:
+            hash(identity)
+        except TypeError:
+            identity = ()
+        if identity:
+            self._forget(entries, [identity])
+            return
+
+        written = [
+            _identity
+            for _identity in entries
+            if _identity
+            and all(request.get(param) == value for param, value in _identity)
+        ]
+        if written:
+            self._forget(entries, written)
+        else:
+            # the API gives a new object an ID that is not known before the response.
+            self._forget(entries, list(entries))
+
+    def invalidate_route(self, route: Optional[str]) -> None:
+        """
+        Forget every missing object remembered for a route.
+
+        :param route: str
+            The route that was reloaded or written to.
+        """
+        entries = self._entries.get(get_route_class({"route": route}))
+        if entries:
+            self._forget(entries, list(entries))
+
+    def clear(self) -> None:
+        """Forget every missing object."""
+        self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the negative cache metrics of every model.
+
+        :return: Dict[str, Dict[str, int]]
+            The lookups, (negative) hits, stores, invalidations, and current entries by model name.
+        """
+        metrics = {
+            name: dict(model_metrics, entries=0)
+            for name, model_metrics in self._metrics.items()
+        }
+        for entries in self._entries.values():
+            for fetches in entries.values():
+                for key in fetches:
+                    metrics[key[0]]["entries"] += 1
+        return metrics
+
+    def _forget(self, entries: Dict[Tuple, Dict[Tuple, float]], identities) -> None:
+        for identity in identities:
+            for key in entries.pop(identity, None) or ():
+                self._metrics[key[0]]["invalidations"] += 1
+
+    def _get_metrics(self, obj: AbstractModel) -> Dict[str, int]:
+        metrics = self._metrics.get(obj.__name__)
+        if metrics is None:
+            metrics = self._metrics[obj.__name__] = {
+                "lookups": 0,
+                "hits": 0,
+                "stores": 0,
+                "invalidations": 0,
+            }
+        return metrics
+
+    @staticmethod
+    def _get_identity(request: dict) -> Tuple:
+        """The route parameters of a request (ex: (('person_id', 1),) for 'person/$person_id')."""
+        return tuple(
+            (part[1:], request.get(part[1:]))
+            for part in (request.get("route") or "").split("/")
+            if part.startswith("$")
+        )
+
+    @staticmethod
+    def _get_key(obj: AbstractModel, request: dict) -> Optional[Tuple]:
+        key = (
+            obj.__name__,
+            request.get("route"),
+            tuple(
+                sorted(
+                    (param, value)
+                    for param, value in request.items()
+                    if param not in ("route", "method", "callback_id")
+                )
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+negative_cache = NegativeCache()
@@ -1,9 +1,10 @@
+import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Dict, Iterable, Any
 
-from .. import CallBack
+from .. import CallBack, NO_TIMEOUT
 from IreneAPIWrapper.sections import outer
-from . import AbstractModel
+from . import AbstractModel, negative_cache, freshness
 from time import perf_counter
 
 
@@ -12,6 +13,8 @@ async def internal_fetch(obj: AbstractModel, request: dict) -> Optional[Abstract
 
     .. note::
         Concrete objects are added to cache on creation.
+        Fetches that return no results are remembered by the :ref:`NegativeCache` and are not sent again
+        until they expire or the object is written to.
 
     :param obj: :ref:`AbstractModel`
         An abstract model.
@@ -20,12 +23,24 @@ async def internal_fetch(obj: AbstractModel, request: dict) -> Optional[Abstract
     :return: :ref:`AbstractModel`
         Returns an abstract model.
     """
+    if negative_cache.is_missing(obj, request):
+        return None
+
     callback = await basic_call(request)
     if not callback.response.get("results"):
+        if "results" in callback.response:
+            # the API answered that the object does not exist.
+            negative_cache.add(obj, request)
         return None
-    obj = await obj.create(**callback.response.get("results"))
+    model = obj
+    tracing = outer.client.tracing
+    start = perf_counter() if tracing.active else 0
+    obj = await freshness.create(model, callback.response.get("results"))
     if isinstance(obj, list) and obj:
         obj = obj[0]
+    freshness.mark_fetched(model, [obj])
+    if tracing.active:
+        tracing.model_created(callback, model, 1 if obj else 0, perf_counter() - start)
     return obj
 
 
@@ -42,37 +57,120 @@ async def internal_fetch_all(
     :param request: dict
         The request to pass into a Callback.
     :param bulk: bool
-        Whether to generate objects in bulk (Defaults to False).
+        Whether to generate objects in bulk with the model's `create_bulk` (Defaults to False).
+        Bulk creation resolves references once for all rows instead of awaiting them row by row.
     :param log_creation: bool
         Whether to log the creation.
     :return: List[:ref:`AbstractModel`]
         Returns a list of abstract models.
     """
     callback = CallBack(request=request)
-    await outer.client.add_and_wait(callback)
+    # a whole cache may take longer than the default timeout to arrive, and is not abandoned partway.
+    await outer.client.add_and_wait(callback, NO_TIMEOUT)
+
+    # a full reload is the source of truth for the route, so nothing is known to be missing anymore.
+    negative_cache.invalidate_route(request.get("route"))
 
     results = callback.response.get("results")
     if not results:
-
         return []
 
     start = perf_counter()
+    data = []
     if not bulk:
         try:
-            data = [
-                await obj.create(**info)
-                for info in results.values()
-            ]
+            data = [await obj.create(**info) for info in results.values()]
         except Exception as e:
             outer.client.logger.debug(f"{e}")
     else:
         data = await obj.create_bulk(list(results.values()))
+    freshness.mark_fetched(obj, data)
+    if outer.client.tracing.active:
+        outer.client.tracing.model_created(
+            callback, obj, len(data), perf_counter() - start
+        )
     if outer.client.logger and log_creation:
-        outer.client.logger.info(f"Finished creating/fetching all cache for {obj.__name__} in "
-                                 f"{perf_counter() - start}s")
+        outer.client.logger.info(
+            f"Finished creating/fetching all cache for {obj.__name__} in "
+            f"{perf_counter() - start}s"
+        )
     return data
 
 
+async def internal_resolve(
+    obj: AbstractModel,
+    cache: Dict[Any, AbstractModel],
+    ids: Iterable,
+    fetch: bool = True,
+) -> Dict[Any, Optional[AbstractModel]]:
+    """
+    Resolve several ids of a concrete object at once.
+
+    Ids found in the cache are resolved with a single dictionary lookup each. Only the ids missing from cache are
+    fetched from the API, and those fetches are sent as one batch (see :ref:`internal_fetch_many`).
+
+    :param obj: :ref:`AbstractModel`
+        An abstract model.
+    :param cache: Dict[Any, :ref:`AbstractModel`]
+        The cache of the concrete object.
+    :param ids: Iterable
+        The ids to resolve. Falsy ids are ignored.
+    :param fetch: bool
+        Whether to fetch the missing ids from the API.
+    :return: Dict[Any, Optional[:ref:`AbstractModel`]]
+        The resolved objects by their id. Ids that could not be found map to None.
+    """
+    resolved = {}
+    missing = []
+    for unique_id in ids:
+        if not unique_id or unique_id in resolved:
+            continue
+        existing = cache.get(unique_id)
+        resolved[unique_id] = existing
+        if existing is None:
+            missing.append(unique_id)
+
+    if not missing or not fetch:
+        return resolved
+
+    for unique_id, fetched in (await internal_fetch_many(obj, missing)).items():
+        resolved[unique_id] = cache.get(unique_id) or fetched
+    return resolved
+
+
+async def internal_fetch_many(
+    obj: AbstractModel, ids: List, limit: Optional[int] = None
+) -> Dict[Any, Optional[AbstractModel]]:
+    """
+    Fetch several objects of a concrete model from the API at once.
+
+    The API fetches one object per request, so the fetches are queued together as one batch instead of one
+    round trip after another. The :ref:`RequestLimiter` of the client bounds how many of them wait for a response
+    at once.
+
+    :param obj: :ref:`AbstractModel`
+        An abstract model.
+    :param ids: List
+        The ids to fetch.
+    :param limit: Optional[int]
+        The maximum amount of fetches that may be pending at once. None queues them all at once.
+    :return: Dict[Any, Optional[:ref:`AbstractModel`]]
+        The fetched objects by their id. Ids that do not exist map to None.
+    """
+    if limit is None:
+        fetches = [obj.fetch(unique_id) for unique_id in ids]
+    else:
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _fetch(unique_id):
+            async with semaphore:
+                return await obj.fetch(unique_id)
+
+        fetches = [_fetch(unique_id) for unique_id in ids]
+
+    return dict(zip(ids, await asyncio.gather(*fetches)))
+
+
 async def internal_delete(obj: AbstractModel, request: dict) -> CallBack:
     """
     Delete the known instance of the concrete object from the API.
@@ -101,7 +199,22 @@ async def internal_insert(request: dict) -> CallBack:
     return await basic_call(request)
 
 
-async def basic_call(request: dict):
+async def basic_call(request: dict, timeout: Optional[float] = None):
+    """
+    Send a request to the API and wait for its response.
+
+    :param request: dict
+        The request.
+    :param timeout: Optional[float]
+        Seconds to wait for the response, or :ref:`NO_TIMEOUT` to wait as long as it takes. Defaults to the timeout of
+        the request's route.
+    :returns: :ref:`CallBack`
+    :raises: :ref:`RequestTimeout` if the response did not arrive in time.
+    """
+    if request.get("method") != "GET":
+        # writes may create objects that were previously missing.
+        negative_cache.invalidate(request)
+
     callback = CallBack(request=request)
-    await outer.client.add_and_wait(callback)
+    await outer.client.add_and_wait(callback, timeout)
     return callback
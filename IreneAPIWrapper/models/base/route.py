@@ -0,0 +1,9 @@
+def get_route_class(request: dict) -> str:
+    """
+    Get the route class of a request, which is the first segment of its route (ex: 'media' for 'media/$media_id').
+
+    :param request: dict
+        The request.
+    :returns: str
+    """
+    return (request.get("route") or "").strip("/").split("/", 1)[0]
@@ -0,0 +1,80 @@
+import asyncio
+from time import monotonic
+
+
+class TokenBucket:
+    r"""
+    An asynchronous token bucket rate limiter.
+
+    Tokens are refilled continuously at `rate` tokens per second up to `capacity`.
+    Every acquire takes tokens and waits until enough tokens are available.
+
+    Parameters
+    ----------
+    rate: float
+        The amount of tokens refilled per second.
+    capacity: float
+        The maximum amount of tokens, which is also the allowed burst. Must be at least 1.
+
+    Attributes
+    ----------
+    rate: float
+        The amount of tokens refilled per second.
+    capacity: float
+        The maximum amount of tokens, which is also the allowed burst.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("The rate of a token bucket must be positive.")
+        if capacity < 1:
+            raise ValueError("The capacity of a token bucket must be at least 1.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """The amount of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens without waiting.
+
+        :param tokens: float
+            The amount of tokens to take.
+        :returns: bool
+            Whether the tokens were taken.
+        """
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Take tokens, waiting until they are available.
+
+        :param tokens: float
+            The amount of tokens to take.
+        :raises: ValueError if more tokens than the capacity are requested, as they would never be available.
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Can not take {tokens} tokens from a bucket with a capacity of {self.capacity}."
+            )
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
@@ -0,0 +1,127 @@
+from itertools import count
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List
+from weakref import WeakValueDictionary
+
+# a single counter shared by every object, so the newest change of several objects is their highest version.
+_versions = count(1)
+
+
+class _VersionedField:
+    r"""
+    Marks an object as changed whenever an attribute is set.
+
+    Only setting is intercepted; reading the attribute still reads the instance dictionary.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set__(self, obj: "Versioned", value):
+        state = obj.__dict__
+        state[self.name] = value
+        state["_version"] = next(_versions)
+        if "_cards" in state or "_dependents" in state:
+            obj._invalidate_cards()
+
+
+class Versioned:
+    r"""
+    A mixin that gives a model a version that changes whenever the model changes.
+
+    Versions come from one counter shared by every object, so the highest version of several objects changes
+    whenever any of them change. An object gets a new version when it is created, when it is refreshed from the API,
+    and when one of the attributes listed in `_versioned_fields` is set. Methods that change an object in place
+    (ex: appending to a list) must call :ref:`bump_version`.
+
+    Rendered cards are cached with :ref:`get_cached_card`. A card is kept until the object or one of the objects the
+    card was rendered from changes, so a change to an unrelated object does not cost the card anything.
+    """
+
+    _version = 0
+    # the public attributes whose changes make a new version.
+    _versioned_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.__dict__.get("_versioned_fields", ()):
+            setattr(cls, name, _VersionedField(name))
+
+    def __init__(self, *args, **kwargs):
+        super(Versioned, self).__init__(*args, **kwargs)
+        self._version = next(_versions)
+
+    def bump_version(self) -> None:
+        """Mark the object as changed."""
+        self._version = next(_versions)
+        self._invalidate_cards()
+
+    def _invalidate_cards(self) -> None:
+        """Drop the cached cards of the object and of every object whose cards were rendered from it."""
+        state = self.__dict__
+        # the dictionary is replaced rather than cleared, so a card that was being rendered is not stored.
+        if state.get("_cards"):
+            state["_cards"] = {}
+        dependents = state.get("_dependents")
+        if dependents:
+            for dependent in list(dependents.values()):
+                if dependent.__dict__.get("_cards"):
+                    dependent._cards = {}
+
+    def _refresh_from(self, fresh):
+        """Update the object in place with a newer copy of it and mark it as changed."""
+        super(Versioned, self)._refresh_from(fresh)
+        self.bump_version()
+
+    async def get_cached_card(
+        self,
+        key: Hashable,
+        get_dependencies: Callable[[], Iterable],
+        render: Callable[[], Awaitable[List[str]]],
+    ) -> List[str]:
+        """
+        Get a rendered card from cache, rendering it again if it changed.
+
+        :param key: Hashable
+            The card options (ex: the markdown flag).
+        :param get_dependencies: Callable[[], Iterable]
+            Gets the other objects the card is rendered from. Objects that are not :ref:`Versioned` (including None)
+            are ignored.
+        :param render: Callable[[], Awaitable[List[str]]]
+            A coroutine function that renders the card.
+        :returns: List[str]
+            A copy of the card.
+        """
+        cards: Dict[Hashable, List[str]] = self.__dict__.get("_cards")
+        if cards is None:
+            cards = self._cards = {}
+
+        card_data = cards.get(key)
+        if card_data is not None:
+            return list(card_data)
+
+        for dependency in get_dependencies():
+            if isinstance(dependency, Versioned) and dependency is not self:
+                dependents = dependency.__dict__.get("_dependents")
+                if dependents is None:
+                    dependents = dependency._dependents = WeakValueDictionary()
+                dependents[id(self)] = self
+
+        card_data = await render()
+        cards[key] = card_data
+        return list(card_data)
+
+
+def get_version(*objects) -> int:
+    """
+    Get the newest version of several objects.
+
+    :param objects: Any
+        Objects that may be :ref:`Versioned`. Other objects (including None) are ignored.
+    :returns: int
+    """
+    version = 0
+    for obj in objects:
+        obj_version = getattr(obj, "_version", 0)
+        if obj_version > version:
+            version = obj_version
+    return version
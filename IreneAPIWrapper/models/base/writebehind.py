@@ -0,0 +1,300 @@
+import asyncio
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from IreneAPIWrapper.sections import outer, ContextLocal
+
+
+class WriteBehindBuffer:
+    r"""
+    Coalesces high-frequency writes per key in memory and flushes them in batches.
+
+    A write is staged under a key (ex: ('media', 5)) with a coroutine function that sends the latest state of that
+    key to the API. Staging the same key again before a flush replaces the pending write, so a counter changed a
+    hundred times between flushes only costs one request.
+
+    Pending writes are flushed every `interval` seconds, as soon as `max_keys` keys are buffered, and when
+    :ref:`IreneAPIClient` disconnects. A write that fails is staged again (unless the key was staged again in the
+    meantime) and retried on the next flush, up to `max_retries` times before it is dropped.
+
+    Parameters
+    ----------
+    interval: float
+        The maximum amount of seconds a write stays buffered.
+    max_keys: int
+        The amount of buffered keys that triggers a flush.
+    max_concurrency: int
+        The maximum amount of writes sent at the same time during a flush.
+    max_retries: int
+        The amount of times a failed write is retried before it is dropped.
+
+    Attributes
+    ----------
+    enabled: bool
+        Whether writes are buffered. Writes are sent immediately when disabled.
+    interval: float
+        The maximum amount of seconds a write stays buffered.
+    max_keys: int
+        The amount of buffered keys that triggers a flush.
+    max_concurrency: int
+        The maximum amount of writes sent at the same time during a flush.
+    max_retries: int
+        The amount of times a failed write is retried before it is dropped.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        max_keys: int = 256,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+    ):
+        self.enabled = True
+        self.interval = interval
+        self.max_keys = max_keys
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._pending: Dict[Hashable, Tuple[Callable[[], Awaitable], float]] = {}
+        # the amount of times the pending write of a key has failed.
+        self._failures: Dict[Hashable, int] = {}
+        # the latest write of a key that is being sent.
+        self._writing: Dict[Hashable, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+        # whether the periodic task is sleeping between flushes, the only time it may be cancelled.
+        self._sleeping = False
+        self._stopping = False
+        self._metrics: Dict[str, int] = {
+            "staged": 0,
+            "coalesced": 0,
+            "flushes": 0,
+            "writes": 0,
+            "failures": 0,
+            "retries": 0,
+            "dropped": 0,
+        }
+
+    async def stage(self, key: Hashable, writer: Callable[[], Awaitable]) -> None:
+        """
+        Stage a write.
+
+        :param key: Hashable
+            What is being written to. A pending write with the same key is replaced.
+        :param writer: Callable[[], Awaitable]
+            A coroutine function that sends the latest state of the key to the API.
+        """
+        if not self.enabled:
+            await writer()
+            return
+
+        self._metrics["staged"] += 1
+        existing = self._pending.get(key)
+        if existing:
+            self._metrics["coalesced"] += 1
+        else:
+            # a newly staged write starts over with its retries.
+            self._failures.pop(key, None)
+        self._pending[key] = (writer, existing[1] if existing else monotonic())
+
+        if len(self._pending) >= self.max_keys:
+            await self.flush()
+        else:
+            self._ensure_task()
+
+    async def flush(self) -> int:
+        """
+        Send every pending write.
+
+        :returns: int
+            The amount of writes sent.
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # every key is marked as being sent before any write starts, so flush_key waits for all of them.
+        # the writes are not cancelled with the flush, as their keys are no longer pending.
+        await asyncio.wait(
+            [self._write(key, staged, semaphore) for key, staged in pending.items()]
+        )
+        self._metrics["flushes"] += 1
+        self._metrics["writes"] += len(pending)
+        if self._pending:
+            # failed writes were staged again.
+            self._ensure_task()
+        return len(pending)
+
+    async def flush_key(self, key: Hashable) -> bool:
+        """
+        Send the pending write of a single key.
+
+        A write of the key that a flush is already sending is waited for first, so everything staged for the key
+        reached the API when this returns.
+
+        :param key: Hashable
+            The key to flush.
+        :returns: bool
+            Whether there was a pending write or a write being sent.
+        """
+        writing = self._writing.get(key)
+        if writing:
+            await asyncio.wait({writing})
+
+        pending = self._pending.pop(key, None)
+        if not pending:
+            return writing is not None
+
+        await self._write(key, pending, asyncio.Semaphore())
+        self._metrics["writes"] += 1
+        if self._pending:
+            self._ensure_task()
+        return True
+
+    def _write(
+        self,
+        key: Hashable,
+        staged: Tuple[Callable[[], Awaitable], float],
+        semaphore: asyncio.Semaphore,
+    ) -> asyncio.Task:
+        """
+        Start sending a write under a semaphore and mark the key as being sent.
+
+        The write is sent once the previous write of the key was sent, so the writes of a key stay in order.
+        """
+        previous = self._writing.get(key)
+
+        async def send():
+            if previous:
+                await asyncio.wait({previous})
+            async with semaphore:
+                await self._send(key, staged)
+
+        writing = self._writing[key] = asyncio.get_running_loop().create_task(send())
+        writing.add_done_callback(
+            lambda _: self._writing.pop(key)
+            if self._writing.get(key) is writing
+            else None
+        )
+        return writing
+
+    async def _send(
+        self, key: Hashable, staged: Tuple[Callable[[], Awaitable], float]
+    ) -> None:
+        """Send a write, staging it again if it fails and has retries left."""
+        try:
+            await staged[0]()
+        except Exception as e:
+            self._metrics["failures"] += 1
+            failures = self._failures.get(key, 0) + 1
+            if (
+                key in self._pending
+                or self._writing.get(key) is not asyncio.current_task()
+            ):
+                # the key was staged again (the newer write replaces this one) or discarded while sending.
+                outer.client.logger.warning(f"Buffered write for {key} failed - {e}")
+            elif failures <= self.max_retries:
+                self._failures[key] = failures
+                self._pending[key] = staged
+                self._metrics["retries"] += 1
+                outer.client.logger.warning(
+                    f"Buffered write for {key} failed, retrying ({failures}/{self.max_retries}) - {e}"
+                )
+            else:
+                self._failures.pop(key, None)
+                self._metrics["dropped"] += 1
+                outer.client.logger.error(
+                    f"Buffered write for {key} failed {failures} times and was dropped - {e}"
+                )
+        else:
+            if key not in self._pending:
+                self._failures.pop(key, None)
+
+    def is_staged(self, key: Hashable) -> bool:
+        """
+        Check if a write of a key is pending or being sent.
+
+        :param key: Hashable
+            The key to check.
+        :returns: bool
+        """
+        return key in self._pending or key in self._writing
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Drop the pending write of a key without sending it (ex: when the object was deleted).
+
+        A write of the key that is already being sent is not retried if it fails.
+
+        :param key: Hashable
+            The key to drop.
+        """
+        self._pending.pop(key, None)
+        self._failures.pop(key, None)
+        self._writing.pop(key, None)
+
+    async def stop(self) -> None:
+        """
+        Stop flushing on an interval and flush every pending write, retrying the writes that fail.
+
+        A flush that is running is waited for rather than cancelled, as its writes are no longer pending.
+        """
+        self._stopping = True
+        try:
+            task, self._task = self._task, None
+            if task and not task.done():
+                if self._sleeping:
+                    task.cancel()
+                await asyncio.wait({task})
+            if self._writing:
+                await asyncio.wait(set(self._writing.values()))
+            # every failure uses up a retry, so the pending writes are sent or dropped within the retries.
+            for _ in range(self.max_retries + 1):
+                if not self._pending:
+                    break
+                await self.flush()
+        finally:
+            self._stopping = False
+
+    @property
+    def buffered_keys(self) -> int:
+        """The amount of keys with a pending write."""
+        return len(self._pending)
+
+    @property
+    def flush_lag(self) -> float:
+        """The amount of seconds the oldest pending write has been buffered for."""
+        if not self._pending:
+            return 0.0
+        return monotonic() - min(staged_at for _, staged_at in self._pending.values())
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get the write-behind metrics.
+
+        :return: Dict[str, float]
+            The staged, coalesced, flushed, written, failed, retried, and dropped counts with the buffered keys and
+            flush lag.
+        """
+        return dict(
+            self._metrics, buffered_keys=self.buffered_keys, flush_lag=self.flush_lag
+        )
+
+    def _ensure_task(self) -> None:
+        if self._stopping or (self._task and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._pending and not self._stopping:
+            self._sleeping = True
+            try:
+                await asyncio.sleep(self.interval)
+            finally:
+                self._sleeping = False
+            await self.flush()
+
+
+write_behind = ContextLocal(WriteBehindBuffer)
+# game state is written every round, but only needs to survive a crash within a few rounds.
+game_state_writes = ContextLocal(WriteBehindBuffer, interval=15.0)
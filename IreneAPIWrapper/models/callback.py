@@ -1,6 +1,7 @@
 from random import randint
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from IreneAPIWrapper.sections import ContextDict
+from datetime import datetime
 import asyncio
 
 
@@ -33,6 +34,20 @@ class CallBack:
         The time the response from the API was received.
     _expected_result: Optional[dict]
         Used for testing expected responses from the API.
+    abandoned: bool
+        Whether the request timed out or was cancelled before a response was received.
+    connection_lost: bool
+        Whether the connection was lost before a response was received and the request will not be sent again.
+    _enqueued_at: Optional[float]
+        The :func:`time.perf_counter` time the request was added to the queue.
+    _sent_at: Optional[float]
+        The :func:`time.perf_counter` time the request was sent.
+    _received_at: Optional[float]
+        The :func:`time.perf_counter` time the response was received.
+    _trace_context: Any
+        The trace context of the task that made the request, captured when :ref:`Tracing` hooks are registered.
+    _replays: int
+        The amount of times the request was sent again after reconnecting.
     """
 
     def __init__(self, callback_type: str = "request", request: dict = None):
@@ -46,29 +61,45 @@ class CallBack:
         self.response: Optional[dict] = None  # data received from API
         self._completion_time = None
         self._expected_result = None  # used for testing.
+        self._enqueued_at: Optional[float] = None
+        self._sent_at: Optional[float] = None
+        self._received_at: Optional[float] = None
+        self._trace_context: Any = None
+        self._waiters: List[asyncio.Future] = []
+        self.abandoned = False
+        self.connection_lost = False
+        self._replays = 0
 
-    async def wait_for_completion(self, timeout: Optional[int] = None) -> bool:
+    async def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         r"""
         Waits for a response from the API.
 
-        :param timeout: Optional[int]
-            Seconds before no longer waiting for the response. (No timeout by default.)
-        :returns: True
-            Only returns when there is a response from the API.
+        :param timeout: Optional[float]
+            Seconds before no longer waiting for the response. (No timeout by default, or with :ref:`NO_TIMEOUT`.)
+        :returns: bool
+            True when there is a response from the API, or False if the timeout passed first.
         """
-        end_time = None
-        if timeout:
-            end_time = datetime.now() + timedelta(seconds=timeout)
-        while True:
-            await asyncio.sleep(0)
-
-            if self.done:
-                self._completion_time = datetime.now()
-                return True
+        if not self.done:
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            timer = (
+                loop.call_later(timeout, _expire, waiter)
+                if timeout not in (None, NO_TIMEOUT)
+                else None
+            )
+            try:
+                await waiter
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            if not self.done:
+                return False
 
-            if timeout:
-                if datetime.now() > end_time:
-                    return False
+        self._completion_time = datetime.now()
+        return True
 
     def set_as_done(self) -> None:
         """
@@ -77,6 +108,9 @@ class CallBack:
         :returns: None
         """
         self.done = True
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
 
     @staticmethod
     def _get_unused_callback_id() -> int:
@@ -91,4 +125,11 @@ class CallBack:
             return callback_id
 
 
-callbacks: Dict[int, CallBack] = dict()
+def _expire(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+callbacks: Dict[int, CallBack] = ContextDict()
+# a timeout that never expires, for requests allowed to take as long as they need (ex: preloading a whole cache).
+NO_TIMEOUT = float("inf")
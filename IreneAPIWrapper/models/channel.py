@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -13,6 +13,7 @@ from . import (
     Group,
     internal_delete,
     internal_insert,
+    freshness,
 )
 
 
@@ -54,6 +55,21 @@ class Channel(AbstractModel):
         Channel(channel_id, guild_id)
         return _channels[channel_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Channel objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Channel`]
+        """
+        channels = []
+        for _dictionary in list_of_dicts:
+            channel_id = _dictionary.get("channelid")
+            Channel(channel_id, _dictionary.get("guildid"))
+            channels.append(_channels[channel_id])
+        return channels
+
     async def delete(self) -> None:
         """
         Delete a Channel object from the database and remove it from cache.
@@ -111,10 +127,7 @@ class Channel(AbstractModel):
         :returns: Optional[:ref:`Channel`]
             The channel object requested.
         """
-        existing = _channels.get(channel_id)
-        if not existing and fetch:
-            return await Channel.fetch(channel_id)
-        return existing
+        return await freshness.get(Channel, _channels, channel_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -154,8 +167,8 @@ class Channel(AbstractModel):
         .. NOTE:: Channel objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Channel, request={"route": "channel", "method": "GET"}
+            obj=Channel, request={"route": "channel", "method": "GET"}, bulk=True
         )
 
 
-_channels: Dict[int, Channel] = dict()
+_channels: Dict[int, Channel] = ContextDict()
@@ -2,10 +2,13 @@ import logging
 
 import aiohttp
 import asyncio
-from IreneAPIWrapper.exceptions import InvalidToken, APIError
-from IreneAPIWrapper.sections import outer as ref_outer_client
-from typing import Union, Optional
-from IreneAPIWrapper.models import CallBack, callbacks, Preload, basic_call
+from collections import deque
+from json import dumps
+from IreneAPIWrapper.exceptions import InvalidToken, APIError, RequestTimeout, ConnectionLost
+from IreneAPIWrapper.sections import Context, get_context, use_context
+from typing import Deque, Dict, Iterable, Set, Union, Optional
+from IreneAPIWrapper.models import CallBack, callbacks, Preload, basic_call, write_behind, \
+    game_state_writes, ClientMetrics, Tracing, RequestLimiter, ReconnectPolicy
 
 
 class IreneAPIClient:
@@ -13,9 +16,9 @@ class IreneAPIClient:
     Asynchronous IreneAPI Client connected by a websocket.
 
     .. Warning::
-        It is suggested to only create ONE client per application. The wrapper externally
-        references the latest client created. If it is several clients that are routing to the same API,
-        then it is okay as the same requests will be sent; otherwise, it can lead to conflicts between databases.
+        A :ref:`Context` holds one client, and the models use the client of the current context. Creating a
+        client without a context replaces the client of the current context, so give every client its own
+        :ref:`Context` (and run code using it inside :func:`use_context`) to use several clients at once.
 
     Parameters
     ----------
@@ -29,6 +32,23 @@ class IreneAPIClient:
         Whether to go into test/dev mode. Does not currently have a significant difference.
     reconnect: bool
         Whether to reconnect to the API if a connection is severed.
+    limiter: Optional[:ref:`RequestLimiter`]
+        Limits the rate of requests per route class and the amount of requests waiting for a response.
+        Defaults to a :ref:`RequestLimiter` without rate limits and with an adaptive concurrency limit.
+    default_timeout: float
+        Seconds to wait for a response before raising :ref:`RequestTimeout`. Defaults to 30 seconds. Requests that
+        may take longer (ex: preloading a whole cache) wait with :ref:`NO_TIMEOUT` instead.
+    timeouts: Optional[Dict[str, float]]
+        Timeouts by route (ex: 'media/') or route class (ex: 'media') that replace the default timeout.
+    reconnect_policy: Optional[:ref:`ReconnectPolicy`]
+        The backoff between reconnect attempts and which requests are sent again after reconnecting.
+        Defaults to a :ref:`ReconnectPolicy` with its default values.
+    context: Optional[:ref:`Context`]
+        The context that holds the client and the model caches. Defaults to the current context.
+        Give every client its own context to use several clients at once.
+    capabilities: Optional[Iterable[str]]
+        Optional request formats that were negotiated with the API (ex: 'gg_filter_diff'). Requests only use a
+        format listed here, and fall back to the format every API version accepts otherwise.
 
     Attributes
     ----------
@@ -48,8 +68,29 @@ class IreneAPIClient:
         The origin meant for CORS to not return a bad request.
     logger: logging.Logger
         A logging object for messages to be sent to.
+    metrics: :ref:`ClientMetrics`
+        The request counts, errors, sizes, and latencies by route.
+    tracing: :ref:`Tracing`
+        The hooks called for every request.
+    limiter: :ref:`RequestLimiter`
+        The rate and concurrency limits of requests. :ref:`RequestLimiter.snapshot` has their current values.
+    default_timeout: float
+        Seconds to wait for a response before raising :ref:`RequestTimeout`. :ref:`NO_TIMEOUT` waits forever.
+    timeouts: Dict[str, float]
+        Timeouts by route or route class that replace the default timeout.
+    reconnect_policy: :ref:`ReconnectPolicy`
+        The backoff between reconnect attempts and which requests are sent again after reconnecting.
+    context: :ref:`Context`
+        The context that holds the client and the model caches. Model methods use the client of the current
+        context, so code using this client (other than its own methods) should run inside
+        :func:`use_context` of this context.
+    capabilities: Set[str]
+        Optional request formats that were negotiated with the API.
     """
 
+    # the amount of abandoned request IDs remembered to drop their late responses.
+    _MAX_ABANDONED = 4096
+
     def __init__(
             self,
             token: str,
@@ -62,11 +103,18 @@ class IreneAPIClient:
             verbose=False,
             origin="localhost",
             logger: logging.Logger = None,
+            limiter: RequestLimiter = None,
+            default_timeout: float = 30.0,
+            timeouts: Dict[str, float] = None,
+            reconnect_policy: ReconnectPolicy = None,
+            context: Context = None,
+            capabilities: Iterable[str] = None,
     ):
-        ref_outer_client.client = self  # set our referenced client.
+        self.context = context or get_context()
+        self.context.client = self  # set our referenced client.
         self._ws_client: Optional[aiohttp.ClientSession] = None
 
-        self.connected = False
+        self._connected = False
 
         self._headers = {"Authorization": f"Bearer {token}", "Origin": origin}
 
@@ -80,6 +128,21 @@ class IreneAPIClient:
         else:
             self._ws_url = f"https://{self._base_url}/ws"
         self._queue = asyncio.Queue()
+        self.metrics = ClientMetrics(self._queue.qsize)
+        self.tracing = Tracing()
+        self.limiter = limiter or RequestLimiter()
+        # requests sent without a response yet, oldest first.
+        self._in_flight: Dict[int, CallBack] = {}
+        self.default_timeout = default_timeout
+        self.timeouts: Dict[str, float] = dict(timeouts or {})
+        # IDs of sent requests that were abandoned, so their late responses are dropped quietly.
+        self._abandoned: Dict[int, None] = {}
+        self.reconnect_policy = reconnect_policy or ReconnectPolicy()
+        self.capabilities: Set[str] = set(capabilities or [])
+        # requests that were in flight when the connection was lost, sent first on the next connection.
+        self._replay: Deque[CallBack] = deque()
+        # whether the connection loop ended, so nothing sends queued requests anymore.
+        self._stopped = False
         # asyncio.run_coroutine_threadsafe(self.connect, loop)
 
         self._disconnect = dict({"disconnect": True})
@@ -89,13 +152,90 @@ class IreneAPIClient:
         self.in_testing = test
         self.reconnect = reconnect
         self.logger: Logger = Logger(verbose=verbose, logger=logger)
-        self.__futures: list = []
+        # events are created on first use so that they belong to the running loop.
+        self._connected_event: Optional[asyncio.Event] = None
+        self._ready_events: Dict[type, asyncio.Event] = {}
+
+    @property
+    def connected(self) -> bool:
+        """If there is a stable websocket connection to the API."""
+        return self._connected
+
+    @connected.setter
+    def connected(self, value: bool):
+        self._connected = value
+        if self._connected_event:
+            self._connected_event.set() if value else self._connected_event.clear()
+
+    def supports(self, capability: str) -> bool:
+        """
+        Check if an optional request format was negotiated with the API.
+
+        :param capability: str
+            The name of the format (ex: 'gg_filter_diff').
+        :returns: bool
+        """
+        return capability in self.capabilities
 
     @property
     def is_preloaded(self):
         """Check if the client is preloaded with cache."""
-        # if there are any futures not done, return False
-        return not any([not future.done() for future in self.__futures])
+        return all(self.is_ready(model) for model in self._get_preloaded_models())
+
+    def is_ready(self, model) -> bool:
+        """
+        Check if a model can be used from cache.
+
+        :param model: :ref:`AbstractModel`
+            The concrete model.
+        :returns: bool
+            Whether the cache of the model finished preloading. Models that are not preloaded are ready once the
+            client is connected, since they are fetched when needed.
+        """
+        if model not in self._get_preloaded_models():
+            return self.connected
+        return self._get_ready_event(model).is_set()
+
+    async def wait_until_connected(self):
+        """Wait until there is a websocket connection to the API."""
+        await self._get_connected_event().wait()
+
+    async def ready(self, *models):
+        """
+        Wait until the cache of models is preloaded.
+
+        Commands that only need a few models can start serving while other models are still loading.
+        A model whose preload failed is still considered ready (the failure is logged), as its objects are fetched
+        when needed. Models that are not preloaded are ready once the client is connected.
+
+        :param models: :ref:`AbstractModel`
+            The concrete models to wait for.
+        """
+        await self.wait_until_connected()
+        preloaded = self._get_preloaded_models()
+        for model in models:
+            if model in preloaded:
+                await self._get_ready_event(model).wait()
+
+    async def ready_all(self):
+        """Wait until the cache of every preloaded model is loaded."""
+        await self.ready(*self._get_preloaded_models())
+
+    def _get_preloaded_models(self):
+        return [model for model, load_cache in self._preload_cache.get_evaluation().items() if load_cache]
+
+    def _get_connected_event(self) -> asyncio.Event:
+        if self._connected_event is None:
+            self._connected_event = asyncio.Event()
+            if self.connected:
+                self._connected_event.set()
+        return self._connected_event
+
+    def _get_ready_event(self, model) -> asyncio.Event:
+        event = self._ready_events.get(model)
+        if event is None:
+            event = self._ready_events[model] = asyncio.Event()
+        return event
 
     async def add_to_queue(self, callback: CallBack):
         """
@@ -103,29 +243,104 @@ class IreneAPIClient:
 
         :param callback: :ref:`CallBack` The request to send to the server.
         """
+        if self._stopped:
+            # the request would wait forever, so its caller raises :ref:`ConnectionLost` instead.
+            self._fail_connection_lost(callback)
+            return
+        self.metrics.record_enqueued(callback)
+        if self.tracing.active:
+            self.tracing.request_enqueued(callback)
         await self._queue.put(callback)
 
-    async def add_and_wait(self, callback: CallBack):
+    def get_timeout(self, request: dict) -> float:
+        """
+        Get the default timeout of a request.
+
+        :param request: dict
+            The request.
+        :returns: float
+            The timeout of the request's route, else of its route class, else the client's default timeout.
+        """
+        timeout = self.timeouts.get(request.get("route") or "")
+        if timeout is None:
+            timeout = self.timeouts.get(self.limiter.get_class(request))
+        return self.default_timeout if timeout is None else timeout
+
+    async def add_and_wait(self, callback: CallBack, timeout: Optional[float] = None):
         """
         Add a callback to the queue and wait for it to complete.
 
+        If the response does not arrive in time or the caller is cancelled, the request is abandoned: it is not sent
+        if it is still queued, and its response is dropped if it arrives later.
+
         :param callback: The callback to add to the queue and wait for.
+        :param timeout: Optional[float]
+            Seconds to wait for the response, or :ref:`NO_TIMEOUT` to wait as long as it takes.
+            Defaults to the timeout of the request's route (see :ref:`get_timeout`).
+        :raises: :ref:`RequestTimeout` if the response did not arrive in time.
+        :raises: :ref:`ConnectionLost` if the connection was lost and the request could not be sent again.
         """
-        await self.add_to_queue(callback)
-        await callback.wait_for_completion()
-        if callback.response is None:
-            raise APIError(callback, detailed_report=True, error_msg="No Response was received.")
-        if callback.response.get("error"):
-            raise APIError(callback, error_msg=callback.response.get("error"))
+        if timeout is None:
+            timeout = self.get_timeout(callback.request)
 
+        await self.add_to_queue(callback)
+        try:
+            completed = await callback.wait_for_completion(timeout)
+        except asyncio.CancelledError:
+            self._abandon(callback, "cancelled")
+            raise
+        if not completed:
+            self._abandon(callback, "timeout")
+            self.metrics.record_error(callback, timeout=True)
+            raise RequestTimeout(callback, timeout)
+
+        callbacks.pop(callback.id, None)
+        if callback.connection_lost:
+            raise ConnectionLost(callback)
         try:
-            if callback.response.get("results"):
-                error = callback.response["results"][
-                    "error"
-                ]  # forcing a KeyError/TypeError (if raised, is a success)
-                raise APIError(callback, error_msg=error)
-        except (KeyError, TypeError):
-            pass
+            if callback.response is None:
+                raise APIError(callback, detailed_report=True, error_msg="No Response was received.")
+            if callback.response.get("error"):
+                raise APIError(callback, error_msg=callback.response.get("error"))
+
+            try:
+                if callback.response.get("results"):
+                    error = callback.response["results"][
+                        "error"
+                    ]  # forcing a KeyError/TypeError (if raised, is a success)
+                    raise APIError(callback, error_msg=error)
+            except (KeyError, TypeError):
+                pass
+        except APIError:
+            self.metrics.record_error(callback)
+            raise
+
+    def _abandon(self, callback: CallBack, reason: str) -> None:
+        """
+        Stop waiting for a request, freeing everything it holds.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        :param reason: str
+            'timeout' or 'cancelled'.
+        """
+        if callback.done or callback.abandoned:
+            return
+
+        callback.abandoned = True
+        callbacks.pop(callback.id, None)
+        if self._in_flight.pop(callback.id, None) is not None:
+            self._abandoned[callback.id] = None
+            if len(self._abandoned) > self._MAX_ABANDONED:
+                self._abandoned.pop(next(iter(self._abandoned)))
+            self.metrics.record_abandoned(callback)
+            # a timeout is a sign of an overloaded API, but a cancelled caller is not.
+            if reason == "timeout":
+                self.limiter.release(callback, failed=True)
+            else:
+                self.limiter.forget(callback)
+        if self.tracing.active:
+            self.tracing.request_abandoned(callback, reason)
 
     async def __load_up_cache(self):
         """
@@ -135,42 +350,107 @@ class IreneAPIClient:
         """
         loop = asyncio.get_event_loop()
         evaluation = self._preload_cache.get_evaluation()
-        self.__futures = []
 
         for category_class, load_cache in dict(sorted(evaluation.items(),
                                                       key=lambda model: model[0].priority())).items():
-            try:
-                if load_cache:
-                    if self._preload_cache.force:
-                        await category_class.fetch_all()
-                    else:
-                        self.__futures.append(asyncio.run_coroutine_threadsafe(
-                            category_class.fetch_all(), loop
-                        ))
-            except APIError as e:
-                self.logger.warning(msg=f"Cache for {category_class.__name__} did not load. - {e}")
-            except Exception as e:
-                raise e
+            if load_cache:
+                if self._preload_cache.force:
+                    await self.__preload(category_class)
+                else:
+                    asyncio.run_coroutine_threadsafe(self.__preload(category_class), loop)
+
+    async def __preload(self, category_class):
+        """
+        Preload the cache of a model and mark it as ready.
+
+        .. NOTE::: The model is marked as ready even if it did not load, so that nothing waits on it forever.
+        """
+        try:
+            await category_class.fetch_all()
+        except APIError as e:
+            self.logger.warning(msg=f"Cache for {category_class.__name__} did not load. - {e}")
+        finally:
+            self._get_ready_event(category_class).set()
 
     async def connect(self):
         """
-        Connect to the API via a websocket indefinitely.
+        Connect to the API via a websocket until the client disconnects.
+
+        When the connection is lost, the client reconnects after the backoff of its :ref:`ReconnectPolicy`.
+        Requests that were waiting for a response are sent again on the new connection if they are idempotent, and
+        fail with :ref:`ConnectionLost` otherwise.
+
+        :raises: :ref:`InvalidToken` if the API did not accept the token.
         """
-        while True:
-            try:
-                await self._connect()
-            except ConnectionResetError:
-                if self.connected:
-                    self.logger.error("Connection to IreneAPI Dropped.")
+        # the preload and the tasks of the connection use the caches of the client's context.
+        with use_context(self.context):
+            await self._connect_until_disconnected()
+
+    async def _connect_until_disconnected(self):
+        attempt = 0
+        self._stopped = False
+        try:
+            while True:
+                try:
+                    await self._connect()
+                    break  # the client disconnected.
+                except ConnectionResetError:
+                    if self.connected:
+                        self.logger.error("Connection to IreneAPI Dropped.")
+                        self.connected = False
+                        attempt = 0
+                except InvalidToken:
+                    raise
+                except Exception as e:
+                    self.logger.error(f"API Connection Dropped: {e}")
                     self.connected = False
-                if self.reconnect:
-                    self.logger.info("Attempting to reconnect to IreneAPI.")
-                    continue
-                else:
+
+                if not self.reconnect:
                     break
-            except Exception as e:
-                self.logger.error(f"API Connection Dropped: {e}")
-        self.connected = False
+
+                delay = self.reconnect_policy.get_delay(attempt)
+                attempt += 1
+                self.metrics.reconnect_attempts += 1
+                self.logger.info(f"Attempting to reconnect to IreneAPI in {delay:.2f} seconds.")
+                await asyncio.sleep(delay)
+        finally:
+            self.connected = False
+            self._stopped = True
+            # nothing will send the journaled and queued requests anymore.
+            while self._replay:
+                self._fail_connection_lost(self._replay.popleft())
+            while not self._queue.empty():
+                self._fail_connection_lost(self._queue.get_nowait())
+
+    def _journal_in_flight(self) -> None:
+        """
+        Handle the requests that were waiting for a response when the connection was lost.
+
+        Idempotent requests are journaled to be sent first on the next connection. The others fail with
+        :ref:`ConnectionLost`, since the API may or may not have applied them.
+        """
+        in_flight, self._in_flight = self._in_flight, {}
+        self.limiter.clear()
+        self.metrics.record_disconnected()
+        policy = self.reconnect_policy
+        for callback in in_flight.values():
+            if callback.done or callback.abandoned:
+                continue
+            if policy.can_replay(callback.request) and callback._replays < policy.max_replays:
+                callback._replays += 1
+                self._replay.append(callback)
+            else:
+                self._fail_connection_lost(callback)
+
+    def _fail_connection_lost(self, callback: CallBack) -> None:
+        """Complete a request that will not get a response, so its caller raises :ref:`ConnectionLost`."""
+        if callback.done or callback.abandoned:
+            return
+        callback.connection_lost = True
+        self.metrics.lost_requests += 1
+        if self.tracing.active:
+            self.tracing.request_abandoned(callback, "connection_lost")
+        callback.set_as_done()
 
     async def _connect(self):
         """
@@ -188,6 +468,7 @@ class IreneAPIClient:
                     timeout=60,
             ) as ws:
                 self.connected = True
+                self.metrics.record_connected()
                 self.logger.debug("Connected to IreneAPI.")
 
                 if self._preload_cache.force:
@@ -195,58 +476,24 @@ class IreneAPIClient:
                 else:
                     await self.__load_up_cache()
 
-                no_found_instance = f"Could not find CallBack instance"
-                while True:
-                    # test cases
-                    if self.in_testing and self._queue.empty():
-                        # pass if the api is using a debugger so the session does not close.
-                        # pass
-                        await self._ws_client.close()
-                        return  # close out of the session.
-
-                    # wait for a request.
-                    callback: CallBack = await self._queue.get()
-
-                    if callback.type == "disconnect":
-                        await self._ws_client.close()
-                        return  # close out of the session.
-
-                    # make client request.
-                    await ws.send_json(callback.request)
-
-                    # get response from server.
-                    # in case of any inconsistencies, a callback id is sent back and forth and is checked for
-                    # authenticity before completing a request.
-                    _data = await ws.receive()
-                    if _data is None:
-                        self.logger.warning(
-                            no_found_instance + ": Received data was NoneType."
-                        )
-                        continue
-                    elif isinstance(_data, aiohttp.WSMessage) and _data.type == aiohttp.WSMsgType.CLOSE:
-                        self.logger.warning(
-                            f"Received WSMsgType.Close"
-                        )
-                        continue
-
-                    data_response = _data.json()
-
-                    response_callback_id = int(data_response.get("callback_id") or 0)
-                    if response_callback_id and (response_callback_id != callback.id):
-                        # we replace the current callback with the response
-                        callback = callbacks.get(response_callback_id)
-
-                    if callback:
-                        # we shouldn't be receiving a response without a callback name, but if we do
-                        # then we will take care of it as if it is for the same request.
-                        callback.response = data_response
-                        # A method should already have the CallBack object,
-                        # so we can now finish the callback and lease out the callback name to a new object.
-                        callback.set_as_done()
-                    else:
-                        self.logger.warning(f"{no_found_instance}: {data_response}")
-        except aiohttp.WSServerHandshakeError:
-            raise InvalidToken
+                # requests are sent and responses are received by separate tasks, so several requests can wait
+                # for a response at once (as many as the limiter allows).
+                loop = asyncio.get_running_loop()
+                sender = loop.create_task(self._send_requests(ws))
+                receiver = loop.create_task(self._receive_responses(ws))
+                try:
+                    done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for task in (sender, receiver):
+                        task.cancel()
+                    await asyncio.gather(sender, receiver, return_exceptions=True)
+                    self._journal_in_flight()
+                for task in done:
+                    task.result()  # raise the error that ended the connection, if any.
+        except aiohttp.WSServerHandshakeError as e:
+            if e.status in (401, 403):
+                raise InvalidToken
+            raise ConnectionResetError
         except (ConnectionResetError, aiohttp.ClientConnectorError):
             raise ConnectionResetError
         except KeyboardInterrupt:
@@ -255,14 +502,117 @@ class IreneAPIClient:
             self.logger.error(f"API Connection Dropped - {e}")
             raise ConnectionResetError
 
+    async def _send_requests(self, ws: aiohttp.ClientWebSocketResponse):
+        """
+        Send queued requests as the limiter allows until the client disconnects.
+        """
+        while True:
+            # test cases
+            if self.in_testing and self._queue.empty() and not self._replay:
+                await self.limiter.concurrency.wait_idle()
+                if self._queue.empty() and not self._replay:
+                    # pass if the api is using a debugger so the session does not close.
+                    # pass
+                    await self._ws_client.close()
+                    return  # close out of the session.
+
+            # requests journaled when the last connection was lost go first, then wait for a request.
+            if self._replay:
+                callback: CallBack = self._replay.popleft()
+            else:
+                callback: CallBack = await self._queue.get()
+
+            if callback.type == "disconnect":
+                await self._ws_client.close()
+                return  # close out of the session.
+
+            if callback.abandoned:
+                continue  # the caller stopped waiting before it was sent.
+
+            await self.limiter.acquire(callback)
+            if callback.abandoned:
+                self.limiter.forget(callback)
+                continue
+            self._in_flight[callback.id] = callback
+
+            # make client request.
+            payload = dumps(callback.request)
+            await ws.send_str(payload)
+            size = _get_size(payload)
+            self.metrics.record_sent(callback, size)
+            if callback._replays:
+                self.metrics.replayed_requests += 1
+            if self.tracing.active:
+                self.tracing.request_sent(callback, size)
+
+    async def _receive_responses(self, ws: aiohttp.ClientWebSocketResponse):
+        """
+        Complete the requests that responses are received for until the connection closes.
+        """
+        no_found_instance = f"Could not find CallBack instance"
+        while True:
+            # get response from server.
+            # in case of any inconsistencies, a callback id is sent back and forth and is checked for
+            # authenticity before completing a request.
+            _data = await ws.receive()
+            if _data is None:
+                self.logger.warning(
+                    no_found_instance + ": Received data was NoneType."
+                )
+                continue
+            elif _data.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED,
+                                aiohttp.WSMsgType.ERROR):
+                self.logger.warning(
+                    f"Received {_data.type}"
+                )
+                raise ConnectionResetError
+
+            data_response = _data.json()
+
+            response_callback_id = int(data_response.get("callback_id") or 0)
+            if response_callback_id in self._abandoned:
+                self._abandoned.pop(response_callback_id)
+                self.metrics.late_responses += 1
+                continue
+
+            if response_callback_id:
+                callback = self._in_flight.pop(response_callback_id, None) or callbacks.get(response_callback_id)
+            elif self._in_flight:
+                # we shouldn't be receiving a response without a callback name, but if we do
+                # then we will take care of it as if it is for the oldest request.
+                callback = self._in_flight.pop(next(iter(self._in_flight)))
+            else:
+                callback = None
+
+            if callback:
+                callback.response = data_response
+                size = _get_size(_data.data)
+                self.metrics.record_response(callback, size)
+                if self.tracing.active:
+                    self.tracing.response_received(callback, size)
+                self.limiter.release(callback, failed=bool(data_response.get("error")))
+                # A method should already have the CallBack object,
+                # so we can now finish the callback and lease out the callback name to a new object.
+                callback.set_as_done()
+            else:
+                self.logger.warning(f"{no_found_instance}: {data_response}")
+
     async def disconnect(self):
         """
         Disconnect from the current websocket connection.
+
+        Writes pending in the :ref:`WriteBehindBuffer` objects are flushed before disconnecting, even if the
+        connection is already closed (they are sent if the client reconnects).
         """
+        with use_context(self.context):
+            await write_behind.stop()
+            await game_state_writes.stop()
+
         if not self._ws_client or self._ws_client.closed:
             return
         else:
-            callback = CallBack(callback_type="disconnect", request=self._disconnect)
+            with use_context(self.context):
+                callback = CallBack(callback_type="disconnect", request=self._disconnect)
             await self.add_to_queue(callback)
 
     async def update_commands(self, commands):
@@ -288,13 +638,14 @@ class IreneAPIClient:
                 ...
             }
         """
-        await basic_call(
-            request={
-                "route": "bot/commands",
-                "commands": commands,
-                "method": "PUT",
-            }
-        )
+        with use_context(self.context):
+            await basic_call(
+                request={
+                    "route": "bot/commands",
+                    "commands": commands,
+                    "method": "PUT",
+                }
+            )
 
 
 class Logger:
@@ -343,3 +694,8 @@ class Logger:
     def print(self, msg):
         if self.verbose:
             print(msg)
+
+
+def _get_size(data: Union[str, bytes]) -> int:
+    """Get the size of a websocket frame in bytes."""
+    return len(data.encode()) if isinstance(data, str) else len(data)
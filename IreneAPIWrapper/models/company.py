@@ -1,22 +1,24 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     MediaSource,
     internal_delete,
     internal_insert,
-    convert_to_date
+    convert_to_date,
+    freshness,
 )
 
 from datetime import date, datetime
 
 
-class Company(AbstractModel):
+class Company(Versioned, AbstractModel):
     r"""Represents the business/company that exists for several entities.
 
     A Company object inherits from :ref:`AbstractModel`.
@@ -48,7 +50,11 @@ class Company(AbstractModel):
         The Date object that involves the retirement of the company.
     """
 
-    def __init__(self, company_id, name, description, start_date, end_date, *args, **kwargs):
+    _versioned_fields = ("name",)
+
+    def __init__(
+        self, company_id, name, description, start_date, end_date, *args, **kwargs
+    ):
         super(Company, self).__init__(company_id)
         self.name = name
         self.description = description
@@ -85,6 +91,27 @@ class Company(AbstractModel):
         Company(company_id, name, description, start_date_obj, end_date_obj)
         return _companies[company_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Company objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Company`]
+        """
+        companies = []
+        for _dictionary in list_of_dicts:
+            company_id = _dictionary.get("companyid")
+            Company(
+                company_id,
+                _dictionary.get("name"),
+                _dictionary.get("description"),
+                convert_to_date(_dictionary.get("startdate")),
+                convert_to_date(_dictionary.get("enddate")),
+            )
+            companies.append(_companies[company_id])
+        return companies
+
     async def delete(self):
         """Delete the Company object from the database and remove it from cache."""
         await internal_delete(
@@ -102,7 +129,9 @@ class Company(AbstractModel):
         _companies.pop(self.id)
 
     @staticmethod
-    async def insert(company_name, description, start_date: date, end_date: date) -> None:
+    async def insert(
+        company_name, description, start_date: date, end_date: date
+    ) -> None:
         """
         Insert a new company into the database.
 
@@ -138,10 +167,7 @@ class Company(AbstractModel):
         :returns: Optional[:ref:`Company`]
             The company object requested.
         """
-        existing = _companies.get(company_id)
-        if not existing and fetch:
-            return await Company.fetch(company_id)
-        return existing
+        return await freshness.get(Company, _companies, company_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -183,8 +209,8 @@ class Company(AbstractModel):
         .. NOTE::: Company objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Company, request={"route": "company/", "method": "GET"}
+            obj=Company, request={"route": "company/", "method": "GET"}, bulk=True
         )
 
 
-_companies: Dict[int, Company] = dict()
+_companies: Dict[int, Company] = ContextDict()
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, Optional
 
 
 class Difficulty:
@@ -49,3 +49,27 @@ def get_difficulty(difficulty: Union[int, str]) -> Difficulty:
     for obj in _diff.values():
         if obj.name.lower() == difficulty.lower():
             return obj
+
+
+# the ratio of correct guesses at which media stops being the next harder difficulty.
+EASY_RATIO = 0.7
+MEDIUM_RATIO = 0.4
+
+
+def get_difficulty_from_ratio(ratio: Optional[float]) -> Difficulty:
+    """
+    Get the difficulty band of a ratio of correct guesses.
+
+    Media without enough guesses to have a ratio is considered :ref:`MEDIUM`.
+
+    :param ratio: Optional[float]
+        The ratio of correct guesses from 0 to 1.
+    :return: :ref:`Difficulty`
+    """
+    if ratio is None:
+        return MEDIUM
+    if ratio >= EASY_RATIO:
+        return EASY
+    if ratio >= MEDIUM_RATIO:
+        return MEDIUM
+    return HARD
@@ -1,19 +1,21 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     MediaSource,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
-class Display(AbstractModel):
+class Display(Versioned, AbstractModel):
     r"""Represents the images involved with an entity's profile such as an avatar or banner.
 
     A Display object inherits from :ref:`AbstractModel`.
@@ -38,6 +40,8 @@ class Display(AbstractModel):
 
     """
 
+    _versioned_fields = ("avatar", "banner")
+
     def __init__(
         self, display_id, avatar: MediaSource, banner: MediaSource, *args, **kwargs
     ):
@@ -72,6 +76,25 @@ class Display(AbstractModel):
         Display(display_id, avatar, banner)
         return _displays[display_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Display objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Display`]
+        """
+        displays = []
+        for _dictionary in list_of_dicts:
+            display_id = _dictionary.get("displayid")
+            Display(
+                display_id,
+                MediaSource(_dictionary.get("avatar")),
+                MediaSource(_dictionary.get("banner")),
+            )
+            displays.append(_displays[display_id])
+        return displays
+
     async def delete(self) -> None:
         """Delete the Display object from the database and remove it from cache."""
         await internal_delete(
@@ -123,10 +146,7 @@ class Display(AbstractModel):
         if not display_id:
             return
 
-        existing = _displays.get(display_id)
-        if not existing:
-            return await Display.fetch(display_id)
-        return existing
+        return await freshness.get(Display, _displays, display_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -165,8 +185,8 @@ class Display(AbstractModel):
         .. NOTE::: Display objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Display, request={"route": "display/", "method": "GET"}
+            obj=Display, request={"route": "display/", "method": "GET"}, bulk=True
         )
 
 
-_displays: Dict[int, Display] = dict()
+_displays: Dict[int, Display] = ContextDict()
@@ -1,4 +1,5 @@
 from typing import Union, List, Optional, Dict
+from IreneAPIWrapper.sections import ContextDict
 
 from . import (
     AbstractModel,
@@ -6,6 +7,7 @@ from . import (
     internal_fetch_all,
     internal_delete,
     internal_insert,
+    freshness,
 )
 from random import choice
 
@@ -56,6 +58,21 @@ class EightBallResponse(AbstractModel):
         EightBallResponse(response_id, response)
         return _responses[response_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create EightBallResponse objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`EightBallResponse`]
+        """
+        responses = []
+        for _dictionary in list_of_dicts:
+            response_id = _dictionary.get("responseid")
+            EightBallResponse(response_id, _dictionary.get("response"))
+            responses.append(_responses[response_id])
+        return responses
+
     async def delete(self) -> None:
         """
         Delete the Response object from the database and remove it from cache.
@@ -108,10 +125,7 @@ class EightBallResponse(AbstractModel):
         :returns: Optional[:ref:`EightBallResponse`]
             The EightBallResponse object requested.
         """
-        existing = _responses.get(response_id)
-        if not existing and fetch:
-            return await EightBallResponse.fetch(response_id)
-        return existing
+        return await freshness.get(EightBallResponse, _responses, response_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -164,8 +178,10 @@ class EightBallResponse(AbstractModel):
         .. NOTE:: EightBallResponse objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=EightBallResponse, request={"route": "8ball", "method": "GET"}
+            obj=EightBallResponse,
+            request={"route": "8ball", "method": "GET"},
+            bulk=True,
         )
 
 
-_responses: Dict[int, EightBallResponse] = dict()
+_responses: Dict[int, EightBallResponse] = ContextDict()
@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -10,6 +10,7 @@ from . import (
     MediaSource,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
@@ -52,6 +53,21 @@ class Fandom(AbstractModel):
         Fandom(int(group_id), fandom_name)
         return _fandoms[int(group_id)]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Fandom objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Fandom`]
+        """
+        fandoms = []
+        for _dictionary in list_of_dicts:
+            group_id = int(_dictionary.get("groupid"))
+            Fandom(group_id, _dictionary.get("name"))
+            fandoms.append(_fandoms[group_id])
+        return fandoms
+
     async def delete(self) -> None:
         """
         Delete the Fandom object from the database and remove it from cache.
@@ -108,10 +124,7 @@ class Fandom(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`Fandom`
         """
-        existing = _fandoms.get(group_id)
-        if not existing:
-            return await Fandom.fetch(group_id)
-        return existing
+        return await freshness.get(Fandom, _fandoms, group_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -149,8 +162,8 @@ class Fandom(AbstractModel):
         .. NOTE::: Fandom objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Fandom, request={"route": "fandom/", "method": "GET"}
+            obj=Fandom, request={"route": "fandom/", "method": "GET"}, bulk=True
         )
 
 
-_fandoms: Dict[int, Fandom] = dict()
+_fandoms: Dict[int, Fandom] = ContextDict()
@@ -1,11 +1,13 @@
+import asyncio
 from typing import Union, List, Optional, Dict, TYPE_CHECKING
 from datetime import datetime, date
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     MediaSource,
@@ -15,14 +17,17 @@ from . import (
     Tag,
     internal_delete,
     internal_insert,
-    convert_to_date
+    internal_resolve,
+    ModelSet,
+    convert_to_date,
+    freshness,
 )
 
 if TYPE_CHECKING:
     from . import Affiliation, GroupAlias
 
 
-class Group(AbstractModel):
+class Group(Versioned, AbstractModel):
     r"""Represents a Group object.
 
     A Group object inherits from :ref:`AbstractModel`.
@@ -76,14 +81,26 @@ class Group(AbstractModel):
         The tags that affiliated with the group.
     aliases: List[:ref:`GroupAlias`]
         Aliases of the group.
-    affiliations: List[:ref:`Affiliation`]
-        All affiliations that are associated with the Group.
+    affiliations: :ref:`ModelSet`
+        An insertion-ordered set of all affiliations that are associated with the Group.
     debut_date: date
         The creation date of the group.
     disband_date: date
         The disbandment date of the group.
     """
 
+    _versioned_fields = (
+        "name",
+        "description",
+        "company",
+        "display",
+        "website",
+        "social",
+        "tags",
+        "aliases",
+        "affiliations",
+    )
+
     def __init__(
         self,
         group_id,
@@ -97,7 +114,7 @@ class Group(AbstractModel):
         tags,
         aliases,
         debut_date,
-        disband_date
+        disband_date,
     ):
         super(Group, self).__init__(group_id)
         self.name: str = name
@@ -109,7 +126,7 @@ class Group(AbstractModel):
         self.media_count: int = media_count or 0
         self.tags: List[Tag] = tags
         self.aliases: List[GroupAlias] = aliases
-        self.affiliations: List[Affiliation] = []
+        self.affiliations: ModelSet = ModelSet()
         self.debut_date: Optional[date] = debut_date
         self.disband_date: Optional[date] = disband_date
         if not _groups.get(self.id):
@@ -120,6 +137,40 @@ class Group(AbstractModel):
         return 1
 
     async def get_card(self, markdown=False, extra=True):
+        """
+        Get a list representing the Group as a card.
+
+        The card is cached until the Group or an object on the card changes.
+
+        :param markdown: bool
+            Whether the returned list should support markdown.
+        :param extra: bool
+            Whether to include more than the ID, name, and description.
+        :return: List[str]
+        """
+        return await self.get_cached_card(
+            (markdown, extra),
+            lambda: self._get_card_dependencies(extra),
+            lambda: self._render_card(markdown, extra),
+        )
+
+    def _get_card_dependencies(self, extra=True):
+        if not extra:
+            return []
+        dependencies = [
+            self.company,
+            self.display,
+            self.social,
+            *self.tags,
+            *self.aliases,
+            *self.affiliations,
+            *[aff.group for aff in self.affiliations],
+        ]
+        if self.display:
+            dependencies += [self.display.avatar, self.display.banner]
+        return dependencies
+
+    async def _render_card(self, markdown=False, extra=True):
         card_data = []
         if self.id:
             card_data.append(f"Group ID: {self.id}")
@@ -162,59 +213,76 @@ class Group(AbstractModel):
 
         :return: :ref:`Group`
         """
-        group_id = kwargs.get("groupid")
-        name = kwargs.get("name")
-
-        debut_date = kwargs.get("debutdate")
-        disband_date = kwargs.get("disbanddate")
-
-        debut_date_obj = convert_to_date(debut_date)
-        disband_date_obj = convert_to_date(disband_date)
-
-        description = kwargs.get("description")
+        return (await Group.create_bulk([kwargs]))[0]
 
-        company_id = kwargs.get("companyid")
-        company = await Company.get(company_id)
-
-        display_id = kwargs.get("displayid")
-        display = await Display.get(display_id)
-
-        website = kwargs.get("website")
-
-        social_id = kwargs.get("socialid")
-        social = await Social.get(social_id)
-
-        media_count = kwargs.get("mediacount")
-
-        tag_ids = kwargs.get("tagids")
-        tags = [] if not tag_ids else [await Tag.get(tag_id) for tag_id in tag_ids]
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Group objects.
 
-        alias_ids = kwargs.get("aliasids")
+        All references are resolved from cache in one pass before any Group is built.
+        Only the references missing from cache are fetched from the API.
 
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Group`]
+        """
         # avoiding circular import when updating cache on GroupAlias insertions.
         from . import GroupAlias
-
-        aliases = (
-            []
-            if not alias_ids
-            else [await GroupAlias.get(alias_id) for alias_id in alias_ids]
+        from .company import _companies
+        from .display import _displays
+        from .social import _socials
+        from .tag import _tags
+        from .groupalias import _groupaliases
+
+        # the references missing from cache are fetched together, in one batch for all the models.
+        companies, displays, socials, tags, aliases = await asyncio.gather(
+            internal_resolve(
+                Company, _companies, [row.get("companyid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Display, _displays, [row.get("displayid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Social, _socials, [row.get("socialid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Tag,
+                _tags,
+                [tag_id for row in list_of_dicts for tag_id in row.get("tagids") or []],
+            ),
+            internal_resolve(
+                GroupAlias,
+                _groupaliases,
+                [
+                    alias_id
+                    for row in list_of_dicts
+                    for alias_id in row.get("aliasids") or []
+                ],
+            ),
         )
 
-        Group(
-            group_id,
-            name,
-            description,
-            company,
-            display,
-            website,
-            social,
-            media_count,
-            tags,
-            aliases,
-            debut_date_obj,
-            disband_date_obj
-        )
-        return _groups[group_id]
+        groups = []
+        for _dictionary in list_of_dicts:
+            group_id = _dictionary.get("groupid")
+            tag_ids = _dictionary.get("tagids") or []
+            alias_ids = _dictionary.get("aliasids") or []
+
+            Group(
+                group_id,
+                _dictionary.get("name"),
+                _dictionary.get("description"),
+                companies.get(_dictionary.get("companyid")),
+                displays.get(_dictionary.get("displayid")),
+                _dictionary.get("website"),
+                socials.get(_dictionary.get("socialid")),
+                _dictionary.get("mediacount"),
+                [tags.get(tag_id) for tag_id in tag_ids],
+                [aliases.get(alias_id) for alias_id in alias_ids],
+                convert_to_date(_dictionary.get("debutdate")),
+                convert_to_date(_dictionary.get("disbanddate")),
+            )
+            groups.append(_groups[group_id])
+        return groups
 
     def __str__(self):
         return self.name
@@ -246,6 +314,17 @@ class Group(AbstractModel):
         """
         _groups.pop(self.id)
 
+    def _refresh_from(self, fresh: "Group"):
+        """
+        Update the Group object in place with a newer copy of it, keeping its affiliations.
+
+        :param fresh: :ref:`Group`
+            A newer copy of the Group object.
+        """
+        affiliations = self.affiliations
+        super(Group, self)._refresh_from(fresh)
+        self.affiliations = affiliations
+
     @staticmethod
     async def insert(
         group_name: str,
@@ -256,7 +335,7 @@ class Group(AbstractModel):
         social_id: int = None,
         tag_ids: List[int] = None,
         debut_date: date = None,
-        disband_date: date = None
+        disband_date: date = None,
     ) -> None:
         """
         Insert a new group into the database.
@@ -308,10 +387,7 @@ class Group(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`Group`
         """
-        existing = _groups.get(group_id)
-        if not existing and fetch:
-            return await Group.fetch(group_id)
-        return existing
+        return await freshness.get(Group, _groups, group_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -345,8 +421,8 @@ class Group(AbstractModel):
         .. NOTE::: Group objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Group, request={"route": "group/", "method": "GET"}
+            obj=Group, request={"route": "group/", "method": "GET"}, bulk=True
         )
 
 
-_groups: Dict[int, Group] = dict()
+_groups: Dict[int, Group] = ContextDict()
@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -11,6 +11,7 @@ from . import (
     Alias,
     internal_delete,
     internal_insert,
+    freshness,
 )
 
 
@@ -66,6 +67,26 @@ class GroupAlias(Alias):
         GroupAlias(alias_id, name, group_id, guild_id)
         return _groupaliases[alias_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create GroupAlias objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`GroupAlias`]
+        """
+        aliases = []
+        for _dictionary in list_of_dicts:
+            alias_id = _dictionary.get("aliasid")
+            GroupAlias(
+                alias_id,
+                _dictionary.get("alias"),
+                _dictionary.get("groupid"),
+                _dictionary.get("guildid"),
+            )
+            aliases.append(_groupaliases[alias_id])
+        return aliases
+
     async def delete(self) -> None:
         """
         Delete the GroupAlias object from the database and remove it from cache.
@@ -127,6 +148,7 @@ class GroupAlias(Alias):
         group = await Group.get(group_id, fetch=False)
         if group:
             group.aliases.append(group_alias)
+            group.bump_version()
         return True
 
     @staticmethod
@@ -140,10 +162,7 @@ class GroupAlias(Alias):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`GroupAlias`
         """
-        existing = _groupaliases.get(group_alias_id)
-        if not existing and fetch:
-            return await GroupAlias.fetch(group_alias_id)
-        return existing
+        return await freshness.get(GroupAlias, _groupaliases, group_alias_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -181,8 +200,8 @@ class GroupAlias(Alias):
         .. NOTE::: GroupAlias objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=GroupAlias, request={"route": "groupalias/", "method": "GET"}
+            obj=GroupAlias, request={"route": "groupalias/", "method": "GET"}, bulk=True
         )
 
 
-_groupaliases: Dict[int, GroupAlias] = dict()
+_groupaliases: Dict[int, GroupAlias] = ContextDict()
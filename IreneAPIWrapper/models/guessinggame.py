@@ -1,7 +1,7 @@
 import datetime
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -18,7 +18,9 @@ from . import (
     get_difficulty,
     basic_call,
     convert_to_timestamp,
-    convert_to_common_timestring
+    convert_to_common_timestring,
+    game_state_writes,
+    freshness,
 )
 
 
@@ -71,7 +73,7 @@ class GuessingGame(AbstractModel):
         difficulty: Difficulty,
         is_nsfw: bool,
         start_date,
-        end_date
+        end_date,
     ):
         super(GuessingGame, self).__init__(game_id)
         self.media_ids = media_ids
@@ -103,20 +105,62 @@ class GuessingGame(AbstractModel):
         start_time = convert_to_timestamp(kwargs.get("startdate"))
         end_time = convert_to_timestamp(kwargs.get("enddate"))
 
-        GuessingGame(game_id, media_ids, status_ids, mode_id, difficulty, is_nsfw, start_time, end_time)
+        GuessingGame(
+            game_id,
+            media_ids,
+            status_ids,
+            mode_id,
+            difficulty,
+            is_nsfw,
+            start_time,
+            end_time,
+        )
 
         return _ggs[game_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create GuessingGame objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`GuessingGame`]
+        """
+        games = []
+        for _dictionary in list_of_dicts:
+            game_id = _dictionary.get("gameid")
+            GuessingGame(
+                game_id,
+                _dictionary.get("mediaids"),
+                _dictionary.get("statusids"),
+                _dictionary.get("modeid"),
+                get_difficulty(_dictionary.get("difficultyid")),
+                _dictionary.get("isnsfw"),
+                convert_to_timestamp(_dictionary.get("startdate")),
+                convert_to_timestamp(_dictionary.get("enddate")),
+            )
+            games.append(_ggs[game_id])
+        return games
+
     async def update_media_and_status(
         self, media_ids: List[int], status_ids: List[int]
     ) -> None:
         """
         Update the media and status ids for the game in the database.
 
+        The update is debounced by the game state :ref:`WriteBehindBuffer`, so a game is synced at most once per
+        interval with its latest state. Use :ref:`flush` to sync immediately.
+
         :return: None
         """
         self.media_ids = media_ids
         self.status_ids = status_ids
+        await game_state_writes.stage(
+            ("guessinggame", self.id), self._update_media_and_status
+        )
+
+    async def _update_media_and_status(self) -> None:
+        """Send the media and status ids for the game to the database."""
         await basic_call(
             request={
                 "route": "guessinggame/$gg_id",
@@ -127,6 +171,15 @@ class GuessingGame(AbstractModel):
             }
         )
 
+    async def flush(self) -> bool:
+        """
+        Sync a pending media and status update to the database immediately.
+
+        :returns: bool
+            Whether there was a pending update or an update being sent.
+        """
+        return await game_state_writes.flush_key(("guessinggame", self.id))
+
     async def delete(self) -> None:
         """
         Delete the GuessingGame object from the database and remove it from cache.
@@ -143,12 +196,21 @@ class GuessingGame(AbstractModel):
         )
         await self._remove_from_cache()
 
+    def _has_staged_writes(self) -> bool:
+        """
+        Check if changes to the GuessingGame object are staged and not sent yet.
+
+        :returns: bool
+        """
+        return game_state_writes.is_staged(("guessinggame", self.id))
+
     async def _remove_from_cache(self) -> None:
         """
         Remove the GuessingGame object from cache.
 
         :returns: None
         """
+        game_state_writes.discard(("guessinggame", self.id))
         _ggs.pop(self.id)
 
     @staticmethod
@@ -214,10 +276,7 @@ class GuessingGame(AbstractModel):
         :returns: Optional[:ref:`GuessingGame`]
             The GuessingGame object requested.
         """
-        existing = _ggs.get(game_id)
-        if not existing and fetch:
-            return await GuessingGame.fetch(game_id)
-        return existing
+        return await freshness.get(GuessingGame, _ggs, game_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -253,9 +312,12 @@ class GuessingGame(AbstractModel):
         """
         Update the end time of the guessing game.
 
+        Pending state is flushed first, so the final state of the game is in the database when it ends.
+
         :param end_time: datetime.datetime
             Timestamp
         """
+        await self.flush()
         end_timestring = convert_to_common_timestring(end_time)
         return await basic_call(
             request={
@@ -273,8 +335,10 @@ class GuessingGame(AbstractModel):
         .. NOTE:: GuessingGame objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=GuessingGame, request={"route": "guessinggame", "method": "GET"}
+            obj=GuessingGame,
+            request={"route": "guessinggame", "method": "GET"},
+            bulk=True,
         )
 
 
-_ggs: Dict[int, GuessingGame] = dict()
+_ggs: Dict[int, GuessingGame] = ContextDict()
@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -11,7 +11,9 @@ from . import (
     User,
     internal_insert,
     internal_delete,
+    internal_resolve,
     basic_call,
+    freshness,
 )
 
 
@@ -182,61 +184,58 @@ class Guild(AbstractModel):
 
         :returns: :ref:`Guild`
         """
-        guild_id = kwargs.get("guildid")
-        name = kwargs.get("name")
-        emoji_count = kwargs.get("emojicount")
-        afk_timeout = kwargs.get("afktimeout")
-        icon = kwargs.get("icon")
-
-        owner_id = kwargs.get("ownerid")
-        owner = await User.get(owner_id)
-
-        banner = kwargs.get("banner")
-        description = kwargs.get("description")
-        mfa_level = kwargs.get("mfalevel")
-        splash = kwargs.get("splash")
-        nitro_level = kwargs.get("nitrolevel")
-        boosts = kwargs.get("boosts")
-        text_channel_count = kwargs.get("textchannelcount")
-        voice_channel_count = kwargs.get("voicechannelcount")
-        category_count = kwargs.get("categorycount")
-        emoji_limit = kwargs.get("emojilimit")
-        member_count = kwargs.get("membercount")
-        role_count = kwargs.get("rolecount")
-        shard_id = kwargs.get("shardid")
-        create_date = kwargs.get("createdate")
-        has_bot: bool = kwargs.get("hasbot")
-        prefixes = kwargs.get("prefixes")
+        return (await Guild.create_bulk([kwargs]))[0]
 
-        if prefixes:
-            prefixes = list(prefixes)
-
-        Guild(
-            guild_id,
-            name,
-            emoji_count,
-            afk_timeout,
-            icon,
-            owner_id,
-            owner,
-            banner,
-            description,
-            mfa_level,
-            splash,
-            nitro_level,
-            boosts,
-            text_channel_count,
-            voice_channel_count,
-            category_count,
-            emoji_limit,
-            member_count,
-            role_count,
-            shard_id,
-            create_date,
-            has_bot,
-            prefixes,
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Guild objects.
+
+        All owners are resolved from cache in one pass before any Guild is built.
+        Only the owners missing from cache are fetched from the API.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Guild`]
+        """
+        from .user import _users
+
+        owners = await internal_resolve(
+            User, _users, [row.get("ownerid") for row in list_of_dicts]
         )
-        return _guilds[guild_id]
+
+        guilds = []
+        for _dictionary in list_of_dicts:
+            guild_id = _dictionary.get("guildid")
+            owner_id = _dictionary.get("ownerid")
+            prefixes = _dictionary.get("prefixes")
+
+            Guild(
+                guild_id,
+                _dictionary.get("name"),
+                _dictionary.get("emojicount"),
+                _dictionary.get("afktimeout"),
+                _dictionary.get("icon"),
+                owner_id,
+                owners.get(owner_id),
+                _dictionary.get("banner"),
+                _dictionary.get("description"),
+                _dictionary.get("mfalevel"),
+                _dictionary.get("splash"),
+                _dictionary.get("nitrolevel"),
+                _dictionary.get("boosts"),
+                _dictionary.get("textchannelcount"),
+                _dictionary.get("voicechannelcount"),
+                _dictionary.get("categorycount"),
+                _dictionary.get("emojilimit"),
+                _dictionary.get("membercount"),
+                _dictionary.get("rolecount"),
+                _dictionary.get("shardid"),
+                _dictionary.get("createdate"),
+                _dictionary.get("hasbot"),
+                list(prefixes) if prefixes else prefixes,
+            )
+            guilds.append(_guilds[guild_id])
+        return guilds
 
     async def add_prefix(self, prefix: str) -> None:
         """Add a guild prefix.
@@ -446,10 +445,7 @@ class Guild(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`Guild`
         """
-        existing = _guilds.get(guild_id)
-        if not existing and fetch:
-            return await Guild.fetch(guild_id)
-        return existing
+        return await freshness.get(Guild, _guilds, guild_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -488,4 +484,4 @@ class Guild(AbstractModel):
         )
 
 
-_guilds: Dict[int, Guild] = dict()
+_guilds: Dict[int, Guild] = ContextDict()
@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict, TYPE_CHECKING
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -160,6 +160,29 @@ class Interaction(AbstractModel):
         Interaction(interaction_type=interaction_type, url=url)
         return _interactions[Interaction.generate_id(interaction_type, url)]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Interaction objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Interaction`]
+        """
+        interactions = []
+        for _dictionary in list_of_dicts:
+            type_id = _dictionary.get("typeid")
+            url = _dictionary.get("url")
+
+            interaction_type = _interaction_types.get(type_id)
+            if not interaction_type:
+                interaction_type = InteractionType(type_id, _dictionary.get("name"))
+
+            Interaction(interaction_type=interaction_type, url=url)
+            interactions.append(
+                _interactions[Interaction.generate_id(interaction_type, url)]
+            )
+        return interactions
+
     async def delete(self) -> None:
         """
         Delete the Interaction object from the database and remove it from cache.
@@ -222,9 +245,11 @@ class Interaction(AbstractModel):
         .. NOTE::: Interaction objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Interaction, request={"route": "interactions/", "method": "GET"}
+            obj=Interaction,
+            request={"route": "interactions/", "method": "GET"},
+            bulk=True,
         )
 
 
-_interactions: Dict[str, Interaction] = dict()
-_interaction_types: Dict[int, InteractionType] = dict()
+_interactions: Dict[str, Interaction] = ContextDict()
+_interaction_types: Dict[int, InteractionType] = ContextDict()
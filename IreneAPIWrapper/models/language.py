@@ -1,4 +1,5 @@
 from typing import List, Dict, Optional
+from IreneAPIWrapper.sections import ContextDict
 
 from . import AbstractModel
 from . import internal_fetch_all
@@ -44,7 +45,7 @@ class PackMessage:
         language_id = dict_info["languageid"]
         label = dict_info["label"]
         message = dict_info["message"]
-        num_inputs = await PackMessage.get_input_count(message)
+        num_inputs = PackMessage._count_inputs(message)
         return PackMessage(language_id, label, message, num_inputs)
 
     def get(self, *args) -> str:
@@ -84,6 +85,11 @@ class PackMessage:
         :return: int
             The number of inputs in the input message.
         """
+        return PackMessage._count_inputs(msg)
+
+    @staticmethod
+    def _count_inputs(msg: str) -> int:
+        """Synchronously count the amount of inputs in a message."""
         i = 1
         while True:
             # start of input
@@ -147,6 +153,33 @@ class Language(AbstractModel):
         Language(language_id, short_name, name, pack)
         return _langs[language_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Language objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Language`]
+        """
+        languages = []
+        for _dictionary in list_of_dicts:
+            language_id = _dictionary.get("languageid")
+            _pack = _dictionary.get("pack")
+            pack = [
+                PackMessage(
+                    dict_info["languageid"],
+                    dict_info["label"],
+                    dict_info["message"],
+                    PackMessage._count_inputs(dict_info["message"]),
+                )
+                for dict_info in (loads(_pack) if _pack else [])
+            ]
+            Language(
+                language_id, _dictionary.get("shortname"), _dictionary.get("name"), pack
+            )
+            languages.append(_langs[language_id])
+        return languages
+
     def __getitem__(self, key) -> Optional[PackMessage]:
         return self._organized_pack.get(key)
 
@@ -162,7 +195,7 @@ class Language(AbstractModel):
     @staticmethod
     async def fetch_all():
         return await internal_fetch_all(
-            Language, request={"route": "language/", "method": "GET"}
+            Language, request={"route": "language/", "method": "GET"}, bulk=True
         )
 
     @staticmethod
@@ -190,5 +223,5 @@ class Language(AbstractModel):
         return _langs.get(language_id)
 
 
-_langs: Dict[int, Language] = dict()
-_langs_by_short_name: Dict[str, Language] = dict()
+_langs: Dict[int, Language] = ContextDict()
+_langs_by_short_name: Dict[str, Language] = ContextDict()
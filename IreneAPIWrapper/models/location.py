@@ -1,19 +1,21 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     MediaSource,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
-class Location(AbstractModel):
+class Location(Versioned, AbstractModel):
     r"""Represents a location.
 
     A Location object inherits from :ref:`AbstractModel`.
@@ -38,6 +40,8 @@ class Location(AbstractModel):
 
     """
 
+    _versioned_fields = ("country", "city")
+
     def __init__(self, location_id, country, city):
         super(Location, self).__init__(location_id)
         self.country = country
@@ -62,6 +66,21 @@ class Location(AbstractModel):
         Location(location_id, country, city)
         return _locations[location_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Location objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Location`]
+        """
+        locations = []
+        for _dictionary in list_of_dicts:
+            location_id = _dictionary.get("locationid")
+            Location(location_id, _dictionary.get("country"), _dictionary.get("city"))
+            locations.append(_locations[location_id])
+        return locations
+
     async def delete(self) -> None:
         """
         Delete the Location object from the database and remove it from cache.
@@ -117,10 +136,7 @@ class Location(AbstractModel):
         if not location_id:
             return
 
-        existing = _locations.get(location_id)
-        if not existing and fetch:
-            return await Location.fetch(location_id)
-        return existing
+        return await freshness.get(Location, _locations, location_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -157,8 +173,8 @@ class Location(AbstractModel):
         .. NOTE::: Location objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Location, request={"route": "location/", "method": "GET"}
+            obj=Location, request={"route": "location/", "method": "GET"}, bulk=True
         )
 
 
-_locations: Dict[int, Location] = dict()
+_locations: Dict[int, Location] = ContextDict()
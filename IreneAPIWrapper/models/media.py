@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -11,7 +11,13 @@ from . import (
     Affiliation,
     internal_insert,
     internal_delete,
+    internal_resolve,
     basic_call,
+    write_behind,
+    media_index,
+    Difficulty,
+    get_difficulty_from_ratio,
+    freshness,
 )
 
 
@@ -73,6 +79,7 @@ class Media(AbstractModel):
 
         if not _media.get(self.id):
             _media[self.id] = self
+            media_index.add(self)
 
     @property
     def difficulty(self):
@@ -82,6 +89,11 @@ class Media(AbstractModel):
 
         return self.correct_guesses / (self.correct_guesses + self.failed_guesses)
 
+    @property
+    def difficulty_level(self) -> Difficulty:
+        """Get the :ref:`Difficulty` band of the media."""
+        return get_difficulty_from_ratio(self.difficulty)
+
     @property
     def url(self):
         """Get the media source url."""
@@ -95,27 +107,48 @@ class Media(AbstractModel):
 
         :returns: :ref:`Media`
         """
-        media_id = kwargs.get("mediaid")
+        return (await Media.create_bulk([kwargs]))[0]
 
-        link = kwargs.get("link")
-        faces = kwargs.get("faces")
-        file_type = kwargs.get("filetype")
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Media objects.
 
-        source = MediaSource(url=link, media_id=media_id, file_type=file_type)
+        All affiliations are resolved from cache in one pass before any Media is built.
+        Only the affiliations missing from cache are fetched from the API.
 
-        affiliation_id = kwargs.get("affiliationid")
-        affiliation: Affiliation = await Affiliation.get(affiliation_id)
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Media`]
+        """
+        from .affiliation import _affiliations
 
-        failed = kwargs.get("failed") or 0
-        correct = kwargs.get("correct") or 0
+        affiliations = await internal_resolve(
+            Affiliation,
+            _affiliations,
+            [row.get("affiliationid") for row in list_of_dicts],
+        )
 
-        is_enabled = kwargs.get("enabled")
-        is_nsfw = kwargs.get("nsfw")
+        media = []
+        for _dictionary in list_of_dicts:
+            media_id = _dictionary.get("mediaid")
+            source = MediaSource(
+                url=_dictionary.get("link"),
+                media_id=media_id,
+                file_type=_dictionary.get("filetype"),
+            )
 
-        Media(
-            media_id, source, faces, affiliation, is_enabled, is_nsfw, failed, correct
-        )
-        return _media[media_id]
+            Media(
+                media_id,
+                source,
+                _dictionary.get("faces"),
+                affiliations.get(_dictionary.get("affiliationid")),
+                _dictionary.get("enabled"),
+                _dictionary.get("nsfw"),
+                _dictionary.get("failed") or 0,
+                _dictionary.get("correct") or 0,
+            )
+            media.append(_media[media_id])
+        return media
 
     async def fetch_image_host_url(self):
         if self.source:
@@ -127,7 +160,9 @@ class Media(AbstractModel):
 
     async def upsert_guesses(self, correct: bool):
         """
-        Increment the guesses appropriately and update to the database after the total amount is divisible by 5.
+        Increment the guesses appropriately and stage the update to the database.
+
+        Guesses of the same media are coalesced by the :ref:`WriteBehindBuffer` until it flushes.
 
         :param correct: bool
             Whether the user guessed correctly.
@@ -137,16 +172,20 @@ class Media(AbstractModel):
         else:
             self.failed_guesses += 1
 
-        if (self.correct_guesses + self.failed_guesses) % 5 == 0:
-            await basic_call(
-                request={
-                    "route": "media/$media_id",
-                    "media_id": self.id,
-                    "failed_guesses": self.failed_guesses,
-                    "correct_guesses": self.correct_guesses,
-                    "method": "POST",
-                }
-            )
+        media_index.update(self)
+        await write_behind.stage(("media", self.id), self._update_guesses)
+
+    async def _update_guesses(self) -> None:
+        """Update the guesses to the database."""
+        await basic_call(
+            request={
+                "route": "media/$media_id",
+                "media_id": self.id,
+                "failed_guesses": self.failed_guesses,
+                "correct_guesses": self.correct_guesses,
+                "method": "POST",
+            }
+        )
 
     async def delete(self) -> None:
         """
@@ -164,6 +203,14 @@ class Media(AbstractModel):
         )
         await self._remove_from_cache()
 
+    def _has_staged_writes(self) -> bool:
+        """
+        Check if changes to the Media object are staged and not sent yet.
+
+        :returns: bool
+        """
+        return write_behind.is_staged(("media", self.id))
+
     async def _remove_from_cache(self) -> None:
         """
         Remove the Media object from cache.
@@ -171,6 +218,19 @@ class Media(AbstractModel):
         :returns: None
         """
         _media.pop(self.id)
+        media_index.remove(self)
+        # a pending guess update would write the removed media back.
+        write_behind.discard(("media", self.id))
+
+    def _refresh_from(self, fresh: "Media"):
+        """
+        Update the Media object in place with a newer copy of it and index it again.
+
+        :param fresh: :ref:`Media`
+            A newer copy of the Media object.
+        """
+        super(Media, self)._refresh_from(fresh)
+        media_index.add(self)
 
     @staticmethod
     async def insert(
@@ -216,10 +276,7 @@ class Media(AbstractModel):
         :param fetch: bool
             Whether to fetch from the API if not found in cache.
         """
-        existing = _media.get(media_id)
-        if not existing and fetch:
-            return await Media.fetch(media_id)
-        return existing
+        return await freshness.get(Media, _media, media_id, fetch)
 
     @staticmethod
     async def get_random(
@@ -283,7 +340,9 @@ class Media(AbstractModel):
             return media
 
     @staticmethod
-    async def get_all(affiliations: List[Affiliation] = None, limit=None, count_only=False):
+    async def get_all(
+        affiliations: List[Affiliation] = None, limit=None, count_only=False
+    ):
         """
         Get all Media objects in cache or from the API.
 
@@ -318,10 +377,9 @@ class Media(AbstractModel):
         if count_only:
             return sum([media_info["mediaid"] for media_info in results.values()])
 
-        media_objs = [
-            await Media.get(media_info["mediaid"])
-            for media_info in results.values()
-        ]
+        media_objs, _ = await Media.get_many(
+            media_info["mediaid"] for media_info in results.values()
+        )
         return media_objs
 
     @staticmethod
@@ -370,8 +428,8 @@ class Media(AbstractModel):
         .. NOTE::: Media objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Media, request={"route": "media/", "method": "GET"}
+            obj=Media, request={"route": "media/", "method": "GET"}, bulk=True
         )
 
 
-_media: Dict[int, Media] = dict()
+_media: Dict[int, Media] = ContextDict()
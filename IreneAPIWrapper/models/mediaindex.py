@@ -0,0 +1,297 @@
+from bisect import bisect_right
+from random import randrange
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from IreneAPIWrapper.sections import ContextDict
+from . import Difficulty, get_difficulty_from_ratio
+
+if TYPE_CHECKING:
+    from . import Media
+
+# The kinds of objects media is bucketed by.
+ALL = "all"
+AFFILIATION = "affiliation"
+PERSON = "person"
+GROUP = "group"
+# media that belongs to any group.
+GROUPED = "grouped"
+
+
+class _Bucket:
+    """A list of media that supports O(1) removal by swapping with the last media."""
+
+    __slots__ = ("media", "positions")
+
+    def __init__(self):
+        self.media: List["Media"] = []
+        self.positions: Dict[int, int] = {}
+
+    def __len__(self):
+        return len(self.media)
+
+    def add(self, media: "Media") -> None:
+        if media.id in self.positions:
+            self.media[self.positions[media.id]] = media
+            return
+        self.positions[media.id] = len(self.media)
+        self.media.append(media)
+
+    def remove(self, media: "Media") -> None:
+        position = self.positions.pop(media.id, None)
+        if position is None:
+            return
+        last = self.media.pop()
+        if position < len(self.media):
+            self.media[position] = last
+            self.positions[last.id] = position
+
+
+class MediaDifficultyIndex:
+    r"""
+    An incrementally maintained index of enabled :ref:`Media` bucketed by :ref:`Difficulty`.
+
+    Media is bucketed by its difficulty band for all media and for its :ref:`Affiliation`, :ref:`Person`, and
+    :ref:`Group`, with NSFW media kept in separate buckets. Media is moved between buckets when its guesses change,
+    so selecting media for a round never scans all media.
+
+    The difficulty band of media is found with :ref:`get_difficulty_from_ratio`.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, int, int, bool], _Bucket] = ContextDict()
+        self._keys: Dict[int, List[Tuple[str, int, int, bool]]] = ContextDict()
+
+    def add(self, media: "Media") -> None:
+        """
+        Add media to the index, or move it to the buckets of its current difficulty.
+
+        :param media: :ref:`Media`
+            The media to index. Disabled media is only removed from the index.
+        """
+        self.remove(media)
+        if not media.is_enabled:
+            return
+
+        difficulty_id = get_difficulty_from_ratio(media.difficulty).id
+        is_nsfw = bool(media.is_nsfw)
+        keys = [(ALL, 0, difficulty_id, is_nsfw)]
+
+        affiliation = media.affiliation
+        if affiliation:
+            keys.append((AFFILIATION, affiliation.id, difficulty_id, is_nsfw))
+            if affiliation.person:
+                keys.append((PERSON, affiliation.person.id, difficulty_id, is_nsfw))
+            if affiliation.group:
+                keys.append((GROUP, affiliation.group.id, difficulty_id, is_nsfw))
+                keys.append((GROUPED, 0, difficulty_id, is_nsfw))
+
+        # the buckets of the current context are looked up once, as media is indexed in bulk.
+        buckets = self._buckets.resolve()
+        for key in keys:
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+            bucket.add(media)
+        self._keys[media.id] = keys
+
+    def update(self, media: "Media") -> None:
+        """
+        Move media to another bucket if its difficulty band changed.
+
+        :param media: :ref:`Media`
+            The media whose guesses changed.
+        """
+        keys = self._keys.get(media.id)
+        if keys and keys[0][2] == get_difficulty_from_ratio(media.difficulty).id:
+            return
+        self.add(media)
+
+    def remove(self, media: "Media") -> None:
+        """
+        Remove media from the index.
+
+        :param media: :ref:`Media`
+            The media to remove.
+        """
+        keys = self._keys.pop(media.id, None)
+        if not keys:
+            return
+        buckets = self._buckets.resolve()
+        for key in keys:
+            bucket = buckets[key]
+            bucket.remove(media)
+            if not bucket:
+                buckets.pop(key)
+
+    def count(
+        self, kind: str, object_id: int, difficulty: Difficulty, nsfw=False
+    ) -> int:
+        """
+        Count the media in a bucket.
+
+        :param kind: str
+            'all', 'grouped', 'affiliation', 'person', or 'group'.
+        :param object_id: int
+            The ID of the affiliation, person, or group. Ignored for 'all' and 'grouped'.
+        :param difficulty: :ref:`Difficulty`
+            The difficulty band.
+        :param nsfw: bool
+            Whether NSFW media is included.
+        :returns: int
+        """
+        return sum(
+            len(bucket)
+            for bucket in self._get_buckets(kind, object_id, difficulty, nsfw)
+        )
+
+    def get_media(
+        self, kind: str, object_id: int, difficulty: Difficulty, nsfw=False
+    ) -> List["Media"]:
+        """
+        Get the media in a bucket.
+
+        :param kind: str
+            'all', 'grouped', 'affiliation', 'person', or 'group'.
+        :param object_id: int
+            The ID of the affiliation, person, or group. Ignored for 'all' and 'grouped'.
+        :param difficulty: :ref:`Difficulty`
+            The difficulty band.
+        :param nsfw: bool
+            Whether NSFW media is included.
+        :returns: List[:ref:`Media`]
+        """
+        return [
+            media
+            for bucket in self._get_buckets(kind, object_id, difficulty, nsfw)
+            for media in bucket.media
+        ]
+
+    def select(
+        self,
+        kind: str,
+        object_id: Optional[int],
+        difficulty: Difficulty,
+        amount: int,
+        nsfw=False,
+    ) -> List["Media"]:
+        """
+        Draw distinct random media from a bucket in O(amount).
+
+        :param kind: str
+            'all', 'grouped', 'affiliation', 'person', or 'group'.
+        :param object_id: Optional[int]
+            The ID of the affiliation, person, or group. Ignored for 'all' and 'grouped'.
+        :param difficulty: :ref:`Difficulty`
+            The difficulty band.
+        :param amount: int
+            The amount of media to draw. Fewer are returned if the bucket is smaller.
+        :param nsfw: bool
+            Whether NSFW media may be drawn.
+        :returns: List[:ref:`Media`]
+        """
+        return self.select_from([(kind, object_id)], difficulty, amount, nsfw)
+
+    def select_from(
+        self,
+        objects: Iterable[Tuple[str, Optional[int]]],
+        difficulty: Difficulty,
+        amount: int,
+        nsfw=False,
+        exclude: Optional[set] = None,
+        predicate: Optional[Callable[["Media"], bool]] = None,
+    ) -> List["Media"]:
+        """
+        Draw distinct random media from the buckets of several objects.
+
+        Positions are drawn one at a time from the combined length of the buckets without merging them, so drawing
+        is O(amount) unless media is rejected. Buckets of mixed kinds (ex: persons and groups) may share media,
+        which is only drawn from the bucket of the first object it belongs to, so shared media is not more likely
+        to be drawn.
+
+        :param objects: Iterable[Tuple[str, Optional[int]]]
+            The kind and ID of every object to draw from.
+        :param difficulty: :ref:`Difficulty`
+            The difficulty band.
+        :param amount: int
+            The amount of media to draw. Fewer are returned if the buckets are smaller.
+        :param nsfw: bool
+            Whether NSFW media may be drawn.
+        :param exclude: Optional[set]
+            Media IDs that may not be drawn.
+        :param predicate: Optional[Callable[[:ref:`Media`], bool]]
+            A check media must pass to be drawn.
+        :returns: List[:ref:`Media`]
+        """
+        objects = list(
+            dict.fromkeys(
+                (kind, 0 if kind in (ALL, GROUPED) else object_id)
+                for kind, object_id in objects
+            )
+        )
+        ranks = {obj: rank for rank, obj in enumerate(objects)}
+        mixed = len({kind for kind, _ in objects}) > 1
+
+        buckets: List[Tuple[int, _Bucket]] = []
+        offsets: List[int] = []
+        total = 0
+        for rank, (kind, object_id) in enumerate(objects):
+            for bucket in self._get_buckets(kind, object_id, difficulty, nsfw):
+                buckets.append((rank, bucket))
+                offsets.append(total)
+                total += len(bucket)
+        if amount <= 0 or not total:
+            return []
+
+        exclude = exclude or set()
+        selected = []
+        # a lazy Fisher-Yates shuffle of the positions, so every position is drawn at most once and only the
+        # positions drawn so far are stored.
+        swapped: Dict[int, int] = {}
+        for drawn in range(total):
+            index = randrange(drawn, total)
+            position = swapped.get(index, index)
+            swapped[index] = swapped.get(drawn, drawn)
+
+            bucket_index = bisect_right(offsets, position) - 1
+            rank, bucket = buckets[bucket_index]
+            media = bucket.media[position - offsets[bucket_index]]
+            if media.id in exclude:
+                continue
+            if mixed and self._get_first_rank(media, ranks) != rank:
+                continue  # drawn from the bucket of the first object it belongs to instead.
+            if predicate is not None and not predicate(media):
+                continue
+
+            selected.append(media)
+            if len(selected) == amount:
+                break
+        return selected
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._buckets.clear()
+        self._keys.clear()
+
+    def _get_buckets(
+        self, kind: str, object_id: Optional[int], difficulty: Difficulty, nsfw: bool
+    ) -> List[_Bucket]:
+        object_id = 0 if kind in (ALL, GROUPED) else object_id
+        flags = (False, True) if nsfw else (False,)
+        buckets = [
+            self._buckets.get((kind, object_id, difficulty.id, is_nsfw))
+            for is_nsfw in flags
+        ]
+        return [bucket for bucket in buckets if bucket]
+
+    def _get_first_rank(self, media: "Media", ranks: Dict[Tuple[str, int], int]) -> int:
+        """Get the rank of the first object drawn from that the media belongs to."""
+        return min(
+            (
+                ranks.get((kind, object_id), len(ranks))
+                for kind, object_id, _, _ in self._keys.get(media.id, [])
+            ),
+            default=len(ranks),
+        )
+
+
+media_index = MediaDifficultyIndex()
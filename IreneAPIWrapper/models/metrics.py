@@ -0,0 +1,472 @@
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import CallBack
+
+# log-spaced bucket bounds from 50 microseconds to about 2 minutes, each 10% wider than the last.
+# percentiles estimated from them are within 10% of the real value.
+_BOUNDS: List[float] = []
+_bound = 0.00005
+while _bound < 120:
+    _BOUNDS.append(_bound)
+    _bound *= 1.1
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    r"""
+    A fixed-bucket histogram of latencies in seconds.
+
+    Recording is O(log buckets) and takes constant memory however many latencies are recorded.
+    Percentiles are estimated from the bucket bounds and are within 10% of the real value.
+
+    Attributes
+    ----------
+    count: int
+        The amount of recorded latencies.
+    total: float
+        The sum of the recorded latencies.
+    max: float
+        The highest recorded latency.
+    """
+
+    __slots__ = ("_counts", "count", "total", "max")
+
+    def __init__(self):
+        self._counts: List[int] = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, latency: float) -> None:
+        """
+        Record a latency.
+
+        :param latency: float
+            The latency in seconds.
+        """
+        self._counts[bisect_left(_BOUNDS, latency)] += 1
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile.
+
+        :param fraction: float
+            The percentile as a fraction (ex: 0.99 for p99).
+        :returns: float
+            The latency in seconds, or 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = _BOUNDS[index] if index < len(_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get the count, sum, max and percentiles of the histogram.
+
+        :returns: Dict[str, float]
+        """
+        snapshot = {"count": self.count, "sum": self.total, "max": self.max}
+        for quantile in QUANTILES:
+            snapshot[f"p{int(quantile * 100)}"] = self.percentile(quantile)
+        return snapshot
+
+
+class RouteMetrics:
+    r"""
+    The metrics of the requests to one route with one method.
+
+    Attributes
+    ----------
+    requests: int
+        The amount of requests sent.
+    responses: int
+        The amount of responses received.
+    api_errors: int
+        The amount of requests that raised an :ref:`APIError`.
+    timeouts: int
+        The amount of requests that timed out.
+    bytes_sent: int
+        The size of the sent requests in bytes.
+    bytes_received: int
+        The size of the received responses in bytes.
+    queue_wait: :ref:`LatencyHistogram`
+        The time requests waited in the queue before they were sent.
+    network: :ref:`LatencyHistogram`
+        The time between sending requests and receiving their responses (network and server time).
+    """
+
+    __slots__ = (
+        "requests",
+        "responses",
+        "api_errors",
+        "timeouts",
+        "bytes_sent",
+        "bytes_received",
+        "queue_wait",
+        "network",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.responses = 0
+        self.api_errors = 0
+        self.timeouts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.queue_wait = LatencyHistogram()
+        self.network = LatencyHistogram()
+
+    def snapshot(self) -> dict:
+        """
+        Get the metrics as a dictionary.
+
+        :returns: dict
+        """
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "api_errors": self.api_errors,
+            "timeouts": self.timeouts,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "queue_wait": self.queue_wait.snapshot(),
+            "network": self.network.snapshot(),
+        }
+
+
+class ClientMetrics:
+    r"""
+    Request metrics of an :ref:`IreneAPIClient`, split by route and method.
+
+    Every request's time is split into the time it waited in the queue and the time from sending it until its
+    response was received. Sizes are the lengths of the websocket frames in bytes (UTF-8 for text frames).
+
+    Parameters
+    ----------
+    get_queue_depth: Optional[Callable[[], int]]
+        Gets the amount of requests waiting in the queue.
+
+    Attributes
+    ----------
+    in_flight: int
+        The amount of requests sent without a response yet.
+    late_responses: int
+        The amount of responses dropped because their request timed out or was cancelled.
+    connections: int
+        The amount of times a connection to the API was made.
+    disconnects: int
+        The amount of times a connection to the API was lost or closed.
+    reconnect_attempts: int
+        The amount of failed or delayed attempts to connect again.
+    replayed_requests: int
+        The amount of requests sent again after reconnecting.
+    lost_requests: int
+        The amount of requests that failed with :ref:`ConnectionLost`.
+    downtime: :ref:`LatencyHistogram`
+        The seconds from losing a connection until the next connection was made.
+    """
+
+    def __init__(self, get_queue_depth: Optional[Callable[[], int]] = None):
+        self._get_queue_depth = get_queue_depth
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+        self.late_responses = 0
+        self.connections = 0
+        self.disconnects = 0
+        self.reconnect_attempts = 0
+        self.replayed_requests = 0
+        self.lost_requests = 0
+        self.downtime = LatencyHistogram()
+        self._disconnected_at: Optional[float] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """The amount of requests waiting in the queue."""
+        return self._get_queue_depth() if self._get_queue_depth else 0
+
+    def get_route(self, callback: CallBack) -> RouteMetrics:
+        """
+        Get the metrics of the route and method of a request.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        :returns: :ref:`RouteMetrics`
+        """
+        key = (
+            callback.request.get("route") or "",
+            callback.request.get("method") or "",
+        )
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = RouteMetrics()
+        return route
+
+    def record_enqueued(self, callback: CallBack) -> None:
+        """
+        Record that a request was added to the queue.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        """
+        callback._enqueued_at = perf_counter()
+
+    def record_sent(self, callback: CallBack, size: int) -> None:
+        """
+        Record that a request was sent.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        :param size: int
+            The size of the sent request in bytes.
+        """
+        callback._sent_at = now = perf_counter()
+        route = self.get_route(callback)
+        route.requests += 1
+        route.bytes_sent += size
+        if callback._enqueued_at is not None:
+            route.queue_wait.record(now - callback._enqueued_at)
+        self.in_flight += 1
+
+    def record_response(self, callback: CallBack, size: int) -> None:
+        """
+        Record that the response of a request was received.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        :param size: int
+            The size of the received response in bytes.
+        """
+        callback._received_at = now = perf_counter()
+        route = self.get_route(callback)
+        route.responses += 1
+        route.bytes_received += size
+        if callback._sent_at is not None:
+            route.network.record(now - callback._sent_at)
+            self.in_flight = max(self.in_flight - 1, 0)
+
+    def record_error(self, callback: CallBack, timeout: bool = False) -> None:
+        """
+        Record that a request failed.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        :param timeout: bool
+            Whether the request timed out instead of the API returning an error.
+        """
+        route = self.get_route(callback)
+        if timeout:
+            route.timeouts += 1
+        else:
+            route.api_errors += 1
+
+    def record_abandoned(self, callback: CallBack) -> None:
+        """
+        Record that a sent request will not get its response, as its caller stopped waiting.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        """
+        if callback._sent_at is not None and callback._received_at is None:
+            self.in_flight = max(self.in_flight - 1, 0)
+
+    def record_connected(self) -> None:
+        """Record that a connection to the API was made."""
+        self.connections += 1
+        if self._disconnected_at is not None:
+            self.downtime.record(perf_counter() - self._disconnected_at)
+            self._disconnected_at = None
+
+    def record_disconnected(self) -> None:
+        """Record that the connection to the API was lost or closed. Requests in flight will not get a response."""
+        self.disconnects += 1
+        self.in_flight = 0
+        self._disconnected_at = perf_counter()
+
+    def reset(self) -> None:
+        """Forget every recorded request and connection."""
+        self._routes.clear()
+        self.late_responses = 0
+        self.connections = 0
+        self.disconnects = 0
+        self.reconnect_attempts = 0
+        self.replayed_requests = 0
+        self.lost_requests = 0
+        self.downtime = LatencyHistogram()
+
+    def snapshot(self) -> dict:
+        """
+        Get the current metrics.
+
+        :returns: dict
+            The queue depth and in-flight gauges, the totals, the connection metrics, and the metrics of every route by
+            "METHOD route".
+        """
+        routes = {
+            f"{method} {route}": metrics.snapshot()
+            for (route, method), metrics in self._routes.items()
+        }
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "late_responses": self.late_responses,
+            "requests": sum(metrics.requests for metrics in self._routes.values()),
+            "bytes_sent": sum(metrics.bytes_sent for metrics in self._routes.values()),
+            "bytes_received": sum(
+                metrics.bytes_received for metrics in self._routes.values()
+            ),
+            "connection": {
+                "connections": self.connections,
+                "disconnects": self.disconnects,
+                "reconnect_attempts": self.reconnect_attempts,
+                "replayed_requests": self.replayed_requests,
+                "lost_requests": self.lost_requests,
+                "downtime": self.downtime.snapshot(),
+            },
+            "routes": routes,
+        }
+
+    def to_prometheus(self, prefix: str = "ireneapi") -> str:
+        """
+        Get the current metrics in the Prometheus text format.
+
+        Latencies are exported as summaries with the 0.5, 0.95 and 0.99 quantiles.
+
+        :param prefix: str
+            The prefix of the metric names.
+        :returns: str
+        """
+        lines = [
+            f"# TYPE {prefix}_queue_depth gauge",
+            f"{prefix}_queue_depth {self.queue_depth}",
+            f"# TYPE {prefix}_in_flight gauge",
+            f"{prefix}_in_flight {self.in_flight}",
+            f"# TYPE {prefix}_late_responses_total counter",
+            f"{prefix}_late_responses_total {self.late_responses}",
+        ]
+        for counter in (
+            "connections",
+            "disconnects",
+            "reconnect_attempts",
+            "replayed_requests",
+            "lost_requests",
+        ):
+            lines.append(f"# TYPE {prefix}_{counter}_total counter")
+            lines.append(f"{prefix}_{counter}_total {getattr(self, counter)}")
+        name = f"{prefix}_downtime_seconds"
+        lines.append(f"# TYPE {name} summary")
+        for quantile in QUANTILES:
+            lines.append(
+                f'{name}{{quantile="{quantile}"}} {self.downtime.percentile(quantile)}'
+            )
+        lines.append(f"{name}_sum {self.downtime.total}")
+        lines.append(f"{name}_count {self.downtime.count}")
+        counters = (
+            "requests",
+            "responses",
+            "api_errors",
+            "timeouts",
+            "bytes_sent",
+            "bytes_received",
+        )
+        for counter in counters:
+            lines.append(f"# TYPE {prefix}_{counter}_total counter")
+            for (route, method), metrics in self._routes.items():
+                lines.append(
+                    f"{prefix}_{counter}_total{_labels(route, method)} {getattr(metrics, counter)}"
+                )
+
+        for histogram in ("queue_wait", "network"):
+            name = f"{prefix}_{histogram}_seconds"
+            lines.append(f"# TYPE {name} summary")
+            for (route, method), metrics in self._routes.items():
+                latencies: LatencyHistogram = getattr(metrics, histogram)
+                for quantile in QUANTILES:
+                    labels = _labels(route, method, quantile=str(quantile))
+                    lines.append(f"{name}{labels} {latencies.percentile(quantile)}")
+                lines.append(f"{name}_sum{_labels(route, method)} {latencies.total}")
+                lines.append(f"{name}_count{_labels(route, method)} {latencies.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(route: str, method: str, **extra: str) -> str:
+    labels = {"route": route, "method": method, **extra}
+    escaped = [
+        f'{key}="'
+        + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        + '"'
+        for key, value in labels.items()
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+
+class PrometheusExporter:
+    r"""
+    Serves :ref:`ClientMetrics` in the Prometheus text format over HTTP at `/metrics`.
+
+    Parameters
+    ----------
+    metrics: :ref:`ClientMetrics`
+        The metrics to serve.
+    host: str
+        The host to listen on. Defaults to only serving locally.
+    port: int
+        The port to listen on.
+    prefix: str
+        The prefix of the metric names.
+    """
+
+    def __init__(
+        self,
+        metrics: ClientMetrics,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        prefix: str = "ireneapi",
+    ):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.prefix = prefix
+        self._runner: Optional[Any] = None
+
+    async def start(self) -> "PrometheusExporter":
+        """Start serving the metrics."""
+        # imported here so the metrics are usable without the aiohttp server.
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        """Stop serving the metrics."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        return web.Response(
+            text=self.metrics.to_prometheus(self.prefix), content_type="text/plain"
+        )
@@ -1,18 +1,20 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
-class Name(AbstractModel):
+class Name(Versioned, AbstractModel):
     r"""Represents names for an entity that may have several types.
 
     A Name object inherits from :ref:`AbstractModel`.
@@ -37,6 +39,8 @@ class Name(AbstractModel):
 
     """
 
+    _versioned_fields = ("first", "last")
+
     def __init__(self, name_id, first, last):
         super(Name, self).__init__(name_id)
         self.id = name_id
@@ -69,6 +73,21 @@ class Name(AbstractModel):
         Name(name_id, first, last)
         return _names[name_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Name objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Name`]
+        """
+        names = []
+        for _dictionary in list_of_dicts:
+            name_id = _dictionary.get("nameid")
+            Name(name_id, _dictionary.get("firstname"), _dictionary.get("lastname"))
+            names.append(_names[name_id])
+        return names
+
     async def delete(self) -> None:
         """
         Delete the Name object from the database and remove it from cache.
@@ -124,10 +143,7 @@ class Name(AbstractModel):
         if not name_id:
             return
 
-        existing = _names.get(name_id)
-        if not existing and fetch:
-            return await Name.fetch(name_id)
-        return existing
+        return await freshness.get(Name, _names, name_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -161,8 +177,8 @@ class Name(AbstractModel):
         .. NOTE::: Name objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Name, request={"route": "name/", "method": "GET"}
+            obj=Name, request={"route": "name/", "method": "GET"}, bulk=True
         )
 
 
-_names: Dict[int, Name] = dict()
+_names: Dict[int, Name] = ContextDict()
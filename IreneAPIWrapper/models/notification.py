@@ -1,4 +1,5 @@
-from typing import Dict
+from typing import Dict, List
+from IreneAPIWrapper.sections import ContextDict
 
 from . import (
     AbstractModel,
@@ -6,6 +7,7 @@ from . import (
     internal_fetch_all,
     internal_delete,
     internal_insert,
+    freshness,
 )
 
 
@@ -69,6 +71,26 @@ class Notification(AbstractModel):
         Notification(noti_id=noti_id, guild_id=guild_id, user_id=user_id, phrase=phrase)
         return _notifications[noti_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Notification objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Notification`]
+        """
+        notifications = []
+        for _dictionary in list_of_dicts:
+            noti_id = _dictionary.get("notiid")
+            Notification(
+                noti_id=noti_id,
+                guild_id=_dictionary.get("guildid"),
+                user_id=_dictionary.get("userid"),
+                phrase=_dictionary.get("phrase"),
+            )
+            notifications.append(_notifications[noti_id])
+        return notifications
+
     def __str__(self):
         return str(self.phrase)
 
@@ -144,10 +166,7 @@ class Notification(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`Notification`
         """
-        existing = _notifications.get(noti_id)
-        if not existing and fetch:
-            return await Notification.fetch(noti_id)
-        return existing
+        return await freshness.get(Notification, _notifications, noti_id, fetch)
 
     @staticmethod
     async def get_all(guild_id=None, user_id=None):
@@ -201,8 +220,8 @@ class Notification(AbstractModel):
         .. NOTE::: Notification objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Notification, request={"route": "noti/", "method": "GET"}
+            obj=Notification, request={"route": "noti/", "method": "GET"}, bulk=True
         )
 
 
-_notifications: Dict[int, Notification] = dict()
+_notifications: Dict[int, Notification] = ContextDict()
@@ -1,10 +1,12 @@
+import asyncio
 from typing import Union, List, Optional, Dict, TYPE_CHECKING
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     Name,
@@ -14,7 +16,10 @@ from . import (
     Tag,
     internal_delete,
     internal_insert,
-    convert_to_date
+    internal_resolve,
+    ModelSet,
+    convert_to_date,
+    freshness,
 )
 
 from datetime import date, datetime
@@ -23,7 +28,7 @@ if TYPE_CHECKING:
     from . import Affiliation, PersonAlias
 
 
-class Person(AbstractModel):
+class Person(Versioned, AbstractModel):
 
     r"""Represents a Person (or a living entity).
 
@@ -96,13 +101,30 @@ class Person(AbstractModel):
         The tags associated with the person.
     aliases: List[:ref:`PersonAlias`]
         The aliases associated with the person.
-    affiliations: List[:ref:`Affiliation`]
-        A list of :ref:`Affiliation` objects between the :ref:`Person` and the :ref:`Group` objects they are in.
+    affiliations: :ref:`ModelSet`
+        An insertion-ordered set of :ref:`Affiliation` objects between the :ref:`Person` and the :ref:`Group` objects they are in.
     birth_date: date
         Birth date of a person.
     death_date: date
         Death date of a person.
     """
+
+    _versioned_fields = (
+        "name",
+        "description",
+        "former_name",
+        "call_count",
+        "height",
+        "blood_type",
+        "location",
+        "gender",
+        "display",
+        "social",
+        "tags",
+        "aliases",
+        "affiliations",
+    )
+
     def __init__(
         self,
         person_id,
@@ -120,7 +142,7 @@ class Person(AbstractModel):
         tags,
         aliases,
         birth_date,
-        death_date
+        death_date,
     ):
         super(Person, self).__init__(person_id)
         self.name: Optional[Name] = name
@@ -136,7 +158,7 @@ class Person(AbstractModel):
         self.media_count: int = media_count or 0
         self.tags: List[Tag] = tags
         self.aliases: List[PersonAlias] = aliases
-        self.affiliations: List[Affiliation] = []
+        self.affiliations: ModelSet = ModelSet()
         self.birth_date: Optional[date] = birth_date
         self.death_date: Optional[date] = death_date
 
@@ -148,6 +170,41 @@ class Person(AbstractModel):
         return 1
 
     async def get_card(self, markdown=False, extra=True):
+        """
+        Get a list representing the Person as a card.
+
+        The card is cached until the Person or an object on the card changes.
+
+        :param markdown: bool
+            Whether the returned list should support markdown.
+        :param extra: bool
+            Whether to include more than the ID, name, and description.
+        :return: List[str]
+        """
+        return await self.get_cached_card(
+            (markdown, extra),
+            lambda: self._get_card_dependencies(extra),
+            lambda: self._render_card(markdown, extra),
+        )
+
+    def _get_card_dependencies(self, extra=True):
+        dependencies = [self.name]
+        if extra:
+            dependencies += [
+                self.former_name,
+                self.location,
+                self.display,
+                self.social,
+                *self.tags,
+                *self.aliases,
+                *self.affiliations,
+                *[aff.group for aff in self.affiliations],
+            ]
+            if self.display:
+                dependencies += [self.display.avatar, self.display.banner]
+        return dependencies
+
+    async def _render_card(self, markdown=False, extra=True):
         card_data = []
         if self.id:
             card_data.append(f"Person ID: {self.id}")
@@ -191,73 +248,84 @@ class Person(AbstractModel):
     @staticmethod
     async def create(*args, **kwargs):
         """Create a Person object."""
-        person_id = kwargs.get("personid")
-
-        birth_date = kwargs.get("birthdate")
-        death_date = kwargs.get("deathdate")
-
-        birth_date_obj = convert_to_date(birth_date)
-        death_date_obj = convert_to_date(death_date)
-
-        name_id = kwargs.get("nameid")
-        name = await Name.get(name_id)
-
-        former_name_id = kwargs.get("nameid")
-        former_name = await Name.get(former_name_id)
-
-        display_id = kwargs.get("displayid")
-        display: Display = await Display.get(display_id)
-
-        social_id = kwargs.get("socialid")
-        social: Social = await Social.get(social_id)
+        return (await Person.create_bulk([kwargs]))[0]
 
-        location_id = kwargs.get("locationid")
-        location: Location = await Location.get(location_id)
-
-        blood_type = kwargs.get('bloodtype')
-
-        gender = kwargs.get("gender")
-
-        description = kwargs.get("description")
-
-        height = kwargs.get("height")
-
-        call_count = kwargs.get("callcount")
-        media_count = kwargs.get("mediacount")
-
-        tag_ids = kwargs.get("tagids")
-        tags = [] if not tag_ids else [await Tag.get(tag_id) for tag_id in tag_ids]
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Person objects.
 
-        alias_ids = kwargs.get("aliasids")
+        All references are resolved from cache in one pass before any Person is built.
+        Only the references missing from cache are fetched from the API.
 
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Person`]
+        """
         # avoiding circular import when updating cache on PersonAlias insertions.
         from . import PersonAlias
-
-        aliases = (
-            []
-            if not alias_ids
-            else [await PersonAlias.get(alias_id) for alias_id in alias_ids]
+        from .name import _names
+        from .display import _displays
+        from .social import _socials
+        from .location import _locations
+        from .tag import _tags
+        from .personalias import _personaliases
+
+        # the references missing from cache are fetched together, in one batch for all the models.
+        names, displays, socials, locations, tags, aliases = await asyncio.gather(
+            internal_resolve(
+                Name, _names, [row.get("nameid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Display, _displays, [row.get("displayid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Social, _socials, [row.get("socialid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Location, _locations, [row.get("locationid") for row in list_of_dicts]
+            ),
+            internal_resolve(
+                Tag,
+                _tags,
+                [tag_id for row in list_of_dicts for tag_id in row.get("tagids") or []],
+            ),
+            internal_resolve(
+                PersonAlias,
+                _personaliases,
+                [
+                    alias_id
+                    for row in list_of_dicts
+                    for alias_id in row.get("aliasids") or []
+                ],
+            ),
         )
 
-        Person(
-            person_id,
-            name,
-            former_name,
-            display,
-            social,
-            location,
-            blood_type,
-            gender,
-            description,
-            height,
-            call_count,
-            media_count,
-            tags,
-            aliases,
-            birth_date_obj,
-            death_date_obj
-        )
-        return _persons[person_id]
+        persons = []
+        for _dictionary in list_of_dicts:
+            person_id = _dictionary.get("personid")
+            tag_ids = _dictionary.get("tagids") or []
+            alias_ids = _dictionary.get("aliasids") or []
+
+            Person(
+                person_id,
+                names.get(_dictionary.get("nameid")),
+                names.get(_dictionary.get("nameid")),
+                displays.get(_dictionary.get("displayid")),
+                socials.get(_dictionary.get("socialid")),
+                locations.get(_dictionary.get("locationid")),
+                _dictionary.get("bloodtype"),
+                _dictionary.get("gender"),
+                _dictionary.get("description"),
+                _dictionary.get("height"),
+                _dictionary.get("callcount"),
+                _dictionary.get("mediacount"),
+                [tags.get(tag_id) for tag_id in tag_ids],
+                [aliases.get(alias_id) for alias_id in alias_ids],
+                convert_to_date(_dictionary.get("birthdate")),
+                convert_to_date(_dictionary.get("deathdate")),
+            )
+            persons.append(_persons[person_id])
+        return persons
 
     def __str__(self):
         return str(self.name)
@@ -289,6 +357,17 @@ class Person(AbstractModel):
         """
         _persons.pop(self.id)
 
+    def _refresh_from(self, fresh: "Person"):
+        """
+        Update the Person object in place with a newer copy of it, keeping its affiliations.
+
+        :param fresh: :ref:`Person`
+            A newer copy of the Person object.
+        """
+        affiliations = self.affiliations
+        super(Person, self)._refresh_from(fresh)
+        self.affiliations = affiliations
+
     @staticmethod
     async def insert(
         name_id,
@@ -303,7 +382,7 @@ class Person(AbstractModel):
         blood_type,
         call_count,
         birth_date,
-        death_date
+        death_date,
     ) -> None:
         r"""
         Insert a new person into the database.
@@ -370,10 +449,7 @@ class Person(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`Person`
         """
-        existing = _persons.get(person_id)
-        if not existing and fetch:
-            return await Person.fetch(person_id)
-        return existing
+        return await freshness.get(Person, _persons, person_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -411,8 +487,8 @@ class Person(AbstractModel):
         .. NOTE::: Person objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Person, request={"route": "person/", "method": "GET"}
+            obj=Person, request={"route": "person/", "method": "GET"}, bulk=True
         )
 
 
-_persons: Dict[int, Person] = dict()
+_persons: Dict[int, Person] = ContextDict()
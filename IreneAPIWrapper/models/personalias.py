@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -11,6 +11,7 @@ from . import (
     Alias,
     internal_delete,
     internal_insert,
+    freshness,
 )
 
 
@@ -69,6 +70,26 @@ class PersonAlias(Alias):
         PersonAlias(alias_id, name, person_id, guild_id)
         return _personaliases[alias_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create PersonAlias objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`PersonAlias`]
+        """
+        aliases = []
+        for _dictionary in list_of_dicts:
+            alias_id = _dictionary.get("aliasid")
+            PersonAlias(
+                alias_id,
+                _dictionary.get("alias"),
+                _dictionary.get("personid"),
+                _dictionary.get("guildid"),
+            )
+            aliases.append(_personaliases[alias_id])
+        return aliases
+
     async def delete(self) -> None:
         """
         Delete the PersonAlias object from the database and remove it from cache.
@@ -132,6 +153,7 @@ class PersonAlias(Alias):
         person = await Person.get(person_id, fetch=False)
         if person:
             person.aliases.append(person_alias)
+            person.bump_version()
         return True
 
     @staticmethod
@@ -145,10 +167,7 @@ class PersonAlias(Alias):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`PersonAlias`
         """
-        existing = _personaliases.get(person_alias_id)
-        if not existing and fetch:
-            return await PersonAlias.fetch(person_alias_id)
-        return existing
+        return await freshness.get(PersonAlias, _personaliases, person_alias_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -187,8 +206,10 @@ class PersonAlias(Alias):
         .. NOTE::: PersonAlias objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=PersonAlias, request={"route": "personalias/", "method": "GET"}
+            obj=PersonAlias,
+            request={"route": "personalias/", "method": "GET"},
+            bulk=True,
         )
 
 
-_personaliases: Dict[int, PersonAlias] = dict()
+_personaliases: Dict[int, PersonAlias] = ContextDict()
@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -10,6 +10,7 @@ from . import (
     MediaSource,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
@@ -52,6 +53,21 @@ class Position(AbstractModel):
         Position(position_id, name)
         return _positions[position_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Position objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Position`]
+        """
+        positions = []
+        for _dictionary in list_of_dicts:
+            position_id = _dictionary.get("positionid")
+            Position(position_id, _dictionary.get("name"))
+            positions.append(_positions[position_id])
+        return positions
+
     async def delete(self) -> None:
         """
         Delete the Position object from the database and remove it from cache.
@@ -100,10 +116,7 @@ class Position(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`Position`
         """
-        existing = _positions.get(position_id)
-        if not existing:
-            return await Position.fetch(position_id)
-        return existing
+        return await freshness.get(Position, _positions, position_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -141,8 +154,8 @@ class Position(AbstractModel):
         .. NOTE::: Position objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Position, request={"route": "position/", "method": "GET"}
+            obj=Position, request={"route": "position/", "method": "GET"}, bulk=True
         )
 
 
-_positions: Dict[int, Position] = dict()
+_positions: Dict[int, Position] = ContextDict()
@@ -0,0 +1,303 @@
+import asyncio
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import CallBack, TokenBucket, get_route_class
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    r"""
+    The rate limit of a route class.
+
+    Parameters
+    ----------
+    rate: float
+        The amount of requests allowed per second.
+    burst: float
+        The amount of requests that may be sent at once after being idle.
+    """
+
+    rate: float
+    burst: float = 1.0
+
+
+class AIMDLimiter:
+    r"""
+    An additive-increase/multiplicative-decrease limit on the amount of requests waiting for a response.
+
+    The limit grows by one for every `limit` requests that are answered on time and is multiplied by
+    `decrease_factor` when a request fails or is slow. A request is slow when its latency is over
+    `latency_tolerance` times the usual latency of its route class, so slow routes (ex: preloading all media) do not
+    lower the limit by themselves. Only one decrease happens per round trip, so a burst of failures lowers the limit
+    once.
+
+    Parameters
+    ----------
+    initial: int
+        The starting limit.
+    minimum: int
+        The lowest the limit may go.
+    maximum: int
+        The highest the limit may go.
+    decrease_factor: float
+        What the limit is multiplied by when the API is overloaded.
+    latency_tolerance: float
+        How many times slower than usual a response must be to count as overloaded.
+
+    Attributes
+    ----------
+    limit: float
+        The current limit. Requests are sent while fewer than `int(limit)` are in flight.
+    in_flight: int
+        The amount of requests waiting for a response.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError(
+                "The limits must satisfy 1 <= minimum <= initial <= maximum."
+            )
+        self.limit: float = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._waiters: List[asyncio.Future] = []
+
+    async def acquire(self) -> float:
+        """
+        Wait until another request may be sent.
+
+        :returns: float
+            The :func:`time.perf_counter` time the request was allowed.
+        """
+        while self.in_flight >= int(self.limit):
+            await self._wait()
+        self.in_flight += 1
+        return perf_counter()
+
+    def release(self, acquired_at: float, overloaded: bool) -> None:
+        """
+        Free the slot of a request that was answered or abandoned.
+
+        :param acquired_at: float
+            The time returned by :ref:`acquire`.
+        :param overloaded: bool
+            Whether the request failed or was slow.
+        """
+        self.in_flight = max(self.in_flight - 1, 0)
+        if overloaded:
+            # requests sent before the last decrease saw the old limit, so they do not decrease it again.
+            if acquired_at >= self._last_decrease:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                self._last_decrease = perf_counter()
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        self._notify()
+
+    def forget(self) -> None:
+        """Free the slot of a request without changing the limit (ex: when its caller stopped waiting)."""
+        self.in_flight = max(self.in_flight - 1, 0)
+        self._notify()
+
+    def clear(self) -> None:
+        """Forget every request in flight (ex: when the connection is lost)."""
+        self.in_flight = 0
+        self._notify()
+
+    async def wait_idle(self) -> None:
+        """Wait until no request is in flight."""
+        while self.in_flight:
+            await self._wait()
+
+    async def _wait(self) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        finally:
+            if future in self._waiters:
+                self._waiters.remove(future)
+
+    def _notify(self) -> None:
+        # waiters check again whether they may continue.
+        waiters, self._waiters = self._waiters, []
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+
+class RequestLimiter:
+    r"""
+    Limits how fast an :ref:`IreneAPIClient` sends requests.
+
+    Every route class (see :func:`get_route_class`) can have a :ref:`RateLimit` enforced with a :ref:`TokenBucket`,
+    and the amount of requests waiting for a response is limited by an :ref:`AIMDLimiter` that adapts to the observed
+    latency and errors of the API. Requests are sent in the order they were queued, so a request waiting for its
+    route class's tokens holds back the requests behind it.
+
+    Parameters
+    ----------
+    rate_limits: Optional[Dict[str, :ref:`RateLimit`]]
+        The rate limits by route class.
+    default_rate_limit: Optional[:ref:`RateLimit`]
+        The rate limit of route classes without one. None does not limit them.
+    concurrency: Optional[:ref:`AIMDLimiter`]
+        The concurrency limit. Defaults to an :ref:`AIMDLimiter` with its default values.
+    get_class: Callable[[dict], str]
+        Gets the route class of a request.
+    """
+
+    # how much of every new latency is added to a route class's usual latency.
+    _LATENCY_WEIGHT = 0.1
+    # the amount of responses of a route class needed before slow responses count as overloaded.
+    _MIN_SAMPLES = 10
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, RateLimit]] = None,
+        default_rate_limit: Optional[RateLimit] = None,
+        concurrency: Optional[AIMDLimiter] = None,
+        get_class: Callable[[dict], str] = get_route_class,
+    ):
+        self.concurrency = concurrency or AIMDLimiter()
+        self.default_rate_limit = default_rate_limit
+        self.get_class = get_class
+        self._rate_limits: Dict[str, RateLimit] = dict(rate_limits or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._latencies: Dict[str, Tuple[float, int]] = {}
+        self._acquired: Dict[int, Tuple[str, float]] = {}
+
+    def set_rate_limit(self, route_class: str, rate_limit: Optional[RateLimit]) -> None:
+        """
+        Change the rate limit of a route class.
+
+        :param route_class: str
+            The route class.
+        :param rate_limit: Optional[:ref:`RateLimit`]
+            The new rate limit. None uses the default rate limit.
+        """
+        if rate_limit is None:
+            self._rate_limits.pop(route_class, None)
+        else:
+            self._rate_limits[route_class] = rate_limit
+        self._buckets.pop(route_class, None)
+
+    def get_rate_limit(self, route_class: str) -> Optional[RateLimit]:
+        """
+        Get the rate limit of a route class.
+
+        :param route_class: str
+            The route class.
+        :returns: Optional[:ref:`RateLimit`]
+        """
+        return self._rate_limits.get(route_class, self.default_rate_limit)
+
+    async def acquire(self, callback: CallBack) -> None:
+        """
+        Wait until a request may be sent.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        """
+        route_class = self.get_class(callback.request)
+        bucket = self._get_bucket(route_class)
+        if bucket:
+            await bucket.acquire()
+        self._acquired[callback.id] = (route_class, await self.concurrency.acquire())
+
+    def release(self, callback: CallBack, failed: bool = False) -> None:
+        """
+        Free the concurrency slot of a request that was answered, failed, or abandoned.
+
+        Requests that were not acquired (or were already released) are ignored.
+
+        :param callback: :ref:`CallBack`
+            The request.
+        :param failed: bool
+            Whether the API returned an error or the request timed out.
+        """
+        acquired = self._acquired.pop(callback.id, None)
+        if acquired is None:
+            return
+
+        route_class, acquired_at = acquired
+        latency = perf_counter() - acquired_at
+        usual, samples = self._latencies.get(route_class, (latency, 0))
+        slow = (
+            samples >= self._MIN_SAMPLES
+            and latency > usual * self.concurrency.latency_tolerance
+        )
+        self._latencies[route_class] = (
+            usual + (latency - usual) * self._LATENCY_WEIGHT,
+            samples + 1,
+        )
+        self.concurrency.release(acquired_at, failed or slow)
+
+    def forget(self, callback: CallBack) -> None:
+        """
+        Free the concurrency slot of a request without changing the limit (ex: when its caller was cancelled).
+
+        :param callback: :ref:`CallBack`
+            The request.
+        """
+        if self._acquired.pop(callback.id, None) is not None:
+            self.concurrency.forget()
+
+    def clear(self) -> None:
+        """Forget every request in flight (ex: when the connection is lost)."""
+        self._acquired.clear()
+        self.concurrency.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Get the current limits.
+
+        :returns: dict
+            The concurrency limit and requests in flight, and the rate limit, available tokens, and usual latency
+            of every route class seen.
+        """
+        route_classes = {}
+        for route_class in (
+            set(self._rate_limits) | set(self._buckets) | set(self._latencies)
+        ):
+            rate_limit = self.get_rate_limit(route_class)
+            bucket = self._buckets.get(route_class)
+            latency = self._latencies.get(route_class)
+            route_classes[route_class] = {
+                "rate": rate_limit.rate if rate_limit else None,
+                "burst": rate_limit.burst if rate_limit else None,
+                "tokens": bucket.tokens if bucket else None,
+                "latency": latency[0] if latency else None,
+            }
+        return {
+            "concurrency": {
+                "limit": int(self.concurrency.limit),
+                "in_flight": self.concurrency.in_flight,
+                "minimum": self.concurrency.minimum,
+                "maximum": self.concurrency.maximum,
+            },
+            "route_classes": route_classes,
+        }
+
+    def _get_bucket(self, route_class: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(route_class)
+        if bucket is None:
+            rate_limit = self.get_rate_limit(route_class)
+            if rate_limit is None:
+                return None
+            bucket = self._buckets[route_class] = TokenBucket(
+                rate_limit.rate, rate_limit.burst
+            )
+        return bucket
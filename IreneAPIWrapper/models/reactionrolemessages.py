@@ -1,4 +1,5 @@
 from typing import Union, List, Optional, Dict
+from IreneAPIWrapper.sections import ContextDict
 
 from . import (
     AbstractModel,
@@ -19,10 +20,8 @@ class ReactionRoleMessage(AbstractModel):
     message_id: int
         The message id.
     """
-    def __init__(
-            self,
-            message_id: int
-    ):
+
+    def __init__(self, message_id: int):
         super(ReactionRoleMessage, self).__init__(message_id)
         if not _reaction_messages.get(self.id):
             # we need to make sure not to override the current object in cache.
@@ -43,6 +42,21 @@ class ReactionRoleMessage(AbstractModel):
         ReactionRoleMessage(message_id)
         return _reaction_messages[message_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create ReactionRoleMessage objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`ReactionRoleMessage`]
+        """
+        messages = []
+        for _dictionary in list_of_dicts:
+            message_id = _dictionary.get("messageid")
+            ReactionRoleMessage(message_id)
+            messages.append(_reaction_messages[message_id])
+        return messages
+
     @staticmethod
     async def insert(message_id: int):
         """
@@ -79,8 +93,10 @@ class ReactionRoleMessage(AbstractModel):
         .. NOTE:: ReactionRoleMessage objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=ReactionRoleMessage, request={"route": "reaction_roles/", "method": "GET"}
+            obj=ReactionRoleMessage,
+            request={"route": "reaction_roles/", "method": "GET"},
+            bulk=True,
         )
 
 
-_reaction_messages: Dict[int, ReactionRoleMessage] = dict()
+_reaction_messages: Dict[int, ReactionRoleMessage] = ContextDict()
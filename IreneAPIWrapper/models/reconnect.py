@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from random import Random
+from typing import Optional, Tuple
+
+
+@dataclass
+class ReconnectPolicy:
+    r"""
+    How an :ref:`IreneAPIClient` reconnects and what it does with requests that were waiting for a response when the
+    connection was lost.
+
+    Reconnects wait with exponential backoff and full jitter: attempt N waits a random time between 0 and
+    `min(maximum_delay, base_delay * multiplier ** N)`, so many clients do not reconnect at the same moment.
+    The attempts start over once a connection is made.
+
+    Requests with a method in `replay_methods` are idempotent, so they are sent again on the new connection
+    (up to `max_replays` times). Other requests may or may not have been applied by the API, so they fail with
+    :ref:`ConnectionLost` instead.
+
+    Parameters
+    ----------
+    base_delay: float
+        The most seconds the first reconnect waits.
+    maximum_delay: float
+        The most seconds any reconnect waits.
+    multiplier: float
+        How much the most a reconnect can wait grows with every failed attempt.
+    replay_methods: Tuple[str, ...]
+        The methods of requests that are sent again after reconnecting.
+    max_replays: int
+        The amount of times a request may be sent again before it fails.
+    seed: Optional[int]
+        The seed of the jitter, for reproducible delays.
+    """
+
+    base_delay: float = 0.5
+    maximum_delay: float = 60.0
+    multiplier: float = 2.0
+    replay_methods: Tuple[str, ...] = ("GET",)
+    max_replays: int = 3
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self._random = Random(self.seed)
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get the seconds to wait before a reconnect attempt.
+
+        :param attempt: int
+            The amount of attempts that failed since the last connection.
+        :returns: float
+        """
+        # the exponent is capped so it does not overflow after many attempts.
+        ceiling = min(
+            self.maximum_delay, self.base_delay * self.multiplier ** min(attempt, 64)
+        )
+        return self._random.uniform(0, ceiling)
+
+    def can_replay(self, request: dict) -> bool:
+        """
+        Check if a request may be sent again after reconnecting.
+
+        :param request: dict
+            The request.
+        :returns: bool
+        """
+        return (request.get("method") or "GET").upper() in self.replay_methods
@@ -1,7 +1,7 @@
 from typing import Union, List, Optional, Dict
 from datetime import datetime
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -11,7 +11,8 @@ from . import (
     internal_insert,
     internal_delete,
     basic_call,
-    convert_to_timestamp
+    convert_to_timestamp,
+    freshness,
 )
 
 
@@ -44,7 +45,15 @@ class Reminder(AbstractModel):
     notify_date: datetime
         The date object containing when the user should be reminded.
     """
-    def __init__(self, reminder_id, user_id: int, reason: str, start_date: datetime, notify_date: datetime):
+
+    def __init__(
+        self,
+        reminder_id,
+        user_id: int,
+        reason: str,
+        start_date: datetime,
+        notify_date: datetime,
+    ):
         super(Reminder, self).__init__(reminder_id)
         self.user_id: int = user_id
         self.reason: str = reason
@@ -73,6 +82,27 @@ class Reminder(AbstractModel):
         Reminder(remind_id, user_id, reason, start_date, notify_date)
         return _reminders[remind_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Reminder objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Reminder`]
+        """
+        reminders = []
+        for _dictionary in list_of_dicts:
+            remind_id = _dictionary.get("id")
+            Reminder(
+                remind_id,
+                _dictionary.get("userid"),
+                _dictionary.get("reason"),
+                convert_to_timestamp(_dictionary.get("startdate")),
+                convert_to_timestamp(_dictionary.get("notifydate")),
+            )
+            reminders.append(_reminders[remind_id])
+        return reminders
+
     async def delete(self) -> None:
         """Delete the Reminder object from the database and remove it from cache.
 
@@ -80,7 +110,11 @@ class Reminder(AbstractModel):
         """
         await internal_delete(
             self,
-            request={"route": "reminder/$remind_id", "remind_id": self.id, "method": "DELETE"},
+            request={
+                "route": "reminder/$remind_id",
+                "remind_id": self.id,
+                "method": "DELETE",
+            },
         )
         await self._remove_from_cache()
 
@@ -136,10 +170,7 @@ class Reminder(AbstractModel):
         """
         if not remind_id:
             return None
-        existing = _reminders.get(remind_id)
-        if not existing and fetch:
-            return await Reminder.fetch(remind_id)
-        return existing
+        return await freshness.get(Reminder, _reminders, remind_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -164,7 +195,11 @@ class Reminder(AbstractModel):
         """
         return await internal_fetch(
             Reminder,
-            request={"route": "reminder/$remind_id", "remind_id": remind_id, "method": "GET"},
+            request={
+                "route": "reminder/$remind_id",
+                "remind_id": remind_id,
+                "method": "GET",
+            },
         )
 
     @staticmethod
@@ -174,8 +209,11 @@ class Reminder(AbstractModel):
         .. NOTE::: Reminders objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Reminder, request={"route": "reminder/", "method": "GET"}, log_creation=log_creation
+            obj=Reminder,
+            request={"route": "reminder/", "method": "GET"},
+            log_creation=log_creation,
+            bulk=True,
         )
 
 
-_reminders: Dict[int, Reminder] = dict()
+_reminders: Dict[int, Reminder] = ContextDict()
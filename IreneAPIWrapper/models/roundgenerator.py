@@ -0,0 +1,151 @@
+from typing import List, Optional, Tuple
+
+from . import Difficulty, EASY, MEDIUM, HARD, Mode, GROUP, User, Media, media_index
+from .mediaindex import ALL, GROUPED, PERSON, GROUP as GROUP_KIND
+
+
+class RoundGenerator:
+    r"""
+    Generates the media of a guessing game locally from the :ref:`MediaDifficultyIndex`.
+
+    The eligible media of a user's guessing game filter is made of the index buckets of the filtered persons and
+    groups, so a whole game is drawn without any API calls once media is cached.
+
+    In :ref:`NORMAL` mode, the filter includes the user's filtered persons and the members of the filtered groups.
+    In :ref:`GROUP` mode, only media of the filtered groups (or of any group without a filter) is eligible.
+
+    Media is also filtered by its amount of faces and file type, like :ref:`Media.get_random`.
+    """
+
+    @staticmethod
+    def get_eligible_objects(
+        user: Optional[User], mode: Mode
+    ) -> List[Tuple[str, Optional[int]]]:
+        """
+        Get the kinds and IDs of the objects whose media is eligible for a user.
+
+        :param user: Optional[:ref:`User`]
+            The user starting the game. Without a user, no filter is applied.
+        :param mode: :ref:`Mode`
+            The guessing game mode.
+        :returns: List[Tuple[str, Optional[int]]]
+        """
+        filter_active = user is not None and user.gg_filter_active
+        group_ids = list(user.gg_filter_group_ids or []) if filter_active else []
+
+        if mode.id == GROUP.id:
+            return [(GROUP_KIND, group_id) for group_id in group_ids] or [
+                (GROUPED, None)
+            ]
+
+        person_ids = list(user.gg_filter_person_ids or []) if filter_active else []
+        objects = [(PERSON, person_id) for person_id in person_ids]
+        objects += [(GROUP_KIND, group_id) for group_id in group_ids]
+        return objects or [(ALL, None)]
+
+    @staticmethod
+    def generate(
+        user: Optional[User],
+        mode: Mode,
+        difficulty: Difficulty,
+        is_nsfw: bool,
+        amount: int = 20,
+        strict_difficulty: bool = False,
+        min_faces: int = 1,
+        max_faces: int = 999,
+        file_type: Optional[str] = None,
+    ) -> List[Media]:
+        """
+        Draw the distinct media for a whole guessing game.
+
+        :param user: Optional[:ref:`User`]
+            The user starting the game.
+        :param mode: :ref:`Mode`
+            The guessing game mode.
+        :param difficulty: :ref:`Difficulty`
+            The guessing game difficulty.
+        :param is_nsfw: bool
+            Whether NSFW media may be drawn.
+        :param amount: int
+            The amount of questions.
+        :param strict_difficulty: bool
+            Whether only media of the difficulty may be drawn. Otherwise, when there is not enough media of the
+            difficulty, the rest is drawn from the closest difficulties.
+        :param min_faces: int
+            Minimum number of faces the media can have.
+        :param max_faces: int
+            Maximum number of faces the media can have.
+        :param file_type: Optional[str]
+            A restricted file type.
+        :returns: List[:ref:`Media`]
+            The media drawn. Fewer media is returned if not enough media is eligible.
+        """
+        objects = RoundGenerator.get_eligible_objects(user, mode)
+        difficulties = (
+            [difficulty]
+            if strict_difficulty
+            else RoundGenerator._get_closest_difficulties(difficulty)
+        )
+
+        def is_eligible(_media: Media) -> bool:
+            if not min_faces <= (_media.faces or 0) <= max_faces:
+                return False
+            return file_type is None or (
+                _media.source is not None and _media.source.file_type == file_type
+            )
+
+        media = []
+        for _difficulty in difficulties:
+            media += media_index.select_from(
+                objects,
+                _difficulty,
+                amount - len(media),
+                nsfw=is_nsfw,
+                predicate=is_eligible,
+            )
+            if len(media) >= amount:
+                break
+        return media
+
+    @staticmethod
+    def generate_media_ids(
+        user: Optional[User],
+        mode: Mode,
+        difficulty: Difficulty,
+        is_nsfw: bool,
+        amount: int = 20,
+        strict_difficulty: bool = False,
+        min_faces: int = 1,
+        max_faces: int = 999,
+        file_type: Optional[str] = None,
+    ) -> List[int]:
+        """
+        Draw the distinct media IDs for a whole guessing game.
+
+        Takes the same parameters as :ref:`generate`.
+
+        :returns: List[int]
+            The media IDs drawn, ready for :ref:`GuessingGame.insert`.
+        """
+        return [
+            media.id
+            for media in RoundGenerator.generate(
+                user,
+                mode,
+                difficulty,
+                is_nsfw,
+                amount,
+                strict_difficulty,
+                min_faces,
+                max_faces,
+                file_type,
+            )
+        ]
+
+    @staticmethod
+    def _get_closest_difficulties(difficulty: Difficulty) -> List[Difficulty]:
+        if difficulty.id == EASY.id:
+            return [EASY, MEDIUM, HARD]
+        if difficulty.id == HARD.id:
+            return [HARD, MEDIUM, EASY]
+        return [MEDIUM, EASY, HARD]
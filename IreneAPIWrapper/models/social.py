@@ -1,19 +1,21 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     MediaSource,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
-class Social(AbstractModel):
+class Social(Versioned, AbstractModel):
     r"""Represents the social media sources for an entity.
 
     A Social object inherits from :ref:`AbstractModel`.
@@ -66,6 +68,18 @@ class Social(AbstractModel):
 
     """
 
+    _versioned_fields = (
+        "twitter",
+        "youtube",
+        "melon",
+        "instagram",
+        "vlive",
+        "spotify",
+        "fancafe",
+        "facebook",
+        "tiktok",
+    )
+
     def __init__(
         self,
         social_id,
@@ -171,6 +185,32 @@ class Social(AbstractModel):
         )
         return _socials[social_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Social objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Social`]
+        """
+        socials = []
+        for _dictionary in list_of_dicts:
+            social_id = _dictionary.get("socialid")
+            Social(
+                social_id,
+                _dictionary.get("twitter"),
+                _dictionary.get("youtube"),
+                _dictionary.get("melon"),
+                _dictionary.get("instagram"),
+                _dictionary.get("vlive"),
+                _dictionary.get("spotify"),
+                _dictionary.get("fancafe"),
+                _dictionary.get("facebook"),
+                _dictionary.get("tiktok"),
+            )
+            socials.append(_socials[social_id])
+        return socials
+
     async def delete(self) -> None:
         """
         Delete the Social object from the database and remove it from cache.
@@ -255,10 +295,7 @@ class Social(AbstractModel):
         if not social_id:
             return
 
-        existing = _socials.get(social_id)
-        if not existing and fetch:
-            return await Social.fetch(social_id)
-        return existing
+        return await freshness.get(Social, _socials, social_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -296,8 +333,8 @@ class Social(AbstractModel):
         .. NOTE::: Social objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Social, request={"route": "social/", "method": "GET"}
+            obj=Social, request={"route": "social/", "method": "GET"}, bulk=True
         )
 
 
-_socials: Dict[int, Social] = dict()
+_socials: Dict[int, Social] = ContextDict()
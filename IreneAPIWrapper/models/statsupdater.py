@@ -1,5 +1,8 @@
+from functools import partial
+
 from . import (
-    basic_call
+    basic_call,
+    write_behind,
 )
 
 
@@ -7,10 +10,16 @@ class StatsUpdater:
     """
     Class that handles the update of statistics to the API.
 
+    Updates are staged in the :ref:`WriteBehindBuffer`, so only the latest value of a stat is sent when it flushes.
     """
     @staticmethod
     async def update(key, value):
         """Update a stat value in the API."""
+        await write_behind.stage(("stats", key), partial(StatsUpdater._update, key, value))
+
+    @staticmethod
+    async def _update(key, value):
+        """Send a stat value to the API."""
         await basic_call(
             request={
                 "route": "bot/updatestats",
@@ -19,4 +28,3 @@ class StatsUpdater:
                 "method": "PUT"
             }
         )
-
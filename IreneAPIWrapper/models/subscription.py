@@ -1,6 +1,114 @@
-from typing import Optional, Dict, List, Union
-from IreneAPIWrapper.sections import outer
-from . import Channel, CallBack, AbstractModel
+from typing import Optional, Dict, List, Union, Iterable
+from IreneAPIWrapper.sections import outer, ContextDict
+from . import Channel, CallBack, AbstractModel, ModelSet
+
+
+class SubscriptionIndex:
+    r"""
+    Reverse indexes of the :ref:`Channel` and guild IDs following the cached accounts of one service.
+
+    Every concrete :ref:`Subscription` keeps one index next to its cache. It is kept current when channels
+    subscribe or unsubscribe in cache, so the accounts followed by a channel or guild can be found
+    without iterating every account.
+    """
+
+    def __init__(self):
+        self._by_channel: Dict[int, ModelSet] = ContextDict()
+        self._by_guild: Dict[int, Dict["Subscription", set]] = ContextDict()
+        self._channel_guilds: Dict[int, int] = ContextDict()
+
+    def add(self, account: "Subscription", channels: Iterable[Channel]) -> None:
+        """
+        Index channels as following an account.
+
+        :param account: :ref:`Subscription`
+            The account being followed.
+        :param channels: Iterable[:ref:`Channel`]
+            The channels following the account.
+        """
+        for channel in channels:
+            accounts = self._by_channel.setdefault(channel.id, ModelSet())
+            accounts.add(account)
+
+            guild_id = self._channel_guilds.get(channel.id)
+            if guild_id is None and channel.guild_id is not None:
+                # the guild of the channel may not have been known when it was first indexed.
+                guild_id = self._channel_guilds[channel.id] = channel.guild_id
+                for _account in accounts:
+                    self._by_guild.setdefault(guild_id, {}).setdefault(
+                        _account, set()
+                    ).add(channel.id)
+            elif guild_id is not None:
+                self._by_guild.setdefault(guild_id, {}).setdefault(account, set()).add(
+                    channel.id
+                )
+
+    def remove(self, account: "Subscription", channel: Channel) -> None:
+        """
+        Remove a channel following an account from the index.
+
+        :param account: :ref:`Subscription`
+            The account that was followed.
+        :param channel: :ref:`Channel`
+            The channel that unsubscribed.
+        """
+        accounts = self._by_channel.get(channel.id)
+        if accounts is None:
+            return
+
+        accounts.discard(account)
+        guild_id = self._channel_guilds.get(channel.id)
+        if not accounts:
+            self._by_channel.pop(channel.id)
+            self._channel_guilds.pop(channel.id, None)
+
+        guild_accounts = self._by_guild.get(guild_id)
+        if guild_accounts is None:
+            return
+
+        channel_ids = guild_accounts.get(account)
+        if channel_ids is not None:
+            channel_ids.discard(channel.id)
+            if not channel_ids:
+                guild_accounts.pop(account)
+        if not guild_accounts:
+            self._by_guild.pop(guild_id)
+
+    def remove_account(self, account: "Subscription") -> None:
+        """
+        Remove every channel following an account from the index.
+
+        :param account: :ref:`Subscription`
+            The account removed from cache.
+        """
+        for channel in list(account):
+            self.remove(account, channel)
+
+    def by_channel(self, channel_id: int) -> List["Subscription"]:
+        """
+        Get the accounts a channel follows.
+
+        :param channel_id: int
+            The channel ID.
+        :returns: List[:ref:`Subscription`]
+        """
+        return list(self._by_channel.get(channel_id) or [])
+
+    def by_guild(self, guild_id: int) -> List["Subscription"]:
+        """
+        Get the accounts followed by any channel in a guild.
+
+        :param guild_id: int
+            The guild ID.
+        :returns: List[:ref:`Subscription`]
+        """
+        return list(self._by_guild.get(guild_id) or [])
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._by_channel.clear()
+        self._by_guild.clear()
+        self._channel_guilds.clear()
 
 
 class Subscription(AbstractModel):
@@ -12,6 +120,8 @@ class Subscription(AbstractModel):
             Checks if two service accounts have the same ID.
         .. describe:: x != y
             Checks if two service accounts do not have the same ID.
+        .. describe:: channel in x
+            Checks if a :ref:`Channel` follows the service account.
 
     Parameters
     ----------
@@ -28,8 +138,8 @@ class Subscription(AbstractModel):
         Account ID.
     name: str
         The account's name.
-    _followed: List[:ref:`Channel`]
-        The list of :ref:`Channel` objects followed to the service account.
+    _followed: :ref:`ModelSet`
+        The insertion-ordered set of :ref:`Channel` objects followed to the service account.
     _mention_roles: Dict[:ref:`Channel`, int]
         :ref:`Channel` objects associated with role ids to mention on updates.
     """
@@ -43,7 +153,7 @@ class Subscription(AbstractModel):
     ):
         super(Subscription, self).__init__(account_id)
         self.name: str = account_name.lower()
-        self._followed: List[Channel] = followed or []
+        self._followed: ModelSet = ModelSet(followed)
         self._mention_roles: Dict[Channel, int] = mention_roles or {}
 
     def __iter__(self):
@@ -52,11 +162,31 @@ class Subscription(AbstractModel):
     def __len__(self):
         return len(self._followed)
 
-    def __eq__(self, other):
-        return self.id == other.id
+    def __contains__(self, channel):
+        return channel in self._followed
+
+    @staticmethod
+    def _get_index() -> Optional[SubscriptionIndex]:
+        """Get the :ref:`SubscriptionIndex` of the concrete service."""
+        return None
 
-    def __ne__(self, other):
-        return self.id != other.id
+    def _refresh_from(self, fresh: "Subscription"):
+        """
+        Update the account in place with a newer copy of it, including the channels following it.
+
+        :param fresh: :ref:`Subscription`
+            A newer copy of the account.
+        """
+        super(Subscription, self)._refresh_from(fresh)
+        index = self._get_index()
+        if index:
+            # the fresh copy indexed itself when it was created.
+            index.remove_account(fresh)
+            index.remove_account(self)
+        self._followed = fresh._followed
+        self._mention_roles = fresh._mention_roles
+        if index:
+            index.add(self, self._followed)
 
     def _sub_in_cache(
         self,
@@ -73,16 +203,19 @@ class Subscription(AbstractModel):
         :param role_id: int
             The role ID to add.
         """
-        if channel and channel not in self:
-            self._followed.append(channel)
+        index = self._get_index()
+        if channel:
+            self._followed.add(channel)
+            if index:
+                index.add(self, [channel])
 
         if role_id and channel:
             self._mention_roles[channel] = role_id
 
         if channels:
-            self._followed += [
-                _channel for _channel in channels if _channel not in self._followed
-            ]
+            self._followed.update(channels)
+            if index:
+                index.add(self, channels)
 
         if role_ids:
             self._mention_roles |= role_ids  # merge the dictionaries.
@@ -94,11 +227,12 @@ class Subscription(AbstractModel):
         :param channel: :ref:`Channel`
             A :ref:`Channel` object to remove from cache.
         """
-        if channel in self._followed:
-            self._followed.remove(channel)
+        self._followed.discard(channel)
+        self._mention_roles.pop(channel, None)
 
-        if self._mention_roles.get(channel):
-            self._mention_roles.pop(channel)
+        index = self._get_index()
+        if index:
+            index.remove(self, channel)
 
     async def unsubscribe(self, channel: Channel) -> None:
         """
@@ -115,6 +249,35 @@ class Subscription(AbstractModel):
         :return: None
         """
 
+    @classmethod
+    async def subbed_in(
+        cls, guild_id: int, fetch: bool = False
+    ) -> List["Subscription"]:
+        """
+        Get the accounts subscribed to in a guild from cache.
+
+        :param guild_id: int
+            The guild ID.
+        :param fetch: bool
+            Whether to fetch the subscriptions from the API. Services without a route for it always answer from
+            cache (Defaults to False).
+        :returns: List[:ref:`Subscription`]
+        """
+        index = cls._get_index()
+        return index.by_guild(guild_id) if index else []
+
+    @classmethod
+    async def subbed_in_channel(cls, channel_id: int) -> List["Subscription"]:
+        """
+        Get the accounts subscribed to in a channel from cache.
+
+        :param channel_id: int
+            The channel ID.
+        :returns: List[:ref:`Subscription`]
+        """
+        index = cls._get_index()
+        return index.by_channel(channel_id) if index else []
+
     async def get_role_id(self, channel: Channel):
         """Get the role id to mention of a channel."""
         return self._mention_roles.get(channel)
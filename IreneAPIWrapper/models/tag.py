@@ -1,18 +1,20 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
     AbstractModel,
+    Versioned,
     internal_fetch,
     internal_fetch_all,
     internal_insert,
     internal_delete,
+    freshness,
 )
 
 
-class Tag(AbstractModel):
+class Tag(Versioned, AbstractModel):
     r"""Represents a tag that describes an entity.
 
     A Tag object inherits from :ref:`AbstractModel`.
@@ -32,6 +34,8 @@ class Tag(AbstractModel):
         The tag name.
     """
 
+    _versioned_fields = ("name",)
+
     def __init__(self, tag_id, name, *args, **kwargs):
         super(Tag, self).__init__(tag_id)
         self.name = name
@@ -54,6 +58,21 @@ class Tag(AbstractModel):
         Tag(tag_id, name)
         return _tags[tag_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create Tag objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`Tag`]
+        """
+        tags = []
+        for _dictionary in list_of_dicts:
+            tag_id = _dictionary.get("tagid")
+            Tag(tag_id, _dictionary.get("name"))
+            tags.append(_tags[tag_id])
+        return tags
+
     async def delete(self) -> None:
         """
         Delete the Tag object from the database and remove it from cache.
@@ -97,10 +116,7 @@ class Tag(AbstractModel):
         :param fetch: bool
             Whether to fetch from the API if not found in cache.
         """
-        existing = _tags.get(tag_id)
-        if not existing and fetch:
-            return await Tag.fetch(tag_id)
-        return existing
+        return await freshness.get(Tag, _tags, tag_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -132,8 +148,8 @@ class Tag(AbstractModel):
         .. NOTE::: Tag objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=Tag, request={"route": "tag/", "method": "GET"}
+            obj=Tag, request={"route": "tag/", "method": "GET"}, bulk=True
         )
 
 
-_tags: Dict[int, Tag] = dict()
+_tags: Dict[int, Tag] = ContextDict()
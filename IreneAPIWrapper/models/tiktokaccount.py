@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -17,7 +17,10 @@ from . import (
     get_difficulty,
     basic_call,
     Subscription,
+    SubscriptionIndex,
     Channel,
+    internal_resolve,
+    freshness,
 )
 
 
@@ -58,6 +61,7 @@ class TikTokAccount(Subscription):
         if not acc:
             # we need to make sure not to override the current object in cache.
             _accounts[self.id] = self
+            _subscriptions.add(self, self._followed)
         else:
             acc._sub_in_cache(channels=channels_following, role_ids=mention_roles)
 
@@ -128,42 +132,51 @@ class TikTokAccount(Subscription):
             A list of dictionaries.
         :returns: Optional[List[:ref:`TikTokAccount`]]
         """
+        from .channel import _channels
+
+        channels = await internal_resolve(
+            Channel, _channels, [row["channelid"] for row in list_of_dicts]
+        )
+        for channel_id, channel in channels.items():
+            if not channel:  # should never be the case.
+                await Channel.insert(channel_id, None)
+                channels[channel_id] = Channel(channel_id)
+
         final_channels = {}
         final_roles = {}
         final_user_ids = {}
         for _dictionary in list_of_dicts:
             username = _dictionary["username"]
             user_id = _dictionary["userid"]
-            guild_id = _dictionary.get("guildid")
-            channel_id = _dictionary["channelid"]
-            # posted = _dictionary["posted"]
             role_id = _dictionary["roleid"]
 
-            final_user_ids[username] = final_user_ids.get(username, []) + [user_id]
+            final_user_ids.setdefault(username, []).append(user_id)
 
-            channel = await Channel.get(channel_id)
-            if not channel:
-                await channel.insert(channel_id)
-                channel = await Channel.get(channel_id)
+            channel = channels[_dictionary["channelid"]]
             setattr(channel, "user_id", user_id)
 
             if not channel.guild_id:
-                channel.guild_id = guild_id
+                channel.guild_id = _dictionary.get("guildid")
 
-            final_channels[username] = final_channels.get(username, []) + [channel]
+            final_channels.setdefault(username, []).append(channel)
 
             if role_id:
                 # sets the default username to contain an empty dict of the channel, and then assign it a role id.
                 (final_roles.setdefault(username, {}))[channel] = role_id
 
         final_tiktok_channels = []
-        for _user, _channels in final_channels.items():
-            TikTokAccount(_user, final_user_ids.get(_user), _channels, final_roles.get(_user))
-            obj = await TikTokAccount.get(_user, fetch=False)
-            final_tiktok_channels.append(obj)
+        for _user, _user_channels in final_channels.items():
+            TikTokAccount(
+                _user, final_user_ids.get(_user), _user_channels, final_roles.get(_user)
+            )
+            final_tiktok_channels.append(_accounts[_user])
 
         return final_tiktok_channels
 
+    @staticmethod
+    def _get_index() -> SubscriptionIndex:
+        return _subscriptions
+
     async def unsubscribe(self, channel: Union[Channel]):
         """
         Have a channel unsubscribe from the account if it is not already.
@@ -192,17 +205,15 @@ class TikTokAccount(Subscription):
         :param channel: :ref:`Channel`
             A :ref:`Channel` object to remove from cache.
         """
-        if channel in self._followed:
-            self._followed.remove(channel)
-
-        if self._mention_roles.get(channel):
-            self._mention_roles.pop(channel)
+        super(TikTokAccount, self)._unsub_in_cache(channel)
 
         user_id = getattr(channel, "user_id", None)
         if user_id:
             self.user_ids.remove(user_id)
 
-    async def subscribe(self, channel: Channel, role_id: Optional[int] = None, user_id=None):
+    async def subscribe(
+        self, channel: Channel, role_id: Optional[int] = None, user_id=None
+    ):
         if channel in self:
             # check for a role id update
             if await self.get_role_id(channel) != role_id:
@@ -216,7 +227,10 @@ class TikTokAccount(Subscription):
 
         setattr(channel, "user_id", user_id)
 
-        if await self.insert(self.id, user_id, channel.id, role_id, fetch=False) is False:
+        if (
+            await self.insert(self.id, user_id, channel.id, role_id, fetch=False)
+            is False
+        ):
             return False
         self._sub_in_cache(channel, user_id, role_id)
 
@@ -233,22 +247,12 @@ class TikTokAccount(Subscription):
 
         :param channel: Union[:ref:`Channel`, List[:ref:`Channel`]
             A :ref:`Channel` object to add to cache.
+        :param user_id: int
+            The user who requested the subscription.
         :param role_id: int
             The role ID to add.
         """
-        if channel and channel not in self:
-            self._followed.append(channel)
-
-        if role_id and channel:
-            self._mention_roles[channel] = role_id
-
-        if channels:
-            self._followed += [
-                _channel for _channel in channels if _channel not in self._followed
-            ]
-
-        if role_ids:
-            self._mention_roles |= role_ids  # merge the dictionaries.
+        super(TikTokAccount, self)._sub_in_cache(channel, role_id, channels, role_ids)
 
         if user_id:
             if user_id not in self.user_ids:
@@ -261,9 +265,12 @@ class TikTokAccount(Subscription):
         :returns: None
         """
         _accounts.pop(self.id)
+        _subscriptions.remove_account(self)
 
     @staticmethod
-    async def insert(username: str, user_id: int, channel_id: int, role_id: Optional[int], fetch=True):
+    async def insert(
+        username: str, user_id: int, channel_id: int, role_id: Optional[int], fetch=True
+    ):
         """
         Insert a new TikTokAccount into the database.
 
@@ -293,7 +300,7 @@ class TikTokAccount(Subscription):
             }
         )
 
-        if 'User does not exist.' in callback.response.get('status', ''):
+        if "User does not exist." in callback.response.get("status", ""):
             return False
 
         # have the model created and added to cache.
@@ -314,10 +321,7 @@ class TikTokAccount(Subscription):
             The TikTokAccount object requested.
         """
         username = username.lower()
-        existing = _accounts.get(username)
-        if not existing and fetch:
-            return await TikTokAccount.fetch(username)
-        return existing
+        return await freshness.get(TikTokAccount, _accounts, username, fetch)
 
     @staticmethod
     async def get_all():
@@ -358,4 +362,5 @@ class TikTokAccount(Subscription):
         )
 
 
-_accounts: Dict[str, TikTokAccount] = dict()
+_accounts: Dict[str, TikTokAccount] = ContextDict()
+_subscriptions = SubscriptionIndex()
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from time import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from IreneAPIWrapper.sections import outer
+from . import TikTokAccount, Channel, TokenBucket
+
+
+@dataclass
+class NewVideoEvent:
+    r"""Holds a :ref:`TikTokAccount` that posted a new video and where the video should be posted."""
+    account: TikTokAccount
+    video_id: int
+    channels: List[Channel] = field(default_factory=list)
+    mention_roles: Dict[Channel, int] = field(default_factory=dict)
+
+
+class TikTokVideoWatcher:
+    r"""
+    Watches the latest videos of :ref:`TikTokAccount` objects and emits new videos.
+
+    Accounts are checked under a concurrency cap and a token bucket rate limit. The last seen video ID of every
+    account is remembered in memory and optionally persisted to a JSON file. The first video seen for an
+    account is only remembered, so a restart without persistence does not repost old videos. Only a video with a
+    higher ID than the last seen video is new.
+
+    Accounts that posted most recently are checked first. A check that fails is logged and does not fail the
+    checks of the other accounts.
+
+    Parameters
+    ----------
+    max_concurrency: int
+        The maximum amount of accounts being checked at the same time.
+    rate: float
+        The maximum amount of checks per second.
+    burst: float
+        The maximum amount of checks allowed in a burst.
+    interval: float
+        The amount of seconds between polls when running in the background.
+    persist_path: Optional[str]
+        A JSON file to load and save the last seen video IDs.
+
+    Attributes
+    ----------
+    max_concurrency: int
+        The maximum amount of accounts being checked at the same time.
+    interval: float
+        The amount of seconds between polls when running in the background.
+    persist_path: Optional[str]
+        A JSON file to load and save the last seen video IDs.
+    last_seen: Dict[str, int]
+        The last seen video ID by username.
+    last_posted: Dict[str, float]
+        The UNIX timestamp a new video was last seen by username.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate: float = 5.0,
+        burst: float = 5.0,
+        interval: float = 300.0,
+        persist_path: Optional[str] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self.persist_path = persist_path
+        self.last_seen: Dict[str, int] = {}
+        self.last_posted: Dict[str, float] = {}
+        self._bucket = TokenBucket(rate, burst)
+        self._listeners: List[Callable[[NewVideoEvent], Union[Awaitable, None]]] = []
+        self._task: Optional[asyncio.Task] = None
+
+        if persist_path:
+            self.load()
+
+    def add_listener(
+        self, listener: Callable[[NewVideoEvent], Union[Awaitable, None]]
+    ) -> None:
+        """
+        Add a listener that is called with every :ref:`NewVideoEvent`.
+
+        :param listener: Callable[[:ref:`NewVideoEvent`], Union[Awaitable, None]]
+            A function or coroutine function.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(
+        self, listener: Callable[[NewVideoEvent], Union[Awaitable, None]]
+    ) -> None:
+        """
+        Remove a listener.
+
+        :param listener: Callable[[:ref:`NewVideoEvent`], Union[Awaitable, None]]
+            The function that was added.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def poll(
+        self, accounts: Optional[Iterable[TikTokAccount]] = None
+    ) -> List[NewVideoEvent]:
+        """
+        Check the latest video of accounts once and emit the new videos.
+
+        :param accounts: Optional[Iterable[:ref:`TikTokAccount`]]
+            The accounts to check. Defaults to every cached :ref:`TikTokAccount`.
+        :returns: List[:ref:`NewVideoEvent`]
+            The new videos found.
+        """
+        accounts = accounts if accounts is not None else await TikTokAccount.get_all()
+        accounts = sorted(
+            accounts,
+            key=lambda account: self.last_posted.get(account.id, 0),
+            reverse=True,
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def check(account: TikTokAccount) -> Optional[NewVideoEvent]:
+            async with semaphore:
+                await self._bucket.acquire()
+                try:
+                    video_id = await account.get_latest_video_id()
+                    return self._check_video(account, video_id)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # one failed account does not fail the other accounts of the poll.
+                    outer.client.logger.warning(
+                        f"Could not check the latest TikTok video of {account.id} - {e}"
+                    )
+                    return None
+
+        events = [
+            event
+            for event in await asyncio.gather(*[check(account) for account in accounts])
+            if event
+        ]
+
+        if self.persist_path:
+            self.save()
+
+        for event in events:
+            await self._emit(event)
+        return events
+
+    async def start(self) -> None:
+        """Start watching in the background. Does nothing if the watcher is already running."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop watching in the background."""
+        if not self._task:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher is watching in the background."""
+        return self._task is not None and not self._task.done()
+
+    def load(self) -> None:
+        """Load the last seen video IDs from the persistence file if it exists."""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+
+        with open(self.persist_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        self.last_seen = {
+            username: int(video_id)
+            for username, video_id in data.get("last_seen", {}).items()
+        }
+        self.last_posted = {
+            username: float(posted)
+            for username, posted in data.get("last_posted", {}).items()
+        }
+
+    def save(self) -> None:
+        """Save the last seen video IDs to the persistence file."""
+        if not self.persist_path:
+            return
+
+        # write to a temporary file first so an interrupted save does not corrupt the existing file.
+        temp_path = f"{self.persist_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"last_seen": self.last_seen, "last_posted": self.last_posted}, file
+            )
+        os.replace(temp_path, self.persist_path)
+
+    def _check_video(
+        self, account: TikTokAccount, video_id: Optional[int]
+    ) -> Optional[NewVideoEvent]:
+        if video_id is None or video_id == -1:
+            return None
+
+        last_seen = self.last_seen.get(account.id)
+        # video IDs grow over time, so a lower ID is an older video that resurfaced
+        # after a newer one was deleted.
+        if last_seen is not None and video_id <= last_seen:
+            return None
+
+        self.last_seen[account.id] = video_id
+        if last_seen is None:
+            # first time seeing the account, there is nothing to compare with.
+            return None
+
+        self.last_posted[account.id] = time()
+        return NewVideoEvent(
+            account, video_id, list(account), dict(account._mention_roles)
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                outer.client.logger.error(f"TikTok video watch failed - {e}")
+            await asyncio.sleep(self.interval)
+
+    async def _emit(self, event: NewVideoEvent) -> None:
+        for listener in list(self._listeners):
+            try:
+                result = listener(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                outer.client.logger.error(
+                    f"A TikTok video listener failed for {event.account.id} - {e}"
+                )
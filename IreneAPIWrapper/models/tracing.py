@@ -0,0 +1,297 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from IreneAPIWrapper.sections import outer
+from . import CallBack
+
+# a value set by the application (ex: the command being run) that is passed to every hook of the requests it makes.
+trace_context: ContextVar[Any] = ContextVar("trace_context", default=None)
+
+HOOKS = (
+    "on_request_enqueued",
+    "on_request_sent",
+    "on_response_received",
+    "on_request_abandoned",
+    "on_model_created",
+)
+
+
+@dataclass
+class RequestTrace:
+    r"""
+    A request event passed to the request hooks of :ref:`Tracing`.
+
+    Attributes
+    ----------
+    callback_id: int
+        The :ref:`CallBack` ID.
+    route: str
+        The route of the request.
+    method: str
+        The method of the request.
+    timestamp: float
+        The :func:`time.perf_counter` time of the event.
+    context: Any
+        The :data:`trace_context` of the task that made the request.
+    size: Optional[int]
+        The size in bytes of the sent request or received response, if it was sent or received.
+    error: Optional[str]
+        The error returned by the API, if the response is an error, or why the request was abandoned
+        ('timeout', 'cancelled', or 'connection_lost').
+    """
+
+    callback_id: int
+    route: str
+    method: str
+    timestamp: float
+    context: Any = None
+    size: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ModelTrace:
+    r"""
+    A model creation event passed to the `on_model_created` hooks of :ref:`Tracing`.
+
+    Attributes
+    ----------
+    callback_id: int
+        The :ref:`CallBack` ID of the request the objects were created from.
+    route: str
+        The route of the request.
+    model: str
+        The name of the concrete model.
+    count: int
+        The amount of objects created.
+    duration: float
+        The seconds spent creating the objects.
+    timestamp: float
+        The :func:`time.perf_counter` time the objects were created.
+    context: Any
+        The :data:`trace_context` of the task that made the request.
+    """
+
+    callback_id: int
+    route: str
+    model: str
+    count: int
+    duration: float
+    timestamp: float
+    context: Any = None
+
+
+class Tracing:
+    r"""
+    Pluggable hooks called for every request of an :ref:`IreneAPIClient`.
+
+    Hooks are synchronous functions that receive a :ref:`RequestTrace` (`on_request_enqueued`, `on_request_sent`,
+    `on_response_received`, `on_request_abandoned`) or a :ref:`ModelTrace` (`on_model_created`). They run inline
+    with the request, so they should only record the event. A hook that raises is logged and does not affect the
+    request.
+
+    `on_request_enqueued` and `on_model_created` run in the task that made the request, so hooks can read its
+    context variables. The other hooks run in the connection's task, so the :data:`trace_context` of the task that
+    made the request is captured when it is enqueued and passed with every event.
+
+    When no hooks are registered, every request only checks :attr:`active`.
+
+    Attributes
+    ----------
+    active: bool
+        Whether any hook is registered.
+    """
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Callable]] = {name: [] for name in HOOKS}
+        self.active = False
+
+    def add_hook(self, name: str, hook: Callable) -> None:
+        """
+        Register a hook.
+
+        :param name: str
+            The event to hook (on_request_enqueued, on_request_sent, on_response_received, on_request_abandoned,
+            or on_model_created).
+        :param hook: Callable
+            A function that receives the event.
+        """
+        if name not in self._hooks:
+            raise ValueError(
+                f"{name} is not a tracing hook. Hooks are: {', '.join(HOOKS)}."
+            )
+        self._hooks[name].append(hook)
+        self.active = True
+
+    def remove_hook(self, name: str, hook: Callable) -> None:
+        """
+        Unregister a hook.
+
+        :param name: str
+            The hooked event.
+        :param hook: Callable
+            The registered function.
+        """
+        hooks = self._hooks.get(name)
+        if hooks and hook in hooks:
+            hooks.remove(hook)
+        self.active = any(self._hooks.values())
+
+    def request_enqueued(self, callback: CallBack) -> None:
+        """Call the `on_request_enqueued` hooks and capture the context of the request."""
+        callback._trace_context = trace_context.get()
+        self._emit("on_request_enqueued", self._get_request_trace(callback))
+
+    def request_sent(self, callback: CallBack, size: int) -> None:
+        """Call the `on_request_sent` hooks."""
+        self._emit("on_request_sent", self._get_request_trace(callback, size))
+
+    def response_received(self, callback: CallBack, size: int) -> None:
+        """Call the `on_response_received` hooks."""
+        trace = self._get_request_trace(callback, size)
+        error = (callback.response or {}).get("error")
+        trace.error = str(error) if error else None
+        self._emit("on_response_received", trace)
+
+    def request_abandoned(self, callback: CallBack, reason: str) -> None:
+        """Call the `on_request_abandoned` hooks."""
+        trace = self._get_request_trace(callback)
+        trace.error = reason
+        self._emit("on_request_abandoned", trace)
+
+    def model_created(
+        self, callback: CallBack, model, count: int, duration: float
+    ) -> None:
+        """Call the `on_model_created` hooks."""
+        if not self._hooks["on_model_created"]:
+            return
+        self._emit(
+            "on_model_created",
+            ModelTrace(
+                callback.id,
+                callback.request.get("route") or "",
+                model.__name__,
+                count,
+                duration,
+                perf_counter(),
+                callback._trace_context,
+            ),
+        )
+
+    def _emit(self, name: str, event) -> None:
+        for hook in self._hooks[name]:
+            try:
+                hook(event)
+            except Exception as e:
+                if outer.client:
+                    outer.client.logger.error(f"Tracing hook {name} failed - {e}")
+
+    @staticmethod
+    def _get_request_trace(
+        callback: CallBack, size: Optional[int] = None
+    ) -> RequestTrace:
+        return RequestTrace(
+            callback.id,
+            callback.request.get("route") or "",
+            callback.request.get("method") or "",
+            perf_counter(),
+            callback._trace_context,
+            size,
+        )
+
+
+class OpenTelemetryTracing:
+    r"""
+    Reports every request as an OpenTelemetry span.
+
+    Spans start when a request is enqueued (as a child of the current span of the task that made it) and end when
+    its response is received or it is abandoned, with an event when it is sent. Model creation is added as an event
+    to the current span of the task that made the request.
+
+    Requires the optional `opentelemetry-api` package.
+
+    Parameters
+    ----------
+    tracer_provider: Optional[opentelemetry.trace.TracerProvider]
+        The provider to get the tracer from. Defaults to the global provider.
+    """
+
+    def __init__(self, tracer_provider=None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryTracing requires the opentelemetry-api package."
+            )
+
+        self._trace = trace
+        self._tracer = trace.get_tracer(
+            "IreneAPIWrapper", tracer_provider=tracer_provider
+        )
+        self._spans: Dict[int, Any] = {}
+
+    def install(self, tracing: Tracing) -> None:
+        """
+        Register the hooks that report spans.
+
+        :param tracing: :ref:`Tracing`
+            The tracing of a client.
+        """
+        tracing.add_hook("on_request_enqueued", self.on_request_enqueued)
+        tracing.add_hook("on_request_sent", self.on_request_sent)
+        tracing.add_hook("on_response_received", self.on_response_received)
+        tracing.add_hook("on_request_abandoned", self.on_response_received)
+        tracing.add_hook("on_model_created", self.on_model_created)
+
+    def uninstall(self, tracing: Tracing) -> None:
+        """
+        Unregister the hooks that report spans.
+
+        :param tracing: :ref:`Tracing`
+            The tracing of a client.
+        """
+        tracing.remove_hook("on_request_enqueued", self.on_request_enqueued)
+        tracing.remove_hook("on_request_sent", self.on_request_sent)
+        tracing.remove_hook("on_response_received", self.on_response_received)
+        tracing.remove_hook("on_request_abandoned", self.on_response_received)
+        tracing.remove_hook("on_model_created", self.on_model_created)
+
+    def on_request_enqueued(self, event: RequestTrace) -> None:
+        self._spans[event.callback_id] = self._tracer.start_span(
+            f"{event.method} {event.route}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "ireneapi.callback_id": event.callback_id,
+                "ireneapi.route": event.route,
+                "ireneapi.method": event.method,
+            },
+        )
+
+    def on_request_sent(self, event: RequestTrace) -> None:
+        span = self._spans.get(event.callback_id)
+        if span is not None:
+            span.add_event("sent", {"ireneapi.request_size": event.size or 0})
+
+    def on_response_received(self, event: RequestTrace) -> None:
+        span = self._spans.pop(event.callback_id, None)
+        if span is None:
+            return
+        span.set_attribute("ireneapi.response_size", event.size or 0)
+        if event.error:
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, event.error)
+            )
+        span.end()
+
+    def on_model_created(self, event: ModelTrace) -> None:
+        self._trace.get_current_span().add_event(
+            "model_created",
+            {
+                "ireneapi.callback_id": event.callback_id,
+                "ireneapi.model": event.model,
+                "ireneapi.count": event.count,
+                "ireneapi.duration": event.duration,
+            },
+        )
@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -17,7 +17,10 @@ from . import (
     get_difficulty,
     basic_call,
     Subscription,
+    SubscriptionIndex,
     Channel,
+    internal_resolve,
+    freshness,
 )
 
 
@@ -53,6 +56,7 @@ class TwitchAccount(Subscription):
         if not acc:
             # we need to make sure not to override the current object in cache.
             _accounts[self.id] = self
+            _subscriptions.add(self, self._followed)
         else:
             acc._sub_in_cache(channels=channels_following, role_ids=mention_roles)
 
@@ -98,39 +102,35 @@ class TwitchAccount(Subscription):
             A list of dictionaries.
         :returns: Optional[List[:ref:`TwitchAccount`]]
         """
+        from .channel import _channels
+
+        channels = await internal_resolve(
+            Channel, _channels, [row["channelid"] for row in list_of_dicts]
+        )
+        for channel_id, channel in channels.items():
+            if not channel:  # should never be the case.
+                await Channel.insert(channel_id, None)
+                channels[channel_id] = Channel(channel_id)
+
         final_channels = {}
         final_roles = {}
         for _dictionary in list_of_dicts:
             username = _dictionary["username"]
-            guild_id = _dictionary.get("guildid")
-            channel_id = _dictionary["channelid"]
-            # posted = _dictionary["posted"]
             role_id = _dictionary["roleid"]
 
-            channel = await Channel.get(channel_id)
-            if not channel:
-                await channel.insert(channel_id)
-                channel = await Channel.get(channel_id)
-
+            channel = channels[_dictionary["channelid"]]
             if not channel.guild_id:
-                channel.guild_id = guild_id
+                channel.guild_id = _dictionary.get("guildid")
 
-            if not final_channels.get(username):
-                final_channels[username] = [channel]
-            else:
-                final_channels[username].append(channel)
+            final_channels.setdefault(username, []).append(channel)
 
             if role_id:
-                if not final_roles.get(username):
-                    final_roles[username] = dict({channel: role_id})
-                else:
-                    final_roles[username][channel] = role_id
+                final_roles.setdefault(username, {})[channel] = role_id
 
         final_twitch_channels = []
-        for _user, _channels in final_channels.items():
-            TwitchAccount(_user, _channels, final_roles.get(_user))
-            obj = await TwitchAccount.get(_user, fetch=False)
-            final_twitch_channels.append(obj)
+        for _user, _user_channels in final_channels.items():
+            TwitchAccount(_user, _user_channels, final_roles.get(_user))
+            final_twitch_channels.append(_accounts[_user])
 
         return final_twitch_channels
 
@@ -150,8 +150,9 @@ class TwitchAccount(Subscription):
         if not results:
             return []
 
-        channel_ids = [row["channelid"] for row in results.values()]
-        channels = [await Channel.get(channel_id) for channel_id in channel_ids]
+        channels, _ = await Channel.get_many(
+            row["channelid"] for row in results.values()
+        )
         return channels
 
     async def update_posted(self, channel_ids: List[int], posted: bool) -> None:
@@ -205,9 +206,9 @@ class TwitchAccount(Subscription):
         )
 
         live_dict: Dict[str, bool] = callback.response["results"]
-        for user, is_live in live_dict.items():
-            acc = await TwitchAccount.get(user)
-            acc.is_live = is_live
+        accounts, _ = await TwitchAccount.get_many(live_dict.keys())
+        for acc in accounts:
+            acc.is_live = live_dict.get(acc.id, live_dict.get(acc.name, False))
         return live_dict
 
     @staticmethod
@@ -275,15 +276,29 @@ class TwitchAccount(Subscription):
         :returns: None
         """
         _accounts.pop(self.id)
+        _subscriptions.remove_account(self)
 
     @staticmethod
-    async def subbed_in(guild_id):
+    def _get_index() -> SubscriptionIndex:
+        return _subscriptions
+
+    @classmethod
+    async def subbed_in(
+        cls, guild_id: int, fetch: bool = False
+    ) -> List["TwitchAccount"]:
         """
         Get the twitch channels subscribed to in a Guild.
 
-        :param guild_id: The guild ID.
-        :return: Optional[List[:ref:`TwitchAccount`]]
+        :param guild_id: int
+            The guild ID.
+        :param fetch: bool
+            Whether to fetch the subscriptions from the API instead of answering from the cache index
+            (Defaults to False).
+        :returns: List[:ref:`TwitchAccount`]
         """
+        if not fetch:
+            return await super(TwitchAccount, cls).subbed_in(guild_id)
+
         return await internal_fetch_all(
             TwitchAccount,
             request={
@@ -291,6 +306,7 @@ class TwitchAccount(Subscription):
                 "guild_id": guild_id,
                 "method": "GET",
             },
+            bulk=True,
         )
 
     @staticmethod
@@ -335,10 +351,7 @@ class TwitchAccount(Subscription):
             The TwitchAccount object requested.
         """
         username = username.lower()
-        existing = _accounts.get(username)
-        if not existing and fetch:
-            return await TwitchAccount.fetch(username)
-        return existing
+        return await freshness.get(TwitchAccount, _accounts, username, fetch)
 
     @staticmethod
     async def get_all():
@@ -379,4 +392,5 @@ class TwitchAccount(Subscription):
         )
 
 
-_accounts: Dict[str, TwitchAccount] = dict()
+_accounts: Dict[str, TwitchAccount] = ContextDict()
+_subscriptions = SubscriptionIndex()
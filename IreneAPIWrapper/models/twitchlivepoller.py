@@ -0,0 +1,223 @@
+import asyncio
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from IreneAPIWrapper.sections import outer
+from . import basic_call, TwitchAccount
+
+
+@dataclass
+class LiveStatusChange:
+    r"""Holds a :ref:`TwitchAccount` whose live status changed and whether it is now live."""
+    account: TwitchAccount
+    is_live: bool
+
+
+class TwitchLivePoller:
+    r"""
+    Polls the live status of :ref:`TwitchAccount` objects and emits only the changes.
+
+    Usernames are split into chunks of a bounded size and the chunks are checked concurrently with a limit.
+    The result of every account is compared with the status the poller last saw for it, so only offline→live and
+    live→offline transitions are emitted to listeners. The first status seen for an account is only remembered, so
+    accounts that are already live when the poller (re)starts do not notify their channels again. The poller keeps
+    its own statuses, since `is_live` is also set by other checks (ex: :ref:`TwitchAccount.check_live_bulk`).
+    A chunk that fails is logged and its accounts keep their previous status.
+
+    The interval between polls adapts to activity. It shrinks towards `min_interval` while accounts are changing
+    status and grows towards `max_interval` while nothing changes.
+
+    Parameters
+    ----------
+    chunk_size: int
+        The maximum amount of usernames sent in one request.
+    max_concurrency: int
+        The maximum amount of chunks being checked at the same time.
+    interval: float
+        The initial amount of seconds between polls.
+    min_interval: float
+        The minimum amount of seconds between polls.
+    max_interval: float
+        The maximum amount of seconds between polls.
+
+    Attributes
+    ----------
+    chunk_size: int
+        The maximum amount of usernames sent in one request.
+    max_concurrency: int
+        The maximum amount of chunks being checked at the same time.
+    interval: float
+        The current amount of seconds between polls.
+    min_interval: float
+        The minimum amount of seconds between polls.
+    max_interval: float
+        The maximum amount of seconds between polls.
+    last_poll_duration: float
+        The amount of seconds the last poll took.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 100,
+        max_concurrency: int = 4,
+        interval: float = 60.0,
+        min_interval: float = 15.0,
+        max_interval: float = 300.0,
+    ):
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.last_poll_duration: float = 0.0
+        self._listeners: List[Callable[[LiveStatusChange], Union[Awaitable, None]]] = []
+        self._task: Optional[asyncio.Task] = None
+        # the live status the poller last saw for every username.
+        self._statuses: Dict[str, bool] = {}
+
+    def add_listener(
+        self, listener: Callable[[LiveStatusChange], Union[Awaitable, None]]
+    ) -> None:
+        """
+        Add a listener that is called with every :ref:`LiveStatusChange`.
+
+        :param listener: Callable[[:ref:`LiveStatusChange`], Union[Awaitable, None]]
+            A function or coroutine function.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(
+        self, listener: Callable[[LiveStatusChange], Union[Awaitable, None]]
+    ) -> None:
+        """
+        Remove a listener.
+
+        :param listener: Callable[[:ref:`LiveStatusChange`], Union[Awaitable, None]]
+            The function that was added.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def poll(
+        self, accounts: Optional[Iterable[TwitchAccount]] = None
+    ) -> List[LiveStatusChange]:
+        """
+        Check the live status of accounts once and emit the changes.
+
+        :param accounts: Optional[Iterable[:ref:`TwitchAccount`]]
+            The accounts to check. Defaults to every cached :ref:`TwitchAccount`.
+        :returns: List[:ref:`LiveStatusChange`]
+            The accounts that went live or offline since the last check.
+        """
+        start = monotonic()
+        accounts = list(
+            accounts if accounts is not None else await TwitchAccount.get_all()
+        )
+        chunks = [
+            accounts[i : i + self.chunk_size]
+            for i in range(0, len(accounts), self.chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def check_chunk(chunk: List[TwitchAccount]) -> List[LiveStatusChange]:
+            async with semaphore:
+                live_dict = await self._check_chunk(chunk)
+
+            changes = []
+            for account in chunk:
+                if account.id not in live_dict and account.name not in live_dict:
+                    continue  # the chunk failed or the account was not returned, keep the previous status.
+                is_live = bool(live_dict.get(account.id, live_dict.get(account.name)))
+                account.is_live = is_live
+                previous = self._statuses.get(account.id)
+                self._statuses[account.id] = is_live
+                # the first status seen for an account is only remembered, there is nothing to compare with.
+                if previous is not None and is_live != previous:
+                    changes.append(LiveStatusChange(account, is_live))
+            return changes
+
+        changes = [
+            change
+            for chunk_changes in await asyncio.gather(
+                *[check_chunk(chunk) for chunk in chunks]
+            )
+            for change in chunk_changes
+        ]
+
+        self.last_poll_duration = monotonic() - start
+        self._adapt_interval(bool(changes))
+
+        for change in changes:
+            await self._emit(change)
+        return changes
+
+    async def start(self) -> None:
+        """Start polling in the background. Does nothing if the poller is already running."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling in the background."""
+        if not self._task:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the poller is polling in the background."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                outer.client.logger.error(f"Twitch live poll failed - {e}")
+            await asyncio.sleep(max(self.interval - self.last_poll_duration, 0))
+
+    async def _check_chunk(self, chunk: List[TwitchAccount]) -> Dict[str, bool]:
+        try:
+            callback = await basic_call(
+                request={
+                    "route": "twitch/is_live",
+                    "usernames": [account.id for account in chunk],
+                    "method": "GET",
+                }
+            )
+        except Exception as e:
+            # one failed chunk does not fail the other chunks of the poll.
+            outer.client.logger.warning(
+                f"Could not check the live status of {len(chunk)} Twitch accounts - {e}"
+            )
+            return {}
+        results = callback.response.get("results")
+        return results if isinstance(results, dict) else {}
+
+    def _adapt_interval(self, changed: bool) -> None:
+        if changed:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+        # never poll more often than a poll takes.
+        self.interval = max(self.interval, self.last_poll_duration)
+
+    async def _emit(self, change: LiveStatusChange) -> None:
+        for listener in list(self._listeners):
+            try:
+                result = listener(change)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                outer.client.logger.error(
+                    f"A Twitch live listener failed for {change.account.id} - {e}"
+                )
@@ -1,7 +1,7 @@
 import datetime
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     AbstractModel,
@@ -13,7 +13,9 @@ from . import (
     get_difficulty,
     basic_call,
     convert_to_timestamp,
-    convert_to_common_timestring
+    convert_to_common_timestring,
+    game_state_writes,
+    freshness,
 )
 
 
@@ -56,7 +58,7 @@ class UnscrambleGame(AbstractModel):
         mode_id: int,
         difficulty: Difficulty,
         start_date,
-        end_date
+        end_date,
     ):
         super(UnscrambleGame, self).__init__(game_id)
         self.status_ids = status_ids
@@ -88,13 +90,42 @@ class UnscrambleGame(AbstractModel):
 
         return _uss[game_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create UnscrambleGame objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`UnscrambleGame`]
+        """
+        games = []
+        for _dictionary in list_of_dicts:
+            game_id = _dictionary.get("gameid")
+            UnscrambleGame(
+                game_id,
+                _dictionary.get("statusids"),
+                _dictionary.get("modeid"),
+                get_difficulty(_dictionary.get("difficultyid")),
+                convert_to_timestamp(_dictionary.get("startdate")),
+                convert_to_timestamp(_dictionary.get("enddate")),
+            )
+            games.append(_uss[game_id])
+        return games
+
     async def update_status(self, status_ids: List[int]) -> None:
         """
         Update the status ids for the game in the database.
 
+        The update is debounced by the game state :ref:`WriteBehindBuffer`, so a game is synced at most once per
+        interval with its latest state. Use :ref:`flush` to sync immediately.
+
         :return: None
         """
         self.status_ids = status_ids
+        await game_state_writes.stage(("unscramblegame", self.id), self._update_status)
+
+    async def _update_status(self) -> None:
+        """Send the status ids for the game to the database."""
         await basic_call(
             request={
                 "route": "unscramblegame/$us_id",
@@ -104,6 +135,15 @@ class UnscrambleGame(AbstractModel):
             }
         )
 
+    async def flush(self) -> bool:
+        """
+        Sync a pending status update to the database immediately.
+
+        :returns: bool
+            Whether there was a pending update or an update being sent.
+        """
+        return await game_state_writes.flush_key(("unscramblegame", self.id))
+
     async def delete(self) -> None:
         """
         Delete the UnscrambleGame object from the database and remove it from cache.
@@ -120,12 +160,21 @@ class UnscrambleGame(AbstractModel):
         )
         await self._remove_from_cache()
 
+    def _has_staged_writes(self) -> bool:
+        """
+        Check if changes to the UnscrambleGame object are staged and not sent yet.
+
+        :returns: bool
+        """
+        return game_state_writes.is_staged(("unscramblegame", self.id))
+
     async def _remove_from_cache(self) -> None:
         """
         Remove the UnscrambleGame object from cache.
 
         :returns: None
         """
+        game_state_writes.discard(("unscramblegame", self.id))
         _uss.pop(self.id)
 
     @staticmethod
@@ -185,10 +234,7 @@ class UnscrambleGame(AbstractModel):
         :returns: Optional[:ref:`UnscrambleGame`]
             The UnscrambleGame object requested.
         """
-        existing = _uss.get(game_id)
-        if not existing and fetch:
-            return await UnscrambleGame.fetch(game_id)
-        return existing
+        return await freshness.get(UnscrambleGame, _uss, game_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -224,9 +270,12 @@ class UnscrambleGame(AbstractModel):
         """
         Update the end time of the unscramble game.
 
+        Pending state is flushed first, so the final state of the game is in the database when it ends.
+
         :param end_time: datetime.datetime
             Timestamp
         """
+        await self.flush()
         end_timestring = convert_to_common_timestring(end_time)
         return await basic_call(
             request={
@@ -244,8 +293,10 @@ class UnscrambleGame(AbstractModel):
         .. NOTE:: UnscrambleGame objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=UnscrambleGame, request={"route": "unscramblegame", "method": "GET"}
+            obj=UnscrambleGame,
+            request={"route": "unscramblegame", "method": "GET"},
+            bulk=True,
         )
 
 
-_uss: Dict[int, UnscrambleGame] = dict()
+_uss: Dict[int, UnscrambleGame] = ContextDict()
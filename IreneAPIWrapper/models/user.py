@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict, Tuple
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -10,8 +10,14 @@ from . import (
     internal_insert,
     internal_delete,
     basic_call,
+    negative_cache,
+    IdSet,
+    freshness,
 )
 
+# the capability of an API that accepts the changes to a gg filter instead of the whole filter.
+GG_FILTER_DIFF = "gg_filter_diff"
+
 
 class User(AbstractModel):
     def __init__(
@@ -89,54 +95,45 @@ class User(AbstractModel):
 
         :returns: :ref:`User`
         """
-        user_id: int = kwargs.get("userid")
-        is_patron: bool = False or kwargs.get("ispatron")
-        is_super_patron: bool = False or kwargs.get("issuperpatron")
-        is_banned: bool = False or kwargs.get("isbanned")
-        is_mod: bool = False or kwargs.get("ismod")
-        is_data_mod: bool = False or kwargs.get("isdatamod")
-        is_translator: bool = False or kwargs.get("istranslator")
-        is_proofreader: bool = False or kwargs.get("isproofreader")
-        balance = int(kwargs.get("balance")) or 0
-        xp = kwargs.get("xp") or 0
-        access_id = kwargs.get("access")
-        api_access: Optional[Access] = None if access_id is None else Access(access_id)
-
-        gg_filter_active = False or kwargs.get("ggfilteractive")
-        gg_filter_person_ids = kwargs.get("ggfilterpersons") or []
-        gg_filter_group_ids = kwargs.get("ggfiltergroups") or []
-
-        language = "en-US" or kwargs.get("language")
-        lastfm = None or kwargs.get("lastfmusername")
-        timezone = None or kwargs.get("timezone")
-        rob_level = kwargs.get("roblevel") or 0
-        daily_level = kwargs.get("dailylevel") or 0
-        beg_level = kwargs.get("beglevel") or 0
-        profile_level = kwargs.get("profilelevel") or 0
-        User(
-            user_id,
-            is_patron,
-            is_super_patron,
-            is_banned,
-            is_mod,
-            is_data_mod,
-            is_translator,
-            is_proofreader,
-            balance,
-            xp,
-            api_access,
-            gg_filter_active,
-            language,
-            lastfm,
-            timezone,
-            rob_level,
-            daily_level,
-            beg_level,
-            profile_level,
-            gg_filter_person_ids,
-            gg_filter_group_ids,
-        )
-        return _users[user_id]
+        return (await User.create_bulk([kwargs]))[0]
+
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create User objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`User`]
+        """
+        users = []
+        for _dictionary in list_of_dicts:
+            user_id: int = _dictionary.get("userid")
+            access_id = _dictionary.get("access")
+            User(
+                user_id,
+                False or _dictionary.get("ispatron"),
+                False or _dictionary.get("issuperpatron"),
+                False or _dictionary.get("isbanned"),
+                False or _dictionary.get("ismod"),
+                False or _dictionary.get("isdatamod"),
+                False or _dictionary.get("istranslator"),
+                False or _dictionary.get("isproofreader"),
+                int(_dictionary.get("balance") or 0),
+                _dictionary.get("xp") or 0,
+                None if access_id is None else Access(access_id),
+                False or _dictionary.get("ggfilteractive"),
+                "en-US" or _dictionary.get("language"),
+                None or _dictionary.get("lastfmusername"),
+                None or _dictionary.get("timezone"),
+                _dictionary.get("roblevel") or 0,
+                _dictionary.get("dailylevel") or 0,
+                _dictionary.get("beglevel") or 0,
+                _dictionary.get("profilelevel") or 0,
+                _dictionary.get("ggfilterpersons") or [],
+                _dictionary.get("ggfiltergroups") or [],
+            )
+            users.append(_users[user_id])
+        return users
 
     async def set_patron(self, active=True):
         """
@@ -182,35 +179,67 @@ class User(AbstractModel):
             }
         )
 
+    @property
+    def gg_filter_persons(self) -> IdSet:
+        """The person IDs of the gg filter as an :ref:`IdSet` for set algebra."""
+        return IdSet(self.gg_filter_person_ids)
+
+    @property
+    def gg_filter_groups(self) -> IdSet:
+        """The group IDs of the gg filter as an :ref:`IdSet` for set algebra."""
+        return IdSet(self.gg_filter_group_ids)
+
     async def upsert_filter_persons(self, person_ids: Tuple[int]):
         """Upsert persons to the gg filter.
 
+        The whole filter is sent, unless the client negotiated the 'gg_filter_diff' capability with the API.
+        Then only the person ids added to or removed from the current filter are sent.
+
         :param person_ids: Tuple[int]
             A tuple of person ids that the user should have.
         """
-        await basic_call(
-            request={
-                "route": "user/ggfilterpersons/$user_id",
-                "user_id": self.id,
-                "person_ids": person_ids,
-                "method": "POST",
-            }
-        )
+        request = {
+            "route": "user/ggfilterpersons/$user_id",
+            "user_id": self.id,
+            "method": "POST",
+        }
+        if outer.client.supports(GG_FILTER_DIFF):
+            added, removed = self.gg_filter_persons.diff(person_ids)
+            if not added and not removed:
+                return
+            request["added_person_ids"] = added
+            request["removed_person_ids"] = removed
+        else:
+            request["person_ids"] = person_ids
+
+        await basic_call(request=request)
+        self.gg_filter_person_ids = sorted(set(person_ids))
 
     async def upsert_filter_groups(self, group_ids: Tuple[int]):
         """Upsert groups to the gg filter.
 
+        The whole filter is sent, unless the client negotiated the 'gg_filter_diff' capability with the API.
+        Then only the group ids added to or removed from the current filter are sent.
+
         :param group_ids: Tuple[int]
             A tuple of group ids that the user should have.
         """
-        await basic_call(
-            request={
-                "route": "user/ggfiltergroups/$user_id",
-                "user_id": self.id,
-                "group_ids": group_ids,
-                "method": "POST",
-            }
-        )
+        request = {
+            "route": "user/ggfiltergroups/$user_id",
+            "user_id": self.id,
+            "method": "POST",
+        }
+        if outer.client.supports(GG_FILTER_DIFF):
+            added, removed = self.gg_filter_groups.diff(group_ids)
+            if not added and not removed:
+                return
+            request["added_group_ids"] = added
+            request["removed_group_ids"] = removed
+        else:
+            request["group_ids"] = group_ids
+
+        await basic_call(request=request)
+        self.gg_filter_group_ids = sorted(set(group_ids))
 
     async def delete_token(self):
         """
@@ -369,10 +398,7 @@ class User(AbstractModel):
             Whether to fetch from the API if not found in cache.
         :returns: :ref:`User`
         """
-        existing = _users.get(user_id)
-        if not existing and fetch:
-            return await User.fetch(user_id)
-        return existing
+        return await freshness.get(User, _users, user_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -388,7 +414,8 @@ class User(AbstractModel):
     async def fetch(user_id: int):
         """Fetch an updated User object from the API.
 
-        If the user is not in the DB, it will add it.
+        If the user is not in the DB, it will add it once. If the API still does not return the user afterwards,
+        the user is created in cache with the default values of a new user instead of inserting it again.
         .. NOTE:: User objects are added to cache on creation.
 
         :param user_id: int
@@ -398,16 +425,18 @@ class User(AbstractModel):
         if not user_id:
             return None
 
-        obj = await internal_fetch(
-            obj=User,
-            request={"route": "user/$user_id", "user_id": user_id, "method": "GET"},
-        )
-
+        request = {"route": "user/$user_id", "user_id": user_id, "method": "GET"}
+        obj = await internal_fetch(obj=User, request=dict(request))
         if obj:
             return obj
 
         await User.insert(user_id)
-        return await User.fetch(user_id)
+        obj = await internal_fetch(obj=User, request=dict(request))
+        if obj:
+            return obj
+
+        # the insert succeeded, so the user exists with the default values.
+        return await User.create(userid=user_id)
 
     @staticmethod
     async def fetch_all():
@@ -416,8 +445,11 @@ class User(AbstractModel):
         .. NOTE:: User objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            User, request={"route": "user/", "method": "GET"}
+            User, request={"route": "user/", "method": "GET"}, bulk=True
         )
 
 
-_users: Dict[int, User] = dict()
+_users: Dict[int, User] = ContextDict()
+
+# a missing user is inserted instead, so a user is never remembered as missing.
+negative_cache.set_ttl(User, 0)
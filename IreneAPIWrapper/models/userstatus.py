@@ -1,6 +1,6 @@
 from typing import Union, List, Optional, Dict
 
-from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.sections import outer, ContextDict
 from . import (
     CallBack,
     Access,
@@ -10,6 +10,8 @@ from . import (
     internal_insert,
     internal_delete,
     basic_call,
+    write_behind,
+    freshness,
 )
 
 
@@ -61,6 +63,21 @@ class UserStatus(AbstractModel):
 
         return _statuses[status_id]
 
+    @staticmethod
+    async def create_bulk(list_of_dicts: List[dict]):
+        """Bulk create UserStatus objects.
+
+        :param list_of_dicts: List[dict]
+            A list of dictionaries.
+        :returns: List[:ref:`UserStatus`]
+        """
+        statuses = []
+        for _dictionary in list_of_dicts:
+            status_id = _dictionary.get("statusid")
+            UserStatus(status_id, _dictionary.get("userid"), _dictionary.get("score"))
+            statuses.append(_statuses[status_id])
+        return statuses
+
     async def delete(self) -> None:
         """Delete the Status object from the database and remove it from cache.
 
@@ -76,12 +93,24 @@ class UserStatus(AbstractModel):
         )
 
     async def increment(self, by=1):
+        """
+        Increment the score and stage the update to the database.
+
+        :param by: int
+            The amount to increment by.
+        """
         self.score += by
-        await self.update_score()
+        await write_behind.stage(("user_status", self.id), self.update_score)
 
     async def decrement(self, by=1):
+        """
+        Decrement the score and stage the update to the database.
+
+        :param by: int
+            The amount to decrement by.
+        """
         self.score -= by
-        await self.update_score()
+        await write_behind.stage(("user_status", self.id), self.update_score)
 
     async def update_score(self, score: int = None) -> None:
         """
@@ -102,6 +131,14 @@ class UserStatus(AbstractModel):
             }
         )
 
+    def _has_staged_writes(self) -> bool:
+        """
+        Check if changes to the UserStatus object are staged and not sent yet.
+
+        :returns: bool
+        """
+        return write_behind.is_staged(("user_status", self.id))
+
     async def _remove_from_cache(self) -> None:
         """Remove the Status object from cache.
 
@@ -149,10 +186,7 @@ class UserStatus(AbstractModel):
         """
         if not status_id:
             return None
-        existing = _statuses.get(status_id)
-        if not existing and fetch:
-            return await UserStatus.fetch(status_id)
-        return existing
+        return await freshness.get(UserStatus, _statuses, status_id, fetch)
 
     @staticmethod
     async def get_all():
@@ -191,8 +225,10 @@ class UserStatus(AbstractModel):
         .. NOTE::: UserStatus objects are added to cache on creation.
         """
         return await internal_fetch_all(
-            obj=UserStatus, request={"route": "user_status/", "method": "GET"}
+            obj=UserStatus,
+            request={"route": "user_status/", "method": "GET"},
+            bulk=True,
         )
 
 
-_statuses: Dict[int, UserStatus] = dict()
+_statuses: Dict[int, UserStatus] = ContextDict()
@@ -1,13 +1,29 @@
 from typing import TYPE_CHECKING, Optional
 
+from .context import (
+    Context,
+    ContextDict,
+    ContextLocal,
+    default_context,
+    get_context,
+    use_context,
+)
+
 if TYPE_CHECKING:
     from ..models import IreneAPIClient
     from ..models import CallBack
 
 
 class InteractiveClient:
-    def __init__(self):
-        self.client: Optional[IreneAPIClient] = None
+    """The client of the current :ref:`Context`."""
+
+    @property
+    def client(self) -> Optional["IreneAPIClient"]:
+        return get_context().client
+
+    @client.setter
+    def client(self, value: Optional["IreneAPIClient"]):
+        get_context().client = value
 
 
 outer = InteractiveClient()
@@ -0,0 +1,215 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from ..models import IreneAPIClient
+
+
+class Context:
+    r"""
+    The client and the model caches used by the static methods of the models.
+
+    Every model keeps its cache, and state such as the entries of the :ref:`NegativeCache` and the pending writes of
+    the :ref:`WriteBehindBuffer` objects, in the current context. Configuration (ex: TTLs and freshness policies)
+    is shared by every context. An application with one client only uses the default context and never needs
+    to know about contexts. Several clients (ex: a staging and a production API, or isolated tests) each get their
+    own context, and code using a client runs inside its context with :func:`use_context`.
+
+    Tasks copy the current context when they are created, so tasks started inside a context keep using it.
+    The caches of a context are freed with :ref:`clear`, or once nothing references the context.
+
+    Attributes
+    ----------
+    client: Optional[:ref:`IreneAPIClient`]
+        The client of the context. It is set when a client is created with the context.
+    """
+
+    def __init__(self):
+        self.client: Optional["IreneAPIClient"] = None
+        self._values: Dict[object, Any] = {}
+
+    def clear(self) -> None:
+        """
+        Free every cache of the context. They start empty the next time they are used.
+
+        Writes still pending in the :ref:`WriteBehindBuffer` objects of the context are dropped, so they should be
+        flushed first.
+        """
+        self._values.clear()
+
+
+class ContextLocal:
+    r"""
+    A module-level object (ex: a :ref:`WriteBehindBuffer`) with a separate value in every :ref:`Context`.
+
+    Attributes are forwarded to the value of the current context, which is created with `factory` the first time it
+    is used in that context. Caches that are read constantly use :ref:`ContextDict` instead, which is faster.
+
+    Parameters
+    ----------
+    factory: Callable
+        Creates the value of a context.
+    args:
+        The arguments of the factory.
+    kwargs:
+        The keyword arguments of the factory.
+    """
+
+    __slots__ = ("_factory", "_args", "_kwargs")
+
+    def __init__(self, factory: Callable, *args, **kwargs):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_args", args)
+        object.__setattr__(self, "_kwargs", kwargs)
+
+    def resolve(self) -> Any:
+        """
+        Get the value of the current context.
+
+        :returns: Any
+        """
+        values = _current.get()._values
+        try:
+            return values[self]
+        except KeyError:
+            value = values[self] = self._factory(*self._args, **self._kwargs)
+            return value
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+    def __repr__(self):
+        return f"ContextLocal({self.resolve()!r})"
+
+
+class ContextDict:
+    r"""
+    A dictionary with separate contents in every :ref:`Context` (ex: the cache of a model).
+
+    It supports the methods of a dictionary, which act on the dictionary of the current context.
+    """
+
+    __slots__ = ()
+
+    def resolve(self) -> dict:
+        """
+        Get the dictionary of the current context.
+
+        :returns: dict
+        """
+        values = _current.get()._values
+        try:
+            return values[self]
+        except KeyError:
+            value = values[self] = {}
+            return value
+
+    # the methods used on every cache read and write look up the dictionary inline, as a call to resolve()
+    # costs about as much as the dictionary operation itself.
+    def get(self, key, default=None):
+        try:
+            return _current.get()._values[self].get(key, default)
+        except KeyError:
+            return self.resolve().get(key, default)
+
+    def __getitem__(self, key):
+        try:
+            cache = _current.get()._values[self]
+        except KeyError:
+            cache = self.resolve()
+        return cache[key]
+
+    def __setitem__(self, key, value):
+        try:
+            cache = _current.get()._values[self]
+        except KeyError:
+            cache = self.resolve()
+        cache[key] = value
+
+    def __contains__(self, key):
+        try:
+            cache = _current.get()._values[self]
+        except KeyError:
+            return False
+        return key in cache
+
+    def __delitem__(self, key):
+        del self.resolve()[key]
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __len__(self):
+        return len(self.resolve())
+
+    def __bool__(self):
+        return bool(self.resolve())
+
+    def __repr__(self):
+        return f"ContextDict({self.resolve()!r})"
+
+    def pop(self, *args):
+        return self.resolve().pop(*args)
+
+    def popitem(self):
+        return self.resolve().popitem()
+
+    def setdefault(self, key, default=None):
+        return self.resolve().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self.resolve().update(*args, **kwargs)
+
+    def clear(self):
+        self.resolve().clear()
+
+    def copy(self) -> dict:
+        return self.resolve().copy()
+
+    def keys(self):
+        return self.resolve().keys()
+
+    def values(self):
+        return self.resolve().values()
+
+    def items(self):
+        return self.resolve().items()
+
+
+default_context = Context()
+_current: ContextVar[Context] = ContextVar("context", default=default_context)
+
+
+def get_context() -> Context:
+    """
+    Get the current context.
+
+    :returns: :ref:`Context`
+    """
+    return _current.get()
+
+
+@contextmanager
+def use_context(context: Context) -> Iterator[Context]:
+    """
+    Use a context in the current task (and the tasks it creates) until the block ends.
+
+    .. code-block:: python
+
+        staging = Context()
+        client = IreneAPIClient(token, user_id, api_url="staging.example", context=staging)
+        with use_context(staging):
+            person = await Person.get(1)
+
+    :param context: :ref:`Context`
+        The context to use.
+    """
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
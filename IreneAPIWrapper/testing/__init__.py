@@ -0,0 +1,8 @@
+"""
+Offline stand-ins for the IreneAPI, for integration tests and benchmarks.
+
+This package is not imported by :mod:`IreneAPIWrapper` and must be imported on its own.
+"""
+from .dataset import Dataset, LOAD_ORDER, sample_dataset, generate_dataset, load_dataset
+from .server import Resource, RESOURCES, StandInServer
+from .case import StandInTestCase
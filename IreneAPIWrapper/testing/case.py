@@ -0,0 +1,149 @@
+import asyncio
+from typing import Any, Dict, Optional
+from unittest import IsolatedAsyncioTestCase
+
+from IreneAPIWrapper.models import Context, IreneAPIClient, Preload
+from .dataset import Dataset, sample_dataset
+from .server import StandInServer
+
+
+class StandInTestCase(IsolatedAsyncioTestCase):
+    r"""
+    A test case with a :ref:`StandInServer` and an :ref:`IreneAPIClient` connected to it.
+
+    Every test gets its own server and its own :ref:`Context` for the client, so nothing a test caches or changes
+    leaks into the default context or into other tests. Code using the client runs inside
+    `use_context(self.context)`.
+
+    The server, client, and connection are set up by :ref:`asyncSetUp` and closed after :ref:`asyncTearDown`.
+    Nothing is preloaded unless :ref:`get_preload` is overridden.
+
+    Attributes
+    ----------
+    server_options: Dict[str, Any]
+        The keyword arguments of the :ref:`StandInServer` (ex: latency).
+    client_options: Dict[str, Any]
+        The keyword arguments of the :ref:`IreneAPIClient` (ex: limiter).
+    connect_on_setup: bool
+        Whether the client connects during the setup. Tests connect it with :ref:`connect` otherwise.
+    wait_until_ready: bool
+        Whether connecting waits for every preload instead of only the connection.
+    server: :ref:`StandInServer`
+        The server of the test.
+    context: :ref:`Context`
+        The context of the client.
+    client: :ref:`IreneAPIClient`
+        The client of the test.
+    connection: Optional[asyncio.Task]
+        The task running the connection of the client of the test, once it was started.
+    """
+
+    server_options: Dict[str, Any] = {}
+    client_options: Dict[str, Any] = {}
+    connect_on_setup = True
+    wait_until_ready = False
+
+    async def asyncSetUp(self):
+        self.context = Context()
+        self.server = await self.start_server()
+        self.client = self.create_client()
+        self.connection: Optional[asyncio.Task] = None
+        if self.connect_on_setup:
+            await self.connect()
+
+    def get_dataset(self) -> Dataset:
+        """Get the dataset the server of the test starts with."""
+        return sample_dataset()
+
+    def get_preload(self) -> Preload:
+        """Get what the client preloads. Nothing by default."""
+        preload = Preload()
+        preload.all_false()
+        return preload
+
+    async def start_server(
+        self, dataset: Optional[Dataset] = None, **options
+    ) -> StandInServer:
+        """
+        Start a server that is stopped when the test ends.
+
+        :param dataset: Optional[Dataset]
+            The dataset of the server. Defaults to :ref:`get_dataset`.
+        :param options:
+            Keyword arguments of the :ref:`StandInServer` that replace the `server_options`.
+        :returns: :ref:`StandInServer`
+        """
+        server = StandInServer(
+            self.get_dataset() if dataset is None else dataset,
+            token="test",
+            **dict(self.server_options, **options),
+        )
+        await server.start()
+        self.addAsyncCleanup(server.stop)
+        return server
+
+    def create_client(
+        self,
+        server: Optional[StandInServer] = None,
+        context: Optional[Context] = None,
+        **options
+    ) -> IreneAPIClient:
+        """
+        Create a client of a server without connecting it.
+
+        :param server: Optional[:ref:`StandInServer`]
+            The server to connect to. Defaults to the server of the test.
+        :param context: Optional[:ref:`Context`]
+            The context of the client. Defaults to the context of the test.
+        :param options:
+            Keyword arguments of the :ref:`IreneAPIClient` that replace the `client_options`.
+        :returns: :ref:`IreneAPIClient`
+        """
+        return IreneAPIClient(
+            "test",
+            1,
+            api_url="127.0.0.1",
+            port=(server or self.server).port,
+            preload_cache=self.get_preload(),
+            context=context or self.context,
+            **dict(self.client_options, **options),
+        )
+
+    def start_connection(self, client: Optional[IreneAPIClient] = None) -> asyncio.Task:
+        """
+        Start connecting a client in the background. The connection is closed when the test ends.
+
+        :param client: Optional[:ref:`IreneAPIClient`]
+            The client to connect. Defaults to the client of the test.
+        :returns: asyncio.Task
+            The task running the connection.
+        """
+        client = client or self.client
+        connection = asyncio.get_running_loop().create_task(client.connect())
+        self.addAsyncCleanup(self._disconnect, client, connection)
+        if client is self.client:
+            self.connection = connection
+        return connection
+
+    async def connect(self, client: Optional[IreneAPIClient] = None) -> None:
+        """
+        Connect a client and wait until it is connected (or ready, with `wait_until_ready`).
+
+        :param client: Optional[:ref:`IreneAPIClient`]
+            The client to connect. Defaults to the client of the test.
+        """
+        client = client or self.client
+        self.start_connection(client)
+        waiting = (
+            client.ready_all()
+            if self.wait_until_ready
+            else client.wait_until_connected()
+        )
+        await asyncio.wait_for(waiting, 10)
+
+    @staticmethod
+    async def _disconnect(client: IreneAPIClient, connection: asyncio.Task) -> None:
+        connection.cancel()
+        await asyncio.gather(connection, return_exceptions=True)
+        if client._ws_client:
+            await client._ws_client.close()
@@ -0,0 +1,525 @@
+from bisect import bisect
+from datetime import datetime, timedelta
+from itertools import accumulate
+from json import dumps
+from random import Random
+from typing import Any, Dict, List, Optional
+
+Dataset = Dict[str, Dict[Any, dict]]
+
+# the tables in the order their models can be created in, so that every reference is already cached.
+LOAD_ORDER = [
+    ("tag", "Tag"),
+    ("name", "Name"),
+    ("display", "Display"),
+    ("location", "Location"),
+    ("social", "Social"),
+    ("position", "Position"),
+    ("company", "Company"),
+    ("personalias", "PersonAlias"),
+    ("groupalias", "GroupAlias"),
+    ("person", "Person"),
+    ("group", "Group"),
+    ("affiliation", "Affiliation"),
+    ("media", "Media"),
+    ("user", "User"),
+    ("guild", "Guild"),
+    ("channel", "Channel"),
+    ("twitch", "TwitchAccount"),
+    ("language", "Language"),
+]
+
+
+def sample_dataset() -> Dataset:
+    """
+    Get a small dataset covering the main tables of the API.
+
+    Rows are in the format the models' `create` methods consume, keyed by their ID.
+
+    :returns: Dict[str, Dict[Any, dict]]
+        The rows of every table by their ID.
+    """
+    timestamp = "Sun, 06 Nov 1994 00:00:00 GMT"
+    return {
+        "tag": {1: {"tagid": 1, "name": "Vocalist"}, 2: {"tagid": 2, "name": "Dancer"}},
+        "name": {
+            1: {"nameid": 1, "firstname": "Joohyun", "lastname": "Bae"},
+            2: {"nameid": 2, "firstname": "Seulgi", "lastname": "Kang"},
+        },
+        "display": {
+            1: {
+                "displayid": 1,
+                "avatar": "https://example.com/avatar.png",
+                "banner": None,
+            }
+        },
+        "location": {1: {"locationid": 1, "country": "South Korea", "city": "Daegu"}},
+        "social": {1: {"socialid": 1, "twitter": "redvelvet"}},
+        "position": {
+            1: {"positionid": 1, "name": "Leader"},
+            2: {"positionid": 2, "name": "Main Dancer"},
+        },
+        "company": {
+            1: {
+                "companyid": 1,
+                "name": "SM Entertainment",
+                "description": None,
+                "startdate": timestamp,
+                "enddate": None,
+            },
+        },
+        "person": {
+            1: {
+                "personid": 1,
+                "nameid": 1,
+                "displayid": 1,
+                "socialid": 1,
+                "locationid": 1,
+                "gender": "F",
+                "description": "A person.",
+                "height": 158,
+                "callcount": 0,
+                "mediacount": 2,
+                "tagids": [1],
+                "aliasids": [1],
+                "birthdate": timestamp,
+                "deathdate": None,
+                "bloodtype": "A",
+            },
+            2: {
+                "personid": 2,
+                "nameid": 2,
+                "displayid": 1,
+                "socialid": None,
+                "locationid": None,
+                "gender": "F",
+                "description": "A person.",
+                "height": 163,
+                "callcount": 0,
+                "mediacount": 2,
+                "tagids": [1, 2],
+                "aliasids": [],
+                "birthdate": timestamp,
+                "deathdate": None,
+                "bloodtype": "B",
+            },
+        },
+        "personalias": {
+            1: {"aliasid": 1, "alias": "Irene", "personid": 1, "guildid": None}
+        },
+        "group": {
+            1: {
+                "groupid": 1,
+                "name": "Red Velvet",
+                "description": "A group.",
+                "companyid": 1,
+                "displayid": 1,
+                "website": "https://example.com",
+                "socialid": 1,
+                "mediacount": 4,
+                "tagids": [],
+                "aliasids": [1],
+                "debutdate": timestamp,
+                "disbanddate": None,
+            },
+        },
+        "groupalias": {1: {"aliasid": 1, "alias": "RV", "groupid": 1, "guildid": None}},
+        "affiliation": {
+            1: {
+                "affiliationid": 1,
+                "personid": 1,
+                "groupid": 1,
+                "positionids": [1],
+                "stagename": "Irene",
+            },
+            2: {
+                "affiliationid": 2,
+                "personid": 2,
+                "groupid": 1,
+                "positionids": [2],
+                "stagename": "Seulgi",
+            },
+        },
+        "media": {
+            media_id: {
+                "mediaid": media_id,
+                "link": f"https://example.com/{media_id}.png",
+                "faces": 1,
+                "filetype": "png",
+                "affiliationid": 1 + media_id % 2,
+                "enabled": True,
+                "nsfw": False,
+                "failed": media_id,
+                "correct": 10 - media_id,
+            }
+            for media_id in range(1, 5)
+        },
+        "user": {
+            1: {
+                "userid": 1,
+                "balance": 100,
+                "xp": 0,
+                "ggfilteractive": False,
+                "ggfilterpersons": [],
+                "ggfiltergroups": [],
+            },
+        },
+        "guild": {1: {"guildid": 1, "name": "Guild", "prefixes": ["%"]}},
+        "channel": {1: {"channelid": 1, "guildid": 1}},
+        "twitch": {
+            1: {
+                "username": "redvelvet",
+                "channelid": 1,
+                "guildid": 1,
+                "roleid": None,
+                "posted": False,
+            }
+        },
+    }
+
+
+class _Zipf:
+    """Draws ranks 0 to n - 1 where rank k is drawn in proportion to 1 / (k + 1) ** exponent."""
+
+    def __init__(self, n: int, exponent: float):
+        self.n = n
+        self.cum_weights = list(
+            accumulate(1 / (rank + 1) ** exponent for rank in range(n))
+        )
+
+    def draw(self, rng: Random) -> int:
+        return min(
+            bisect(self.cum_weights, rng.random() * self.cum_weights[-1]), self.n - 1
+        )
+
+
+def _timestamp(rng: Random, start_year: int, end_year: int) -> str:
+    start = datetime(start_year, 1, 1)
+    days = (datetime(end_year, 1, 1) - start).days
+    return (start + timedelta(days=rng.randrange(days))).strftime(
+        "%a, %d %b %Y %H:%M:%S GMT"
+    )
+
+
+def _skewed_count(rng: Random, alpha: float, maximum: int) -> int:
+    """A count that is usually 0 or 1 with a long tail up to the maximum."""
+    return min(int(rng.paretovariate(alpha)) - 1, maximum)
+
+
+def generate_dataset(
+    seed: int = 0,
+    persons: int = 30000,
+    groups: int = 8000,
+    media: int = 500000,
+    users: int = 10000,
+    guilds: int = 2000,
+    tags: int = 200,
+    languages: int = 5,
+    messages: int = 300,
+) -> Dataset:
+    """
+    Generate a dataset shaped like production data.
+
+    The same seed and sizes always generate the same rows, in the format the models' `create` methods consume.
+    The distributions are skewed like real data:
+
+    - Most persons have zero or one alias, and a few have many.
+    - Group sizes follow a Zipf distribution, so a few groups have many members.
+    - Some persons belong to several groups (and a few to none).
+    - Media follows a Zipf distribution over affiliations, so popular idols have most of the media.
+
+    The dataset can be loaded into the models with :func:`load_dataset` or back a :ref:`StandInServer`.
+
+    :param seed: int
+        The seed of the generator.
+    :param persons: int
+        The amount of persons.
+    :param groups: int
+        The amount of groups.
+    :param media: int
+        The amount of media.
+    :param users: int
+        The amount of users.
+    :param guilds: int
+        The amount of guilds.
+    :param tags: int
+        The amount of tags.
+    :param languages: int
+        The amount of languages.
+    :param messages: int
+        The amount of pack messages per language.
+    :returns: Dict[str, Dict[Any, dict]]
+        The rows of every table by their ID.
+    """
+    rng = Random(seed)
+    dataset: Dataset = {table: {} for table, _ in LOAD_ORDER}
+
+    dataset["tag"] = {
+        tag_id: {"tagid": tag_id, "name": f"Tag {tag_id}"}
+        for tag_id in range(1, tags + 1)
+    }
+    dataset["position"] = {
+        position_id: {"positionid": position_id, "name": name}
+        for position_id, name in enumerate(
+            [
+                "Leader",
+                "Main Vocalist",
+                "Main Dancer",
+                "Main Rapper",
+                "Visual",
+                "Maknae",
+            ],
+            start=1,
+        )
+    }
+    dataset["location"] = {
+        location_id: {
+            "locationid": location_id,
+            "country": f"Country {location_id % 20}",
+            "city": f"City {location_id}",
+        }
+        for location_id in range(1, 501)
+    }
+    dataset["company"] = {
+        company_id: {
+            "companyid": company_id,
+            "name": f"Company {company_id}",
+            "description": None,
+            "startdate": _timestamp(rng, 1990, 2020),
+            "enddate": None,
+        }
+        for company_id in range(1, max(groups // 20, 1) + 1)
+    }
+
+    names = dataset["name"]
+    displays = dataset["display"]
+    socials = dataset["social"]
+
+    def add_name() -> int:
+        name_id = len(names) + 1
+        names[name_id] = {
+            "nameid": name_id,
+            "firstname": f"First{name_id}",
+            "lastname": f"Last{name_id % 300}",
+        }
+        return name_id
+
+    def add_display() -> int:
+        display_id = len(displays) + 1
+        displays[display_id] = {
+            "displayid": display_id,
+            "avatar": f"https://example.com/avatar/{display_id}.png",
+            "banner": f"https://example.com/banner/{display_id}.png",
+        }
+        return display_id
+
+    def add_social() -> int:
+        social_id = len(socials) + 1
+        socials[social_id] = {
+            "socialid": social_id,
+            "twitter": f"account{social_id}",
+            "instagram": f"account{social_id}",
+            "youtube": None,
+            "vlive": None,
+            "fancafe": None,
+            "facebook": None,
+            "melon": None,
+            "tiktok": None,
+            "spotify": None,
+        }
+        return social_id
+
+    def get_tag_ids() -> List[int]:
+        return sorted(rng.sample(range(1, tags + 1), min(rng.randrange(4), tags)))
+
+    person_aliases = dataset["personalias"]
+    for person_id in range(1, persons + 1):
+        alias_ids = []
+        for _ in range(_skewed_count(rng, 1.5, 30)):
+            alias_id = len(person_aliases) + 1
+            person_aliases[alias_id] = {
+                "aliasid": alias_id,
+                "alias": f"p{person_id}a{alias_id}",
+                "personid": person_id,
+                "guildid": None,
+            }
+            alias_ids.append(alias_id)
+
+        dataset["person"][person_id] = {
+            "personid": person_id,
+            "nameid": add_name(),
+            "displayid": add_display(),
+            "socialid": add_social(),
+            "locationid": rng.randrange(1, 501),
+            "gender": rng.choice("MF"),
+            "description": None,
+            "height": rng.randrange(150, 190),
+            "callcount": _skewed_count(rng, 0.8, 100000),
+            "mediacount": 0,
+            "tagids": get_tag_ids(),
+            "aliasids": alias_ids,
+            "birthdate": _timestamp(rng, 1960, 2010),
+            "deathdate": None,
+            "bloodtype": rng.choice(["A", "B", "AB", "O"]),
+        }
+
+    group_aliases = dataset["groupalias"]
+    for group_id in range(1, groups + 1):
+        alias_ids = []
+        for _ in range(_skewed_count(rng, 2.0, 10)):
+            alias_id = len(group_aliases) + 1
+            group_aliases[alias_id] = {
+                "aliasid": alias_id,
+                "alias": f"g{group_id}a{alias_id}",
+                "groupid": group_id,
+                "guildid": None,
+            }
+            alias_ids.append(alias_id)
+
+        dataset["group"][group_id] = {
+            "groupid": group_id,
+            "name": f"Group {group_id}",
+            "description": None,
+            "companyid": rng.randrange(1, len(dataset["company"]) + 1),
+            "displayid": add_display(),
+            "website": None,
+            "socialid": add_social(),
+            "mediacount": 0,
+            "tagids": get_tag_ids(),
+            "aliasids": alias_ids,
+            "debutdate": _timestamp(rng, 1995, 2023),
+            "disbanddate": None,
+        }
+
+    # popular groups have many members, and most persons are in one group.
+    group_ranks = _Zipf(groups, 1.1) if groups else None
+    affiliations = dataset["affiliation"]
+    for person_id in range(1, persons + 1):
+        if not groups:
+            break
+        group_ids = {
+            group_ranks.draw(rng) + 1
+            for _ in range(_skewed_count(rng, 2.5, 4) + (rng.random() > 0.05))
+        }
+        for group_id in sorted(group_ids):
+            affiliation_id = len(affiliations) + 1
+            affiliations[affiliation_id] = {
+                "affiliationid": affiliation_id,
+                "personid": person_id,
+                "groupid": group_id,
+                "positionids": sorted(rng.sample(range(1, 7), rng.randrange(1, 3))),
+                "stagename": f"Stage{person_id}",
+            }
+
+    if affiliations:
+        affiliation_ranks = _Zipf(len(affiliations), 0.9)
+        # ranks are shuffled so that popularity does not follow the order of the IDs.
+        affiliation_ids = list(affiliations)
+        rng.shuffle(affiliation_ids)
+        for media_id in range(1, media + 1):
+            affiliation = affiliations[affiliation_ids[affiliation_ranks.draw(rng)]]
+            correct = _skewed_count(rng, 0.7, 5000)
+            dataset["media"][media_id] = {
+                "mediaid": media_id,
+                "link": f"https://example.com/media/{media_id}.png",
+                "faces": rng.choice((1, 1, 1, 2, 3)),
+                "filetype": rng.choice(("png", "jpg", "gif", "mp4")),
+                "affiliationid": affiliation["affiliationid"],
+                "enabled": rng.random() > 0.02,
+                "nsfw": rng.random() < 0.01,
+                "correct": correct,
+                "failed": _skewed_count(rng, 0.7, 5000),
+            }
+            dataset["person"][affiliation["personid"]]["mediacount"] += 1
+            dataset["group"][affiliation["groupid"]]["mediacount"] += 1
+
+    for user_id in range(1, users + 1):
+        dataset["user"][user_id] = {
+            "userid": user_id,
+            "balance": _skewed_count(rng, 0.5, 10**9),
+            "xp": rng.randrange(100000),
+            "ispatron": rng.random() < 0.01,
+            "ggfilteractive": rng.random() < 0.1,
+            "ggfilterpersons": sorted(
+                rng.sample(range(1, persons + 1), min(rng.randrange(5), persons))
+            ),
+            "ggfiltergroups": sorted(
+                rng.sample(range(1, groups + 1), min(rng.randrange(3), groups))
+            ),
+        }
+
+    for guild_id in range(1, guilds + 1):
+        dataset["guild"][guild_id] = {
+            "guildid": guild_id,
+            "name": f"Guild {guild_id}",
+            "ownerid": rng.randrange(1, users + 1) if users else None,
+            "membercount": _skewed_count(rng, 0.5, 10**6),
+            "prefixes": ["%"] if rng.random() < 0.9 else [],
+        }
+        for _ in range(rng.randrange(1, 4)):
+            channel_id = len(dataset["channel"]) + 1
+            dataset["channel"][channel_id] = {
+                "channelid": channel_id,
+                "guildid": guild_id,
+            }
+
+    channel_ids = list(dataset["channel"])
+    for username_id in range(1, max(guilds // 10, 1) + 1):
+        for channel_id in sorted(
+            rng.sample(
+                channel_ids, min(_skewed_count(rng, 1.2, 50) + 1, len(channel_ids))
+            )
+        ):
+            row_id = len(dataset["twitch"]) + 1
+            dataset["twitch"][row_id] = {
+                "username": f"streamer{username_id}",
+                "channelid": channel_id,
+                "guildid": dataset["channel"][channel_id]["guildid"],
+                "roleid": None,
+                "posted": False,
+            }
+
+    for language_id in range(1, languages + 1):
+        pack = [
+            {
+                "languageid": language_id,
+                "label": f"label_{message_id}",
+                "message": f"Message {message_id} in language {language_id} for :1$user$1:.",
+            }
+            for message_id in range(1, messages + 1)
+        ]
+        dataset["language"][language_id] = {
+            "languageid": language_id,
+            "shortname": f"l{language_id}",
+            "name": f"Language {language_id}",
+            "pack": dumps(pack),
+        }
+    return dataset
+
+
+async def load_dataset(
+    dataset: Dataset, tables: Optional[List[str]] = None
+) -> Dict[str, int]:
+    """
+    Create model objects from a dataset without a connection.
+
+    Tables are created in :data:`LOAD_ORDER` with the models' `create_bulk`, so every reference is resolved from
+    cache. The dataset must not reference rows it does not have.
+
+    :param dataset: Dict[str, Dict[Any, dict]]
+        The rows of every table by their ID.
+    :param tables: Optional[List[str]]
+        The tables to load. Defaults to every table.
+    :returns: Dict[str, int]
+        The amount of objects created by table.
+    """
+    from IreneAPIWrapper import models
+
+    created = {}
+    for table, model_name in LOAD_ORDER:
+        rows = dataset.get(table)
+        if not rows or (tables is not None and table not in tables):
+            continue
+        objects = await getattr(models, model_name).create_bulk(list(rows.values()))
+        created[table] = len(objects or [])
+    return created
@@ -0,0 +1,506 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web, WSMsgType
+
+
+@dataclass(frozen=True)
+class Resource:
+    r"""
+    A route root of the API backed by a table of the stand-in dataset.
+
+    Parameters
+    ----------
+    table: str
+        The name of the table in the dataset.
+    id_key: str
+        The key of a row that the route IDs refer to.
+    insert_key: Optional[str]
+        The key the API returns a new ID under after an insert. Defaults to the `id_key`.
+    """
+
+    table: str
+    id_key: str
+    insert_key: Optional[str] = None
+
+
+# the route roots used by the models and the rows they refer to (in the format the `create` methods consume).
+RESOURCES: Dict[str, Resource] = {
+    "8ball": Resource("8ball", "responseid"),
+    "affiliation": Resource("affiliation", "affiliationid"),
+    "banphrases": Resource("banphrases", "phraseid", "addbanphrase"),
+    "channel": Resource("channel", "channelid"),
+    "company": Resource("company", "companyid"),
+    "display": Resource("display", "displayid"),
+    "fandom": Resource("fandom", "groupid"),
+    "group": Resource("group", "groupid"),
+    "groupalias": Resource("groupalias", "aliasid", "t_alias_id"),
+    "guessinggame": Resource("guessinggame", "gameid", "addgg"),
+    "guild": Resource("guild", "guildid"),
+    "interactions": Resource("interactions", "typeid"),
+    "language": Resource("language", "languageid"),
+    "location": Resource("location", "locationid"),
+    "media": Resource("media", "mediaid"),
+    "name": Resource("name", "nameid"),
+    "noti": Resource("noti", "notiid", "addnotification"),
+    "person": Resource("person", "personid"),
+    "personalias": Resource("personalias", "aliasid", "t_alias_id"),
+    "position": Resource("position", "positionid"),
+    "reaction_roles": Resource("reaction_roles", "messageid"),
+    "reminder": Resource("reminder", "id", "addreminder"),
+    "social": Resource("social", "socialid"),
+    "tag": Resource("tag", "tagid"),
+    "tiktok": Resource("tiktok", "username"),
+    "twitch": Resource("twitch", "username"),
+    "unscramblegame": Resource("unscramblegame", "gameid", "addus"),
+    "user": Resource("user", "userid"),
+    "user_status": Resource("user_status", "statusid", "adduserstatus"),
+}
+
+# request keys that are not parameters.
+_PROTOCOL_KEYS = ("route", "method", "callback_id")
+
+Handler = Callable[["StandInServer", dict], dict]
+
+
+class StandInServer:
+    r"""
+    A local stand-in for the IreneAPI websocket server.
+
+    It speaks the same protocol as the API: every JSON message has a `route`, a `method`, a `callback_id`, and the
+    route parameters, and every response has the same `callback_id` and the `results` (or an `error`).
+    Requests are answered concurrently, so responses may arrive in a different order than their requests.
+
+    The API is backed by an in-memory dataset of tables with rows in the same format the models' `create`
+    methods consume. The routes of every :ref:`Resource` support fetching all rows (GET on the root), fetching a
+    row (GET on `root/$id`), inserting (POST on the root), updating (POST/PUT on `root/$id`), and deleting
+    (DELETE on `root/$id`). Routes with their own response formats (ex: random media or Twitch live statuses)
+    have their own handlers. Anything else succeeds without results.
+
+    It runs entirely offline and is meant for integration tests and benchmarks.
+
+    Parameters
+    ----------
+    dataset: Optional[Dict[str, Dict[Any, dict]]]
+        The rows of every table by their ID. Tables that are not given are empty.
+    host: str
+        The host to listen on.
+    port: int
+        The port to listen on. 0 picks a free port.
+    token: Optional[str]
+        The token a client must send. Any token is accepted if None.
+    latency: float
+        The amount of seconds every response is delayed by.
+    jitter: float
+        A random amount of seconds (up to `jitter`) added to the latency of every response.
+    error_rate: float
+        The probability (0 to 1) of answering a request with an error.
+    seed: Optional[int]
+        The seed of the jitter and errors, for reproducible runs.
+
+    Attributes
+    ----------
+    dataset: Dict[str, Dict[Any, dict]]
+        The rows of every table by their ID.
+    latency: float
+        The amount of seconds every response is delayed by.
+    jitter: float
+        A random amount of seconds (up to `jitter`) added to the latency of every response.
+    error_rate: float
+        The probability (0 to 1) of answering a request with an error.
+    route_errors: Dict[str, str]
+        Errors to always answer with by route (ex: {'person/$person_id': 'Internal Server Error'}).
+    live: set
+        The Twitch usernames that are live.
+    latest_videos: Dict[str, int]
+        The latest TikTok video ID by username.
+    requests: Dict[Tuple[str, str], int]
+        The amount of requests received by route and method.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[Dict[str, Dict[Any, dict]]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: Optional[str] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.dataset: Dict[str, Dict[Any, dict]] = {
+            resource.table: {} for resource in RESOURCES.values()
+        }
+        self.dataset.update(dataset or {})
+        self.host = host
+        self.port = port
+        self.token = token
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.route_errors: Dict[str, str] = {}
+        self.live: set = set()
+        self.latest_videos: Dict[str, int] = {}
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self._random = Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._handlers: Dict[Tuple[str, str], Handler] = dict(_HANDLERS)
+        self._sockets: set = set()
+
+    @property
+    def url(self) -> str:
+        """The websocket URL of the server."""
+        return f"ws://{self.host}:{self.port}/ws"
+
+    def add_handler(self, route: str, method: str, handler: Handler) -> None:
+        """
+        Answer a route with a custom handler.
+
+        :param route: str
+            The route (ex: 'person/$person_id').
+        :param method: str
+            The request method (ex: 'GET').
+        :param handler: Callable[[:ref:`StandInServer`, dict], dict]
+            Gets the server and the request, and returns the response (ex: {'results': ...}).
+        """
+        self._handlers[(route.strip("/"), method.upper())] = handler
+
+    async def start(self) -> "StandInServer":
+        """Start listening. The chosen port is available in `port` afterwards."""
+        app = web.Application()
+        app.router.add_get("/ws", self._handle_websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        """Stop listening and close every connection."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def drop_connections(self) -> None:
+        """Close every open connection without answering the requests in progress, as if the connections were lost."""
+        for ws in list(self._sockets):
+            await ws.close()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        if (
+            self.token is not None
+            and request.headers.get("Authorization") != f"Bearer {self.token}"
+        ):
+            raise web.HTTPUnauthorized()
+
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        pending = set()
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                task = asyncio.get_running_loop().create_task(
+                    self._respond(ws, json.loads(message.data))
+                )
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            self._sockets.discard(ws)
+            for task in pending:
+                task.cancel()
+        return ws
+
+    async def _respond(self, ws: web.WebSocketResponse, request: dict) -> None:
+        delay = self.latency + (
+            self._random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay:
+            await asyncio.sleep(delay)
+
+        response = {"callback_id": request.get("callback_id")}
+        try:
+            response.update(self.handle(request))
+        except Exception as e:
+            response["error"] = f"{e.__class__.__name__}: {e}"
+
+        if not ws.closed:
+            await ws.send_str(json.dumps(response, default=str))
+
+    def handle(self, request: dict) -> dict:
+        """
+        Answer a request without a connection.
+
+        :param request: dict
+            The request a client would send.
+        :returns: dict
+            The response without the callback ID.
+        """
+        route = (request.get("route") or "").strip("/")
+        method = (request.get("method") or "GET").upper()
+        key = (route, method)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        error = self.route_errors.get(route)
+        if (
+            error is None
+            and self.error_rate
+            and self._random.random() < self.error_rate
+        ):
+            error = "Injected error."
+        if error is not None:
+            return {"error": error}
+
+        handler = self._handlers.get(key)
+        if handler is not None:
+            return handler(self, request)
+        return {"results": self._handle_resource(route, method, request)}
+
+    def get_table(self, table: str) -> Dict[Any, dict]:
+        """
+        Get the rows of a table by their ID.
+
+        :param table: str
+            The name of the table.
+        :returns: Dict[Any, dict]
+        """
+        return self.dataset.setdefault(table, {})
+
+    def find(self, resource: Resource, unique_id) -> List[Tuple[Any, dict]]:
+        """
+        Find the rows of a resource with an ID.
+
+        :param resource: :ref:`Resource`
+            The resource to search.
+        :param unique_id: Any
+            The ID to search for.
+        :returns: List[Tuple[Any, dict]]
+            The keys and rows found.
+        """
+        rows = self.get_table(resource.table)
+        row = rows.get(unique_id)
+        if row is not None and row.get(resource.id_key) == unique_id:
+            return [(unique_id, row)]
+        # tables such as subscriptions have several rows for the same ID.
+        return [
+            (key, row)
+            for key, row in rows.items()
+            if row.get(resource.id_key) == unique_id
+        ]
+
+    def _handle_resource(self, route: str, method: str, request: dict):
+        parts = route.split("/")
+        resource = RESOURCES.get(parts[0])
+        if resource is None:
+            return {}
+
+        params = _get_params(request)
+        rows = self.get_table(resource.table)
+        if len(parts) == 1:
+            if method == "GET":
+                return {str(key): row for key, row in rows.items()}
+            if method == "POST":
+                return self._insert(resource, params)
+            return {}
+
+        if len(parts) != 2 or not parts[1].startswith("$"):
+            return {}
+
+        unique_id = request.get(parts[1][1:])
+        found = self.find(resource, unique_id)
+        if method == "GET":
+            return found[0][1] if found else {}
+        if method == "DELETE":
+            for key, _ in found:
+                rows.pop(key, None)
+            return {}
+
+        params.pop(parts[1][1:].replace("_", ""), None)
+        if not found:
+            self._insert(resource, dict(params, **{resource.id_key: unique_id}))
+        for _, row in found:
+            row.update(params)
+        return {}
+
+    def _insert(self, resource: Resource, params: dict) -> dict:
+        rows = self.get_table(resource.table)
+        unique_id = params.get(resource.id_key)
+        if unique_id is None:
+            unique_id = (
+                max((key for key in rows if isinstance(key, int)), default=0) + 1
+            )
+        row = dict(params, **{resource.id_key: unique_id})
+        if unique_id in rows:
+            # a table with several rows for the same ID (ex: subscriptions) keys its rows by position instead.
+            rows[
+                max((key for key in rows if isinstance(key, int)), default=0) + 1
+            ] = row
+        else:
+            rows[unique_id] = row
+        return {resource.insert_key or resource.id_key: unique_id}
+
+
+def _get_params(request: dict) -> dict:
+    """Get the parameters of a request as row keys (ex: 'name_id' -> 'nameid')."""
+    return {
+        key.replace("_", ""): value
+        for key, value in request.items()
+        if key not in _PROTOCOL_KEYS
+    }
+
+
+def _get_random_media(server: StandInServer, request: dict):
+    kind = request["route"].strip("/").split("/")[0]
+    object_id = request.get(f"{kind}_id")
+    affiliations = server.get_table("affiliation")
+    if kind == "affiliation":
+        affiliation_ids = {object_id}
+    else:
+        affiliation_ids = {
+            aff_id
+            for aff_id, aff in affiliations.items()
+            if aff.get(f"{kind}id") == object_id
+        }
+
+    candidates = [
+        media
+        for media in server.get_table("media").values()
+        if media.get("affiliationid") in affiliation_ids
+        and (request.get("nsfw") or not media.get("nsfw"))
+        and (not request.get("enabled") or media.get("enabled"))
+        and (
+            not request.get("file_type")
+            or media.get("filetype") == request.get("file_type")
+        )
+        and (
+            request.get("min_faces") is None
+            or (media.get("faces") or 0) >= request["min_faces"]
+        )
+        and (
+            request.get("max_faces") is None
+            or (media.get("faces") or 0) <= request["max_faces"]
+        )
+    ]
+    if not candidates:
+        return {"results": {}}
+    media = server._random.choice(candidates)
+    if (request.get("method") or "GET").upper() == "GET":
+        # fetching media of an object returns the whole row.
+        return {"results": media}
+    return {"results": {"mediaid": media["mediaid"], "host": media.get("link")}}
+
+
+def _get_media_of_affiliations(server: StandInServer, request: dict):
+    affiliation_ids = set(request.get("affiliation_ids") or [])
+    media = [
+        row
+        for row in server.get_table("media").values()
+        if row.get("affiliationid") in affiliation_ids
+    ]
+    if request.get("count_only"):
+        counts: Dict[Any, int] = {}
+        for row in media:
+            counts[row["affiliationid"]] = counts.get(row["affiliationid"], 0) + 1
+        return {
+            "results": {
+                str(aff_id): {"mediaid": count} for aff_id, count in counts.items()
+            }
+        }
+
+    media = media[: request["limit"]] if request.get("limit") else media
+    return {
+        "results": {str(row["mediaid"]): {"mediaid": row["mediaid"]} for row in media}
+    }
+
+
+def _get_live_statuses(server: StandInServer, request: dict):
+    usernames = request.get("usernames") or [
+        row["username"] for row in server.get_table("twitch").values()
+    ]
+    return {"results": {username: username in server.live for username in usernames}}
+
+
+def _twitch_exists(server: StandInServer, request: dict):
+    return {"results": bool(server.find(RESOURCES["twitch"], request.get("username")))}
+
+
+def _get_already_posted(server: StandInServer, request: dict):
+    rows = server.find(RESOURCES["twitch"], request.get("username"))
+    posted = [row["channelid"] for _, row in rows if row.get("posted")]
+    return {
+        "results": {str(channel_id): {"channelid": channel_id} for channel_id in posted}
+    }
+
+
+def _get_prefixes(server: StandInServer, request: dict):
+    guilds = server.find(RESOURCES["guild"], request.get("guild_id"))
+    return {"results": (guilds[0][1].get("prefixes") or []) if guilds else []}
+
+
+def _get_all_prefixes(server: StandInServer, request: dict):
+    guilds = server.get_table("guild")
+    return {
+        "results": {
+            str(guild_id): guild.get("prefixes") or []
+            for guild_id, guild in guilds.items()
+        }
+    }
+
+
+def _get_latest_video(server: StandInServer, request: dict):
+    username = request.get("username")
+    if (
+        not server.find(RESOURCES["tiktok"], username)
+        and username not in server.latest_videos
+    ):
+        return {"status": "User does not exist."}
+    # the API answers with the video ID under the username instead of the results.
+    return {username: server.latest_videos.get(username)}
+
+
+def _upsert_gg_filter(server: StandInServer, request: dict):
+    kind = (
+        "person"
+        if request["route"].strip("/").startswith("user/ggfilterpersons")
+        else "group"
+    )
+    ids = request.get(f"{kind}_ids")
+    if ids is None:
+        # the API only accepts the whole filter.
+        return {"error": f"{kind}_ids is required."}
+    users = server.find(RESOURCES["user"], request.get("user_id"))
+    if not users:
+        return {"error": "User does not exist."}
+    users[0][1][f"ggfilter{kind}s"] = sorted(set(ids))
+    return {"results": {}}
+
+
+_HANDLERS: Dict[Tuple[str, str], Handler] = {
+    ("affiliation/$affiliation_id/media", "GET"): _get_random_media,
+    ("affiliation/$affiliation_id/media", "POST"): _get_random_media,
+    ("person/$person_id/media", "GET"): _get_random_media,
+    ("person/$person_id/media", "POST"): _get_random_media,
+    ("group/$group_id/media", "GET"): _get_random_media,
+    ("group/$group_id/media", "POST"): _get_random_media,
+    ("media/affiliations", "GET"): _get_media_of_affiliations,
+    ("twitch/is_live", "GET"): _get_live_statuses,
+    ("twitch/exists/$username", "GET"): _twitch_exists,
+    ("twitch/already_posted/$username", "GET"): _get_already_posted,
+    ("guild/prefix/$guild_id", "GET"): _get_prefixes,
+    ("guild/prefix", "GET"): _get_all_prefixes,
+    ("tiktok/latest_video/$username", "GET"): _get_latest_video,
+    ("user/ggfilterpersons/$user_id", "POST"): _upsert_gg_filter,
+    ("user/ggfiltergroups/$user_id", "POST"): _upsert_gg_filter,
+}
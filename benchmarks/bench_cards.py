@@ -0,0 +1,94 @@
+"""
+Benchmark repeated card renders of cached Person, Group, and Affiliation objects.
+
+Run with `python benchmarks/bench_cards.py`.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (  # noqa: E402
+    Affiliation,
+    Display,
+    Group,
+    Name,
+    Person,
+    Tag,
+)
+
+RENDERS = 20000
+
+
+def build_objects():
+    tags = [Tag(tag_id, f"Tag {tag_id}") for tag_id in range(1, 11)]
+    display = Display(1, None, None)
+    group = Group(
+        1,
+        "Red Velvet",
+        "A group.",
+        None,
+        display,
+        "https://example.com",
+        None,
+        0,
+        tags,
+        [],
+        None,
+        None,
+    )
+    person = Person(
+        1,
+        Name(1, "Seulgi", "Kang"),
+        None,
+        display,
+        None,
+        None,
+        "A",
+        "F",
+        "A person.",
+        163,
+        0,
+        0,
+        tags,
+        [],
+        None,
+        None,
+    )
+    affiliation = Affiliation(1, person, group, [], "Seulgi")
+    person.affiliations.add(affiliation)
+    group.affiliations.add(affiliation)
+    return person, group, affiliation
+
+
+async def bench(obj, render) -> float:
+    start = perf_counter()
+    for _ in range(RENDERS):
+        await render(obj)
+    return perf_counter() - start
+
+
+async def main():
+    person, group, affiliation = build_objects()
+    # changing an object that is not on the card must not cost the card anything.
+    unrelated = Name(2, "Irene", "Bae")
+
+    async def render_after_unrelated_change(obj):
+        unrelated.bump_version()
+        return await obj.get_card(markdown=True)
+
+    for obj in (person, group, affiliation):
+        cached = await bench(obj, lambda o: o.get_card(markdown=True))
+        after_change = await bench(obj, render_after_unrelated_change)
+        uncached = await bench(obj, lambda o: o._render_card(markdown=True))
+        print(
+            f"{obj.__class__.__name__:<12} cached: {cached / RENDERS * 1e6:7.2f}us  "
+            f"after unrelated change: {after_change / RENDERS * 1e6:7.2f}us  "
+            f"uncached: {uncached / RENDERS * 1e6:7.2f}us  speedup: {uncached / cached:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
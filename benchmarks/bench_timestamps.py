@@ -0,0 +1,60 @@
+"""
+Benchmark parsing 1M common timestamp strings with strptime and convert_to_timestamp.
+
+Run with `python benchmarks/bench_timestamps.py`.
+"""
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from random import Random
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    COMMON_TIMESTAMP_FORMAT,
+    convert_to_timestamp,
+)  # noqa: E402
+from IreneAPIWrapper.models import _parse_common_timestamp, _timestamps  # noqa: E402
+
+STRINGS = 1_000_000
+# about how many distinct dates a preload shares between objects.
+DISTINCT_DATES = 5_000
+
+
+def build_strings(distinct: int):
+    rng = Random(39)
+    start = datetime(1950, 1, 1)
+    dates = [
+        (start + timedelta(seconds=rng.randrange(80 * 365 * 24 * 60 * 60))).strftime(
+            COMMON_TIMESTAMP_FORMAT[:-2] + "GMT"
+        )
+        for _ in range(distinct)
+    ]
+    return [dates[rng.randrange(distinct)] for _ in range(STRINGS)]
+
+
+def bench(name: str, parse, strings) -> float:
+    start = perf_counter()
+    for date_string in strings:
+        parse(date_string)
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {elapsed:6.2f}s  {elapsed / len(strings) * 1e9:7.0f}ns/string")
+    return elapsed
+
+
+def main():
+    strings = build_strings(DISTINCT_DATES)
+    baseline = bench(
+        "strptime", lambda s: datetime.strptime(s, COMMON_TIMESTAMP_FORMAT), strings
+    )
+    sliced = bench("slicing", _parse_common_timestamp, strings)
+    _timestamps.clear()
+    memoized = bench("convert_to_timestamp", convert_to_timestamp, strings)
+    print(
+        f"speedup: slicing {baseline / sliced:.1f}x, convert_to_timestamp {baseline / memoized:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+"""
+Reproducible benchmarks of the transport, preload, model creation, lookups, and memory use.
+
+Every scenario runs in its own process against a seeded synthetic dataset (and the local stand-in server where the
+API is needed), so the same scale and seed always use the same data. Repeated runs of a scenario share the process
+and its dataset, but every run starts with empty model caches in a new context.
+
+Run all scenarios and write the results as JSON:
+
+    python benchmarks/suite.py --scale small --output results.json
+
+Compare against a stored baseline (exits with status 1 if any metric regressed by more than the tolerance):
+
+    python benchmarks/suite.py --scale small --repeat 3 --baseline baseline.json --tolerance 0.2
+
+Timings are noisy on shared machines, so baselines and comparisons should keep the best of several runs (--repeat).
+
+Scenarios can be chosen by name (ex: `python benchmarks/suite.py transport lookups`).
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from random import Random
+from statistics import median
+from time import perf_counter
+from typing import Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (  # noqa: E402
+    Affiliation,
+    Context,
+    Group,
+    IreneAPIClient,
+    Language,
+    Media,
+    Person,
+    PersonAlias,
+    Preload,
+    Tag,
+    basic_call,
+    use_context,
+)
+from IreneAPIWrapper.testing import (
+    StandInServer,
+    generate_dataset,
+    load_dataset,
+)  # noqa: E402
+
+SCALES = {
+    "tiny": {"persons": 500, "groups": 100, "media": 5000, "users": 100, "guilds": 20},
+    "small": {
+        "persons": 3000,
+        "groups": 800,
+        "media": 50000,
+        "users": 1000,
+        "guilds": 200,
+    },
+    "medium": {
+        "persons": 10000,
+        "groups": 2500,
+        "media": 150000,
+        "users": 3000,
+        "guilds": 600,
+    },
+    "production": {},
+}
+
+CONCURRENCIES = [1, 8, 64]
+ROUND_TRIPS = 2000
+LOOKUPS = 100000
+
+# the tables that media and persons reference, loaded before they are created.
+DEPENDENCIES = [
+    "tag",
+    "name",
+    "display",
+    "location",
+    "social",
+    "position",
+    "company",
+    "personalias",
+    "groupalias",
+]
+
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    return {"value": round(value, 6), "unit": unit, "better": better}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+async def time_each(calls: int, func: Callable[[int], Awaitable]) -> List[float]:
+    """Time each of several sequential calls in seconds."""
+    timings = []
+    for i in range(calls):
+        start = perf_counter()
+        await func(i)
+        timings.append(perf_counter() - start)
+    return timings
+
+
+async def connect(dataset, preload: Preload):
+    server = await StandInServer(dataset, token="bench").start()
+    client = IreneAPIClient(
+        "bench", 1, api_url="127.0.0.1", port=server.port, preload_cache=preload
+    )
+    connection = asyncio.get_running_loop().create_task(client.connect())
+    await client.wait_until_connected()
+    return server, client, connection
+
+
+async def close(server, client, connection):
+    connection.cancel()
+    await asyncio.gather(connection, return_exceptions=True)
+    if client._ws_client:
+        await client._ws_client.close()
+    await server.stop()
+
+
+async def bench_transport(dataset, rng: Random) -> Dict[str, dict]:
+    """CallBack round-trip latency and throughput at several concurrencies, and Media.get_random."""
+    preload = Preload()
+    preload.all_false()
+    server, client, connection = await connect(dataset, preload)
+    tag_ids = list(dataset["tag"])
+    results = {}
+    try:
+        for concurrency in CONCURRENCIES:
+            latencies = []
+
+            async def worker(calls: int):
+                for _ in range(calls):
+                    request = {
+                        "route": "tag/$tag_id",
+                        "tag_id": rng.choice(tag_ids),
+                        "method": "GET",
+                    }
+                    start = perf_counter()
+                    await basic_call(request)
+                    latencies.append(perf_counter() - start)
+
+            start = perf_counter()
+            await asyncio.gather(
+                *[worker(ROUND_TRIPS // concurrency) for _ in range(concurrency)]
+            )
+            elapsed = perf_counter() - start
+
+            results[f"roundtrip_c{concurrency}_p50"] = metric(
+                median(latencies) * 1e3, "ms"
+            )
+            results[f"roundtrip_c{concurrency}_p99"] = metric(
+                percentile(latencies, 0.99) * 1e3, "ms"
+            )
+            results[f"roundtrip_c{concurrency}_throughput"] = metric(
+                len(latencies) / elapsed, "req/s", "higher"
+            )
+
+        group_ids = list(dataset["group"])
+        timings = await time_each(
+            ROUND_TRIPS // 4,
+            lambda _: Media.get_random(rng.choice(group_ids), group=True),
+        )
+        results["media_get_random_p50"] = metric(median(timings) * 1e3, "ms")
+    finally:
+        await close(server, client, connection)
+    return results
+
+
+async def bench_preload(dataset, rng: Random) -> Dict[str, dict]:
+    """The time the client takes to load the cache of each model (sequentially, in priority order)."""
+    preload = Preload()
+    preload.users = (
+        preload.guilds
+    ) = preload.channels = preload.twitch_subscriptions = True
+    start = perf_counter()
+    server, client, connection = await connect(dataset, preload)
+    finished = {}
+
+    async def wait_for(model):
+        await client.ready(model)
+        finished[model.__name__] = perf_counter()
+
+    try:
+        await asyncio.gather(
+            *[wait_for(model) for model in client._get_preloaded_models()]
+        )
+    finally:
+        await close(server, client, connection)
+
+    results = {}
+    previous = start
+    for name, finished_at in sorted(finished.items(), key=lambda item: item[1]):
+        results[f"preload_{name}"] = metric((finished_at - previous) * 1e3, "ms")
+        previous = finished_at
+    results["preload_total"] = metric((previous - start) * 1e3, "ms")
+    return results
+
+
+async def bench_create(dataset, rng: Random) -> Dict[str, dict]:
+    """Rows per second created with `create` (one at a time) and `create_bulk`."""
+    await load_dataset(dataset, tables=DEPENDENCIES)
+    results = {}
+    # every model is created after the models it references, so nothing is fetched.
+    for table, model in (
+        ("person", Person),
+        ("group", Group),
+        ("affiliation", Affiliation),
+        ("media", Media),
+    ):
+        rows = list(dataset[table].values())
+        half = len(rows) // 2
+        start = perf_counter()
+        for row in rows[:half]:
+            await model.create(**row)
+        results[f"create_{table}"] = metric(
+            half / (perf_counter() - start), "rows/s", "higher"
+        )
+
+        start = perf_counter()
+        await model.create_bulk(rows[half:])
+        results[f"create_bulk_{table}"] = metric(
+            (len(rows) - half) / (perf_counter() - start), "rows/s", "higher"
+        )
+    return results
+
+
+async def bench_lookups(dataset, rng: Random) -> Dict[str, dict]:
+    """Cache hit latency of `get`, pack messages, and alias resolution."""
+    await load_dataset(dataset)
+    results = {}
+
+    for name, model, ids in (
+        ("person", Person, list(dataset["person"])),
+        ("media", Media, list(dataset["media"])),
+    ):
+        keys = [rng.choice(ids) for _ in range(LOOKUPS)]
+        start = perf_counter()
+        for key in keys:
+            await model.get(key)
+        results[f"get_{name}_hit"] = metric(
+            (perf_counter() - start) / LOOKUPS * 1e9, "ns/op"
+        )
+
+    language = Language.get_lang_by_id(1)
+    pack = json.loads(dataset["language"][1]["pack"])
+    labels = [rng.choice(pack)["label"] for _ in range(LOOKUPS)]
+    start = perf_counter()
+    for label in labels:
+        language[label].get("user")
+    results["pack_message_get"] = metric(
+        (perf_counter() - start) / LOOKUPS * 1e9, "ns/op"
+    )
+
+    persons = [person for person in dataset["person"].values() if person["aliasids"]]
+    samples = [rng.choice(persons) for _ in range(LOOKUPS // 10)]
+    start = perf_counter()
+    for row in samples:
+        for alias_id in row["aliasids"]:
+            await PersonAlias.get(alias_id)
+        person = await Person.get(row["personid"])
+        await person.get_aliases_as_strings()
+    results["alias_resolution"] = metric(
+        (perf_counter() - start) / len(samples) * 1e9, "ns/op"
+    )
+    return results
+
+
+async def bench_memory(dataset, rng: Random) -> Dict[str, dict]:
+    """Memory allocated for 100k objects of the biggest caches."""
+    await load_dataset(dataset, tables=DEPENDENCIES)
+    results = {}
+    for table, model in (
+        ("person", Person),
+        ("group", Group),
+        ("affiliation", Affiliation),
+        ("media", Media),
+        ("tag", Tag),
+    ):
+        rows = list(dataset[table].values())
+        if table == "tag":
+            # tags are already loaded, so new ones are made past the generated IDs.
+            rows = [
+                {"tagid": len(rows) + i, "name": f"Bench {i}"} for i in range(1, 100001)
+            ]
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        await model.create_bulk(rows)
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results[f"memory_{table}_per_100k"] = metric(
+            allocated / len(rows) * 100000 / 2**20, "MiB"
+        )
+    return results
+
+
+SCENARIOS: Dict[str, Callable[..., Awaitable[Dict[str, dict]]]] = {
+    "transport": bench_transport,
+    "preload": bench_preload,
+    "create": bench_create,
+    "lookups": bench_lookups,
+    "memory": bench_memory,
+}
+
+
+def run_scenario(name: str, scale: str, seed: int, repeat: int = 1) -> Dict[str, dict]:
+    """Run one scenario in this process, keeping the best value of every metric over the runs."""
+    dataset = generate_dataset(seed=seed, **SCALES[scale])
+    best = None
+    for _ in range(repeat):
+        # a new context gives every run empty caches without generating the dataset again.
+        with use_context(Context()):
+            best = keep_best(best, asyncio.run(SCENARIOS[name](dataset, Random(seed))))
+    return best
+
+
+def run_isolated(name: str, scale: str, seed: int, repeat: int = 1) -> Dict[str, dict]:
+    """Run one scenario in a new process so state outside the model caches does not leak between scenarios."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            name,
+            "--scale",
+            scale,
+            "--seed",
+            str(seed),
+            "--repeat",
+            str(repeat),
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def keep_best(best: Optional[dict], result: dict) -> dict:
+    """Keep the best value of every metric over repeated runs."""
+    if best is None:
+        return result
+    for key, value in result.items():
+        current = best.get(key)
+        if current is None or (value["value"] < current["value"]) == (
+            value["better"] == "lower"
+        ):
+            best[key] = value
+    return best
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    :param results: dict
+        The results of this run.
+    :param baseline: dict
+        The stored results to compare with.
+    :param tolerance: float
+        The relative change a metric may get worse by before it is a regression.
+    :returns: List[str]
+        The regressions.
+    """
+    regressions = []
+    for scenario, metrics in results["scenarios"].items():
+        for key, current in metrics.items():
+            previous = baseline.get("scenarios", {}).get(scenario, {}).get(key)
+            if not previous or not previous["value"]:
+                continue
+            change = (current["value"] - previous["value"]) / previous["value"]
+            if current["better"] == "higher":
+                change = -change
+            status = "REGRESSION" if change > tolerance else "ok"
+            print(
+                f"{status:<10} {scenario}.{key}: {previous['value']:.4g} -> {current['value']:.4g} "
+                f"{current['unit']} ({'worse' if change > 0 else 'better'} by {abs(change):.1%})",
+                file=sys.stderr,
+            )
+            if change > tolerance:
+                regressions.append(f"{scenario}.{key}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"The scenarios to run ({', '.join(SCENARIOS)})."
+    )
+    parser.add_argument(
+        "--scale",
+        default="small",
+        choices=list(SCALES),
+        help="The size of the dataset.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="The seed of the dataset and the benchmark."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Keep the best value of several runs."
+    )
+    parser.add_argument(
+        "--output", help="Write the results as JSON to a file instead of stdout."
+    )
+    parser.add_argument(
+        "--baseline", help="A stored results file to flag regressions against."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The relative change allowed by --baseline.",
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.scale, args.seed, args.repeat)))
+        return
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "scenarios": {},
+    }
+    for name in args.scenarios or list(SCENARIOS):
+        results["scenarios"][name] = run_isolated(
+            name, args.scale, args.seed, args.repeat
+        )
+        print(f"finished {name}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(Path(args.baseline).read_text()), args.tolerance
+        )
+        if regressions:
+            print(
+                f"{len(regressions)} regression(s): {', '.join(regressions)}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
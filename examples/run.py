@@ -11,8 +11,7 @@ class Example:
     async def run(self):
         asyncio.run_coroutine_threadsafe(self.client.connect(), loop)
 
-        while not self.client.connected:
-            await asyncio.sleep(0)
+        await self.client.wait_until_connected()
 
         print("Connected to IreneAPI")
         await self.test()
@@ -23,16 +22,21 @@ class Example:
             Person,
             Group,
             GroupAlias,
+            Affiliation,
         )
 
-        # persons = await Person.get(1)
-        await asyncio.sleep(10)
+        # groups can be used as soon as they (and their affiliations) are loaded,
+        # even if other cache (ex: media) is still loading.
+        await self.client.ready(Group, Affiliation)
         groups: List[Group] = await Group.get_all()
         group: Group = await Group.get(1)
         group.affiliations
 
         print("HERE")
 
+        await self.client.ready_all()
+        print("All cache is loaded.")
+
         """
         pham = await User.get(429779375072870400)
         await pham.add_token("test", DEVELOPER)
@@ -0,0 +1,132 @@
+import asyncio
+from unittest import main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Affiliation,
+    Group,
+    Guild,
+    Media,
+    Person,
+    Tag,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase, sample_dataset
+
+"""
+Test creating and getting models in bulk with references that are missing from cache.
+"""
+
+
+class _StandInTestCase(StandInTestCase):
+    async def asyncSetUp(self):
+        await super(_StandInTestCase, self).asyncSetUp()
+        self.dataset = sample_dataset()
+
+    def get_requests(self, route: str) -> int:
+        return self.server.requests.get((route, "GET"), 0)
+
+
+class TestCreateBulk(_StandInTestCase):
+    async def test_person(self):
+        rows = list(self.dataset["person"].values())
+        rows[1]["tagids"] = [1, 2, 404]
+        with use_context(self.context):
+            await Tag.get(1)
+            persons = await Person.create_bulk(rows)
+
+            self.assertEqual([person.id for person in persons], [1, 2])
+            self.assertIs(await Person.get(1, fetch=False), persons[0])
+            self.assertEqual(str(persons[0].name), "Joohyun Bae")
+            self.assertEqual(str(persons[0].location.city), "Daegu")
+            self.assertEqual([alias.name for alias in persons[0].aliases], ["Irene"])
+            # a reference that does not exist is kept as None, like a single create.
+            self.assertEqual(
+                [tag and tag.name for tag in persons[1].tags],
+                ["Vocalist", "Dancer", None],
+            )
+
+        # the cached tag is not fetched again, and references shared by rows are fetched once.
+        self.assertEqual(self.get_requests("tag/$tag_id"), 3)
+        self.assertEqual(self.get_requests("display/$display_id"), 1)
+        self.assertEqual(self.get_requests("name/$name_id"), 2)
+
+    async def test_group_and_affiliation(self):
+        with use_context(self.context):
+            groups = await Group.create_bulk(list(self.dataset["group"].values()))
+            group = groups[0]
+            self.assertEqual(str(group.company.name), "SM Entertainment")
+            self.assertEqual([alias.name for alias in group.aliases], ["RV"])
+            self.assertEqual(group.tags, [])
+
+            affiliations = await Affiliation.create_bulk(
+                list(self.dataset["affiliation"].values())
+            )
+            self.assertEqual({aff.id for aff in group.affiliations}, {1, 2})
+            person = await Person.get(1, fetch=False)
+            self.assertEqual(person.affiliations[0], affiliations[0])
+            self.assertEqual(affiliations[1].positions[0].name, "Main Dancer")
+
+            # a single create shares the bulk code path.
+            created = await Affiliation.create(**self.dataset["affiliation"][1])
+            self.assertIs(created, affiliations[0])
+            self.assertEqual(len(group.affiliations), 2)
+
+        self.assertEqual(self.get_requests("group/$group_id"), 0)
+        self.assertEqual(self.get_requests("person/$person_id"), 2)
+
+    async def test_media_and_guild(self):
+        with use_context(self.context):
+            media = await Media.create_bulk(list(self.dataset["media"].values()))
+            self.assertEqual(len(media), 4)
+            self.assertEqual(media[0].affiliation.id, 2)
+            self.assertIs(media[0].affiliation, media[2].affiliation)
+            self.assertEqual(media[0].source.file_type, "png")
+
+            guild = (
+                await Guild.create_bulk([dict(self.dataset["guild"][1], ownerid=1)])
+            )[0]
+            self.assertEqual(guild.owner.id, 1)
+            self.assertEqual(guild.prefixes, ["%"])
+
+        self.assertEqual(self.get_requests("affiliation/$affiliation_id"), 2)
+        self.assertEqual(self.get_requests("user/$user_id"), 1)
+
+
+class TestGetMany(_StandInTestCase):
+    async def test_get_many(self):
+        with use_context(self.context):
+            await Tag.get(2)
+            tags, missing = await Tag.get_many([2, 1, 404, 2, 1])
+            self.assertEqual([tag.id for tag in tags], [2, 1, 2, 1])
+            self.assertIs(tags[0], tags[2])
+            self.assertEqual(missing, [404])
+
+            # only the misses were fetched, once each.
+            self.assertEqual(self.get_requests("tag/$tag_id"), 3)
+            tags, missing = await Tag.get_many([1, 2, 3], fetch=False)
+            self.assertEqual([tag.id for tag in tags], [1, 2])
+            self.assertEqual(missing, [3])
+            self.assertEqual(self.get_requests("tag/$tag_id"), 3)
+
+    async def test_limit(self):
+        self.server.latency = 0.2
+        for limit, in_flight in ((None, 2), (1, 1)):
+            self.context.clear()
+            with use_context(self.context):
+                task = asyncio.get_running_loop().create_task(
+                    Person.get_many([1, 2], limit=limit)
+                )
+                await asyncio.sleep(0.1)
+                self.assertEqual(len(self.client._in_flight), in_flight)
+                persons, missing = await task
+            self.assertEqual([person.id for person in persons], [1, 2])
+            self.assertEqual(missing, [])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Context,
+    ContextDict,
+    ContextLocal,
+    Tag,
+    get_context,
+    use_context,
+)
+from IreneAPIWrapper.sections import outer
+from IreneAPIWrapper.testing import StandInTestCase, sample_dataset
+
+"""
+Test running several clients at once, each with its own caches.
+"""
+
+
+class TestContextLocal(TestCase):
+    def test_separate_values(self):
+        cache = ContextDict()
+        cache[1] = "default"
+        context = Context()
+        with use_context(context):
+            self.assertIs(get_context(), context)
+            self.assertNotIn(1, cache)
+            cache[1] = "other"
+            self.assertEqual(cache.get(1), "other")
+        self.assertEqual(cache[1], "default")
+        self.assertEqual(len(cache), 1)
+
+        # a cleared context starts with new values.
+        context.clear()
+        with use_context(context):
+            self.assertFalse(cache)
+
+    def test_forwarding(self):
+        counter = ContextLocal(_Counter, start=5)
+        counter.increment()
+        counter.value += 1
+        self.assertEqual(counter.value, 7)
+        with use_context(Context()):
+            self.assertEqual(counter.value, 5)
+
+
+class _Counter:
+    def __init__(self, start=0):
+        self.value = start
+
+    def increment(self):
+        self.value += 1
+
+
+class TestContexts(StandInTestCase):
+    wait_until_ready = True
+
+    def get_preload(self):
+        preload = super(TestContexts, self).get_preload()
+        preload.tags = True
+        return preload
+
+    async def asyncSetUp(self):
+        await super(TestContexts, self).asyncSetUp()
+        staging = sample_dataset()
+        staging["tag"][1] = dict(staging["tag"][1], name="Staging Vocalist")
+        staging_server = await self.start_server(staging)
+        staging_context = Context()
+        staging_client = self.create_client(staging_server, staging_context)
+        await self.connect(staging_client)
+
+        self.servers = [self.server, staging_server]
+        self.contexts = [self.context, staging_context]
+        self.clients = [self.client, staging_client]
+
+    async def test_isolated_caches(self):
+        names = []
+        for client, context in zip(self.clients, self.contexts):
+            with use_context(context):
+                self.assertIs(outer.client, client)
+                names.append((await Tag.get(1, fetch=False)).name)
+        self.assertEqual(names, ["Vocalist", "Staging Vocalist"])
+
+        # each client's requests go to its own server.
+        with use_context(self.contexts[1]):
+            await Tag.insert("Dancer")
+            await Tag.fetch_all()
+            self.assertEqual(
+                len(await Tag.get_all()), len(self.servers[1].dataset["tag"])
+            )
+        with use_context(self.contexts[0]):
+            self.assertEqual(
+                len(await Tag.get_all()), len(self.servers[0].dataset["tag"])
+            )
+
+        # freeing the caches of one client does not affect the other.
+        self.contexts[1].clear()
+        with use_context(self.contexts[1]):
+            self.assertIsNone(await Tag.get(1, fetch=False))
+        with use_context(self.contexts[0]):
+            self.assertIsNotNone(await Tag.get(1, fetch=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from collections import Counter
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.testing import generate_dataset
+
+"""
+Test the synthetic dataset generator.
+"""
+
+SIZES = {"persons": 2000, "groups": 400, "media": 20000, "users": 200, "guilds": 50}
+
+
+class TestGenerateDataset(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dataset = generate_dataset(seed=7, **SIZES)
+
+    def test_deterministic(self):
+        self.assertEqual(generate_dataset(seed=7, **SIZES), self.dataset)
+        self.assertNotEqual(generate_dataset(seed=8, **SIZES), self.dataset)
+
+    def test_sizes(self):
+        self.assertEqual(len(self.dataset["person"]), SIZES["persons"])
+        self.assertEqual(len(self.dataset["group"]), SIZES["groups"])
+        self.assertEqual(len(self.dataset["media"]), SIZES["media"])
+
+    def test_references(self):
+        dataset = self.dataset
+        for person in dataset["person"].values():
+            self.assertIn(person["nameid"], dataset["name"])
+            for alias_id in person["aliasids"]:
+                self.assertEqual(
+                    dataset["personalias"][alias_id]["personid"], person["personid"]
+                )
+        for affiliation in dataset["affiliation"].values():
+            self.assertIn(affiliation["personid"], dataset["person"])
+            self.assertIn(affiliation["groupid"], dataset["group"])
+        for media in dataset["media"].values():
+            self.assertIn(media["affiliationid"], dataset["affiliation"])
+        self.assertEqual(
+            sum(person["mediacount"] for person in dataset["person"].values()),
+            SIZES["media"],
+        )
+
+    def test_skewed(self):
+        media_counts = Counter(
+            media["affiliationid"] for media in self.dataset["media"].values()
+        )
+        # the most popular affiliation has far more media than the average one.
+        self.assertGreater(
+            media_counts.most_common(1)[0][1],
+            20 * SIZES["media"] / len(self.dataset["affiliation"]),
+        )
+
+        alias_counts = Counter(
+            len(person["aliasids"]) for person in self.dataset["person"].values()
+        )
+        self.assertGreater(alias_counts[0], SIZES["persons"] / 2)
+        self.assertGreater(max(alias_counts), 5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import asyncio
+from unittest import main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Affiliation,
+    Media,
+    Person,
+    Tag,
+    freshness,
+    use_context,
+    write_behind,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test refreshing cached objects according to their freshness policies.
+"""
+
+
+class TestFreshness(StandInTestCase):
+    async def asyncSetUp(self):
+        await super(TestFreshness, self).asyncSetUp()
+        self.now = 1000.0
+        patcher = patch(
+            "IreneAPIWrapper.models.base.freshness.monotonic", lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        for model in (Tag, Media, Affiliation, Person):
+            freshness.remove_policy(model)
+
+    async def settle(self):
+        await asyncio.gather(*freshness._refreshes.values(), return_exceptions=True)
+
+    async def test_soft_ttl(self):
+        freshness.set_policy(Tag, 10, 60)
+        with use_context(self.context):
+            tag = await Tag.get(1)
+            self.server.get_table("tag")[1]["name"] = "Singer"
+
+            self.now += 5
+            self.assertIs(await Tag.get(1), tag)
+            await self.settle()
+            self.assertEqual(tag.name, "Vocalist")
+
+            # a stale object is returned as is and refreshed in place in the background.
+            self.now += 10
+            self.assertIs(await Tag.get(1), tag)
+            self.assertEqual(tag.name, "Vocalist")
+            await self.settle()
+            self.assertEqual(tag.name, "Singer")
+            self.assertIs(await Tag.get(1, fetch=False), tag)
+
+            metrics = freshness.get_metrics()["Tag"]
+        self.assertEqual(metrics["fresh"], 1)
+        self.assertEqual(metrics["stale"], 1)
+        self.assertEqual(metrics["refreshes"], 1)
+        self.assertEqual(self.server.requests[("tag/$tag_id", "GET")], 2)
+
+    async def test_hard_ttl(self):
+        freshness.set_policy(Tag, 10, 60)
+        with use_context(self.context):
+            tag = await Tag.get(1)
+            self.server.get_table("tag")[1]["name"] = "Singer"
+
+            # an expired object waits for the refresh.
+            self.now += 60
+            self.assertIs(await Tag.get(1), tag)
+            self.assertEqual(tag.name, "Singer")
+            self.assertEqual(freshness.get_metrics()["Tag"]["expired"], 1)
+
+            # a failed refresh returns the cached object.
+            self.server.route_errors["tag/$tag_id"] = "Unavailable."
+            self.now += 60
+            with patch.object(self.client, "logger"):
+                self.assertIs(await Tag.get(1), tag)
+            self.assertEqual(freshness.get_metrics()["Tag"]["failures"], 1)
+
+    async def test_dedup(self):
+        freshness.set_policy(Tag, 10, 60)
+        with use_context(self.context):
+            tag = await Tag.get(1)
+            self.server.latency = 0.05
+
+            self.now += 30
+            stale = await asyncio.gather(*[Tag.get(1) for _ in range(5)])
+            self.now += 30
+            expired = await asyncio.gather(*[Tag.get(1) for _ in range(5)])
+            await self.settle()
+            metrics = freshness.get_metrics()["Tag"]
+
+        self.assertTrue(all(result is tag for result in stale + expired))
+        self.assertEqual(metrics["refreshes"], 1)
+        self.assertEqual(self.server.requests[("tag/$tag_id", "GET")], 2)
+
+    async def test_staged_writes(self):
+        freshness.set_policy(Media, 10)
+        with use_context(self.context):
+            media = await Media.get(1)
+            await media.upsert_guesses(correct=True)
+            self.assertEqual(media.correct_guesses, 10)
+
+            # the staged guesses are newer than the API's.
+            self.now += 30
+            self.assertIs(await Media.get(1), media)
+            await self.settle()
+            self.assertEqual(media.correct_guesses, 10)
+            self.assertEqual(freshness.get_metrics()["Media"]["skipped"], 1)
+
+            await write_behind.flush()
+            self.assertEqual(self.server.get_table("media")[1]["correctguesses"], 10)
+            self.now += 30
+            self.assertIs(await Media.get(1), media)
+            await self.settle()
+            metrics = freshness.get_metrics()["Media"]
+        self.assertEqual(metrics["refreshes"], 2)
+        self.assertEqual(metrics["skipped"], 1)
+
+    async def test_affiliations_keep_cached_object(self):
+        freshness.set_policy(Affiliation, 10)
+        with use_context(self.context):
+            affiliation = await Affiliation.get(1)
+            person = await Person.get(1)
+            self.server.get_table("affiliation")[1]["stagename"] = "Joohyun"
+
+            self.now += 30
+            await Affiliation.get(1)
+            await self.settle()
+            self.assertEqual(affiliation.stage_name, "Joohyun")
+            self.assertIs(next(iter(person.affiliations)), affiliation)
+            self.assertTrue(
+                any(entity is affiliation for entity in affiliation.group.affiliations)
+            )
+
+    async def test_cached_while_refreshing(self):
+        freshness.set_policy(Person, 10)
+        with use_context(self.context):
+            person = await Person.get(1)
+            self.server.get_table("person")[1]["description"] = "A singer."
+
+            # the cached object stays cached while the fresh copy is created.
+            self.now += 30
+            await Person.get(1)
+            seen = []
+            while freshness._refreshes:
+                seen.append(await Person.get(1, fetch=False))
+                await asyncio.sleep(0)
+            await self.settle()
+            self.assertTrue(seen)
+            self.assertTrue(all(result is person for result in seen))
+            self.assertIs(await Person.get(1, fetch=False), person)
+            self.assertEqual(person.description, "A singer.")
+
+
+if __name__ == "__main__":
+    main()
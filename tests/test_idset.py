@@ -0,0 +1,119 @@
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.exceptions import APIError
+from IreneAPIWrapper.models import (
+    GG_FILTER_DIFF,
+    IdSet,
+    User,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test sets of IDs and upserting the guessing game filters of users.
+"""
+
+
+class TestIdSet(TestCase):
+    def test_bits(self):
+        ids = IdSet([3, 0, 5])
+        self.assertEqual(ids.bits, 0b101001)
+        self.assertEqual(IdSet.from_bits(ids.bits), ids)
+        self.assertEqual(IdSet().bits, 0)
+
+        # the cached bitset and order are rebuilt after a change.
+        ids.add(1)
+        self.assertEqual(ids.bits, 0b101011)
+        self.assertEqual(list(ids), [0, 1, 3, 5])
+        ids.discard(5)
+        self.assertEqual(ids.bits, 0b1011)
+
+        self.assertTrue(ids.intersects(IdSet([3, 10])))
+        self.assertFalse(ids.intersects(IdSet([2, 10])))
+
+    def test_diff(self):
+        ids = IdSet([1, 2, 3])
+        self.assertEqual(ids.diff([3, 4, 5, 2]), ((4, 5), (1,)))
+        self.assertEqual(ids.diff((1, 2, 3)), ((), ()))
+        self.assertEqual(ids.diff([]), ((), (1, 2, 3)))
+        self.assertEqual(IdSet().diff([2, 1]), ((1, 2), ()))
+
+    def test_list_compatibility(self):
+        ids = IdSet([2])
+        ids.append(1)
+        ids.extend([3, 1])
+        self.assertEqual(list(ids), [1, 2, 3])
+        ids.remove(2)
+        with self.assertRaises(ValueError):
+            ids.remove(2)
+        self.assertEqual(ids & [1, 5], IdSet([1]))
+        self.assertEqual(ids | [5], IdSet([1, 3, 5]))
+        self.assertEqual(ids - [1], IdSet([3]))
+
+
+class TestUpsertFilter(StandInTestCase):
+    connect_on_setup = False
+
+    async def connect_with(self, capabilities):
+        self.client = self.create_client(capabilities=capabilities)
+        await self.connect()
+
+    async def test_whole_filter(self):
+        await self.connect()
+        self.assertFalse(self.client.supports(GG_FILTER_DIFF))
+        row = self.server.get_table("user")[1]
+        with use_context(self.context):
+            user = await User.get(1)
+            await user.upsert_filter_persons((2, 1))
+            await user.upsert_filter_groups((1,))
+            self.assertEqual(
+                (row["ggfilterpersons"], row["ggfiltergroups"]), ([1, 2], [1])
+            )
+            self.assertEqual(user.gg_filter_person_ids, [1, 2])
+            self.assertTrue(user.gg_filter_persons.intersects(IdSet([2, 5])))
+
+            # the whole filter is sent even if it did not change.
+            await user.upsert_filter_persons((1, 2))
+            await user.upsert_filter_persons(())
+            self.assertEqual(row["ggfilterpersons"], [])
+            self.assertEqual(list(user.gg_filter_group_ids), [1])
+        self.assertEqual(
+            self.server.requests[("user/ggfilterpersons/$user_id", "POST")], 3
+        )
+
+    async def test_diff(self):
+        await self.connect_with([GG_FILTER_DIFF])
+        requests = []
+
+        def upsert(server, request):
+            requests.append(
+                (request.get("added_person_ids"), request.get("removed_person_ids"))
+            )
+            return {"results": {}}
+
+        self.server.add_handler("user/ggfilterpersons/$user_id", "POST", upsert)
+        with use_context(self.context):
+            user = await User.get(1)
+            await user.upsert_filter_persons((2, 1))
+            await user.upsert_filter_persons((1, 2))
+            await user.upsert_filter_persons((1, 3))
+            self.assertEqual(list(user.gg_filter_person_ids), [1, 3])
+        self.assertEqual(requests, [([1, 2], []), ([3], [2])])
+
+    async def test_rejected_diff(self):
+        # the stand-in server rejects the changes without the whole filter, like the API.
+        await self.connect_with([GG_FILTER_DIFF])
+        with use_context(self.context):
+            user = await User.get(1)
+            with self.assertRaises(APIError):
+                await user.upsert_filter_groups((1,))
+            self.assertEqual(list(user.gg_filter_group_ids), [])
+
+
+if __name__ == "__main__":
+    main()
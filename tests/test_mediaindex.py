@@ -0,0 +1,136 @@
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    EASY,
+    HARD,
+    MEDIUM,
+    AbstractModel,
+    Affiliation,
+    Context,
+    Media,
+    media_index,
+    use_context,
+)
+
+"""
+Test indexing media by difficulty band and drawing distinct random media from the index.
+"""
+
+
+class TestMediaDifficultyIndex(TestCase):
+    def setUp(self):
+        self.context = use_context(Context())
+        self.context.__enter__()
+        person, other_person, group = (
+            AbstractModel(1),
+            AbstractModel(2),
+            AbstractModel(1),
+        )
+        self.solo = Affiliation(1, person, None, [], "Solo")
+        self.member = Affiliation(2, other_person, group, [], "Member")
+        self.media = [
+            Media(
+                media_id,
+                None,
+                1,
+                self.solo if media_id <= 5 else self.member,
+                True,
+                False,
+            )
+            for media_id in range(1, 11)
+        ]
+
+    def tearDown(self):
+        self.context.__exit__(None, None, None)
+
+    def test_add(self):
+        self.assertEqual(media_index.count("all", 0, MEDIUM), 10)
+        self.assertEqual(media_index.count("affiliation", 1, MEDIUM), 5)
+        self.assertEqual(media_index.count("person", 2, MEDIUM), 5)
+        self.assertEqual(media_index.count("group", 1, MEDIUM), 5)
+        self.assertEqual(media_index.count("grouped", 0, MEDIUM), 5)
+        self.assertEqual(media_index.count("all", 0, EASY), 0)
+
+        # NSFW and disabled media.
+        Media(11, None, 1, self.solo, True, True)
+        Media(12, None, 1, self.solo, False, False)
+        self.assertEqual(media_index.count("person", 1, MEDIUM), 5)
+        self.assertEqual(media_index.count("person", 1, MEDIUM, nsfw=True), 6)
+
+        # adding media again does not duplicate it.
+        media_index.add(self.media[0])
+        self.assertEqual(media_index.count("all", 0, MEDIUM), 10)
+
+    def test_update(self):
+        media = self.media[0]
+        media.correct_guesses = 100
+        media_index.update(media)
+        self.assertEqual(media_index.get_media("person", 1, EASY), [media])
+        self.assertEqual(media_index.count("person", 1, MEDIUM), 4)
+
+        media.failed_guesses = 900
+        media_index.update(media)
+        self.assertEqual(media_index.get_media("all", 0, HARD), [media])
+        self.assertEqual(media_index.count("all", 0, EASY), 0)
+
+        media.is_enabled = False
+        media_index.add(media)
+        self.assertEqual(media_index.count("all", 0, HARD), 0)
+
+    def test_remove(self):
+        # removing from the middle of a bucket swaps the last media into its place.
+        media_index.remove(self.media[1])
+        self.assertEqual(
+            [media.id for media in media_index.get_media("person", 1, MEDIUM)],
+            [1, 5, 3, 4],
+        )
+        media_index.remove(self.media[4])
+        self.assertEqual(
+            [media.id for media in media_index.get_media("person", 1, MEDIUM)],
+            [1, 4, 3],
+        )
+        media_index.remove(self.media[1])
+        for media in self.media[:5]:
+            media_index.remove(media)
+        self.assertEqual(media_index.count("person", 1, MEDIUM), 0)
+        self.assertEqual(media_index.count("all", 0, MEDIUM), 5)
+
+        # a removed media can be indexed again.
+        media_index.add(self.media[1])
+        self.assertEqual(media_index.get_media("person", 1, MEDIUM), [self.media[1]])
+
+    def test_select_from(self):
+        objects = [("person", 1), ("person", 2)]
+        for _ in range(20):
+            selected = media_index.select_from(objects, MEDIUM, 6)
+            self.assertEqual(len(selected), 6)
+            self.assertEqual(len(set(selected)), 6)
+
+        # persons and groups share media, which is still drawn once.
+        objects = [("person", 2), ("group", 1), ("person", 1)]
+        for _ in range(20):
+            selected = media_index.select_from(objects, MEDIUM, 10)
+            self.assertEqual(sorted(media.id for media in selected), list(range(1, 11)))
+
+        exclude = {1, 2, 3, 4}
+        for _ in range(20):
+            selected = media_index.select_from(objects, MEDIUM, 10, exclude=exclude)
+            self.assertEqual(sorted(media.id for media in selected), list(range(5, 11)))
+
+    def test_select_more_than_available(self):
+        self.assertEqual(len(media_index.select("person", 1, MEDIUM, 50)), 5)
+        selected = media_index.select("all", 0, MEDIUM, 9)
+        self.assertEqual(len(selected), 9)
+        selected = media_index.select_from([("all", 0)], MEDIUM, 9, exclude={1, 2, 3})
+        self.assertEqual(len(selected), 7)
+        self.assertEqual(media_index.select("person", 1, MEDIUM, 0), [])
+        self.assertEqual(media_index.select("person", 3, MEDIUM, 5), [])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import asyncio
+from random import Random
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import aiohttp
+
+from IreneAPIWrapper.exceptions import APIError
+from IreneAPIWrapper.models import (
+    LatencyHistogram,
+    PrometheusExporter,
+    Tag,
+    User,
+    use_context,
+)
+from IreneAPIWrapper.models.client import _get_size
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test the request metrics of the client.
+"""
+
+
+class TestLatencyHistogram(TestCase):
+    def test_percentiles(self):
+        rng = Random(0)
+        latencies = [rng.expovariate(100) for _ in range(10000)]
+        histogram = LatencyHistogram()
+        for latency in latencies:
+            histogram.record(latency)
+
+        latencies.sort()
+        for fraction in (0.5, 0.95, 0.99):
+            exact = latencies[int(fraction * len(latencies)) - 1]
+            self.assertAlmostEqual(
+                histogram.percentile(fraction), exact, delta=exact * 0.1
+            )
+        self.assertEqual(histogram.count, 10000)
+        self.assertEqual(histogram.max, latencies[-1])
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().percentile(0.99), 0)
+
+
+class TestFrameSize(TestCase):
+    def test_bytes(self):
+        # text frames are sent as UTF-8, so characters outside of ASCII take several bytes.
+        self.assertEqual(_get_size('{"name": "Seulgi"}'), 18)
+        self.assertEqual(_get_size('{"name": "\uc2ac\uae30"}'), 18)
+        self.assertEqual(_get_size(b"\x00\x01"), 2)
+
+
+class TestClientMetrics(StandInTestCase):
+    async def test_snapshot(self):
+        self.server.route_errors["user/$user_id"] = "Internal Server Error"
+        with use_context(self.context):
+            await asyncio.gather(*[Tag.fetch(1) for _ in range(5)])
+            with self.assertRaises(APIError):
+                await User.fetch(1)
+
+        snapshot = self.client.metrics.snapshot()
+        tags = snapshot["routes"]["GET tag/$tag_id"]
+        self.assertEqual(tags["requests"], 5)
+        self.assertEqual(tags["responses"], 5)
+        self.assertEqual(tags["network"]["count"], 5)
+        self.assertGreater(tags["bytes_received"], 0)
+        self.assertEqual(snapshot["routes"]["GET user/$user_id"]["api_errors"], 1)
+        self.assertEqual(snapshot["in_flight"], 0)
+        self.assertEqual(snapshot["queue_depth"], 0)
+
+    async def test_prometheus_exporter(self):
+        with use_context(self.context):
+            await Tag.fetch(1)
+        exporter = await PrometheusExporter(self.client.metrics, port=0).start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    f"http://127.0.0.1:{exporter.port}/metrics"
+                ) as response:
+                    text = await response.text()
+        finally:
+            await exporter.stop()
+
+        self.assertIn(
+            'ireneapi_requests_total{route="tag/$tag_id",method="GET"} 1', text
+        )
+        self.assertIn(
+            'ireneapi_network_seconds{route="tag/$tag_id",method="GET",quantile="0.99"}',
+            text,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import Context, ModelSet, Position, Tag, use_context
+
+"""
+Test comparing models and storing them in ordered sets.
+"""
+
+
+class TestModelSet(TestCase):
+    def setUp(self):
+        self.context = use_context(Context())
+        self.context.__enter__()
+
+    def tearDown(self):
+        self.context.__exit__(None, None, None)
+
+    def test_equality(self):
+        tag, same_tag = Tag(1, "Vocalist"), Tag(1, "Vocalist")
+        position = Position(1, "Leader")
+        self.assertEqual(tag, same_tag)
+        self.assertEqual(hash(tag), hash(same_tag))
+        self.assertNotEqual(tag, Tag(2, "Dancer"))
+
+        # models of different types with the same ID are different objects.
+        self.assertNotEqual(tag, position)
+        self.assertFalse(tag == position)
+        self.assertEqual(len({tag, same_tag, position}), 2)
+        self.assertNotEqual(tag, 1)
+
+    def test_order_and_replace(self):
+        tags = [Tag(tag_id, f"Tag {tag_id}") for tag_id in (3, 1, 2)]
+        objects = ModelSet(tags)
+        objects.add(Position(1, "Leader"))
+        self.assertEqual(len(objects), 4)
+        self.assertEqual(objects[0], tags[0])
+        self.assertIsInstance(objects[-1], Position)
+
+        # adding an equal object replaces it without moving it.
+        replacement = Tag(1, "Replacement")
+        objects.add(replacement)
+        self.assertIs(objects[1], replacement)
+        self.assertIs(objects.get(Tag(1, "Other")), replacement)
+        self.assertEqual([obj.id for obj in objects], [3, 1, 2, 1])
+
+    def test_remove(self):
+        objects = ModelSet([Tag(1, "Vocalist"), Tag(2, "Dancer")])
+        self.assertEqual(objects[1].id, 2)
+        objects.remove(Tag(1, "Vocalist"))
+        self.assertNotIn(Tag(1, "Vocalist"), objects)
+        self.assertEqual(objects[0].id, 2)
+        with self.assertRaises(ValueError):
+            objects.remove(Tag(1, "Vocalist"))
+
+        objects.discard(Tag(2, "Dancer"))
+        objects.discard(Tag(2, "Dancer"))
+        self.assertEqual(len(objects), 0)
+        with self.assertRaises(IndexError):
+            objects[0]
+        self.assertNotIn([], objects)
+
+        objects.extend([Tag(4, "Rapper")])
+        self.assertEqual(objects[0].id, 4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+from unittest import TestCase, main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.exceptions import APIError
+from IreneAPIWrapper.models import (
+    Context,
+    NegativeCache,
+    Person,
+    Tag,
+    User,
+    negative_cache,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test remembering fetches that returned no results.
+"""
+
+
+def fetch_person(person_id):
+    return {"route": "person/$person_id", "person_id": person_id, "method": "GET"}
+
+
+class TestNegativeCache(TestCase):
+    def setUp(self):
+        self.context = use_context(Context())
+        self.context.__enter__()
+        self.cache = NegativeCache(ttl=60, max_size=2)
+
+    def tearDown(self):
+        self.context.__exit__(None, None, None)
+
+    def test_ttl(self):
+        self.assertFalse(self.cache.is_missing(Person, fetch_person(1)))
+        self.cache.add(Person, fetch_person(1))
+        self.assertTrue(self.cache.is_missing(Person, fetch_person(1)))
+        self.assertFalse(self.cache.is_missing(Person, fetch_person(2)))
+
+        with patch("IreneAPIWrapper.models.base.negativecache.monotonic") as monotonic:
+            monotonic.return_value = float("inf")
+            self.assertFalse(self.cache.is_missing(Person, fetch_person(1)))
+
+        self.cache.set_ttl(Tag, 0)
+        request = {"route": "tag/$tag_id", "tag_id": 1, "method": "GET"}
+        self.cache.add(Tag, request)
+        self.assertFalse(self.cache.is_missing(Tag, request))
+        self.assertNotIn("Tag", self.cache.get_metrics())
+
+        metrics = self.cache.get_metrics()["Person"]
+        self.assertEqual(metrics["lookups"], 4)
+        self.assertEqual(metrics["hits"], 1)
+        self.assertEqual(metrics["stores"], 1)
+
+    def test_max_size(self):
+        for person_id in (1, 2, 3):
+            self.cache.add(Person, fetch_person(person_id))
+        self.assertFalse(self.cache.is_missing(Person, fetch_person(1)))
+        self.assertTrue(self.cache.is_missing(Person, fetch_person(3)))
+
+    def test_invalidate(self):
+        cache = NegativeCache()
+        for person_id in (1, 2, 3):
+            cache.add(Person, fetch_person(person_id))
+
+        # a write to an object only forgets that object.
+        cache.invalidate(
+            {
+                "route": "person/$person_id",
+                "person_id": 1,
+                "name": "Irene",
+                "method": "POST",
+            }
+        )
+        self.assertFalse(cache.is_missing(Person, fetch_person(1)))
+        self.assertTrue(cache.is_missing(Person, fetch_person(2)))
+
+        # an insert forgets the objects it identifies.
+        cache.invalidate({"route": "person/", "person_id": 2, "method": "POST"})
+        self.assertFalse(cache.is_missing(Person, fetch_person(2)))
+        self.assertTrue(cache.is_missing(Person, fetch_person(3)))
+        self.assertEqual(cache.get_metrics()["Person"]["invalidations"], 2)
+
+        # an insert that the API gives an ID to may have created any of them.
+        cache.invalidate({"route": "person/", "name": "Irene", "method": "POST"})
+        self.assertFalse(cache.is_missing(Person, fetch_person(3)))
+
+        cache.add(Person, fetch_person(4))
+        cache.invalidate_route("person/")
+        self.assertFalse(cache.is_missing(Person, fetch_person(4)))
+        self.assertEqual(cache.get_metrics()["Person"]["entries"], 0)
+
+
+class TestNegativeCacheClient(StandInTestCase):
+    async def test_missing_fetch(self):
+        with use_context(self.context):
+            self.assertIsNone(await Tag.fetch(404))
+            self.assertIsNone(await Tag.get(404))
+            self.assertEqual(self.server.requests[("tag/$tag_id", "GET")], 1)
+            self.assertEqual(negative_cache.get_metrics()["Tag"]["hits"], 1)
+
+            # an error is not a missing object.
+            self.server.route_errors["tag/$tag_id"] = "Internal Server Error"
+            with self.assertRaises(APIError):
+                await Tag.fetch(405)
+            self.server.route_errors.clear()
+            self.assertIsNotNone(await Tag.fetch(1))
+
+            # inserting the object makes it fetched again.
+            self.assertIsNone(await Tag.get(3))
+            await Tag.insert("Rapper")
+            self.assertEqual(str(await Tag.get(3)), "Rapper")
+
+    async def test_user_fetch(self):
+        with use_context(self.context):
+            user = await User.fetch(2)
+            self.assertEqual(user.id, 2)
+            self.assertEqual(self.server.requests[("user/$user_id", "POST")], 1)
+            self.assertEqual(self.server.requests[("user/$user_id", "GET")], 2)
+
+            # a user the API does not return after inserting it is still created once.
+            self.server.add_handler(
+                "user/$user_id", "GET", lambda server, request: {"results": {}}
+            )
+            user = await User.fetch(3)
+            self.assertEqual((user.id, user.balance), (3, 0))
+            self.assertIs(await User.get(3), user)
+            self.assertEqual(self.server.requests[("user/$user_id", "POST")], 2)
+            self.assertNotIn("User", negative_cache.get_metrics())
+
+
+if __name__ == "__main__":
+    main()
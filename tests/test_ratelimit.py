@@ -0,0 +1,111 @@
+import asyncio
+from time import perf_counter
+from unittest import IsolatedAsyncioTestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    AIMDLimiter,
+    CallBack,
+    RateLimit,
+    RequestLimiter,
+    Tag,
+    TokenBucket,
+    get_route_class,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test the rate and concurrency limits of the client.
+"""
+
+
+class TestAIMDLimiter(IsolatedAsyncioTestCase):
+    async def test_increase_and_decrease(self):
+        limiter = AIMDLimiter(initial=4, minimum=1, maximum=8)
+        acquired = [await limiter.acquire() for _ in range(4)]
+        for acquired_at in acquired:
+            limiter.release(acquired_at, overloaded=False)
+        self.assertAlmostEqual(limiter.limit, 5, delta=0.1)
+
+        # requests sent before a decrease do not decrease the limit again.
+        acquired = [await limiter.acquire() for _ in range(4)]
+        for acquired_at in acquired:
+            limiter.release(acquired_at, overloaded=True)
+        self.assertAlmostEqual(limiter.limit, 2.4, delta=0.1)
+
+    async def test_waits_for_a_slot(self):
+        limiter = AIMDLimiter(initial=1, minimum=1, maximum=1)
+        acquired_at = await limiter.acquire()
+        waiting = asyncio.get_running_loop().create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiting.done())
+
+        limiter.release(acquired_at, overloaded=False)
+        await asyncio.wait_for(waiting, 1)
+        self.assertEqual(limiter.in_flight, 1)
+
+
+class TestTokenBucket(IsolatedAsyncioTestCase):
+    async def test_validation(self):
+        for rate, capacity in ((0, 1), (-1, 1), (1, 0), (1, 0.5)):
+            with self.assertRaises(ValueError):
+                TokenBucket(rate, capacity)
+
+        # more tokens than the capacity would never be available.
+        bucket = TokenBucket(10, 2)
+        with self.assertRaises(ValueError):
+            await asyncio.wait_for(bucket.acquire(3), 1)
+        await asyncio.wait_for(bucket.acquire(2), 1)
+
+
+class TestRequestLimiter(IsolatedAsyncioTestCase):
+    async def test_route_class_rate(self):
+        self.assertEqual(get_route_class({"route": "media/$media_id"}), "media")
+        self.assertEqual(get_route_class({"route": "/media/"}), "media")
+        limiter = RequestLimiter(rate_limits={"media": RateLimit(rate=100, burst=1)})
+
+        start = perf_counter()
+        for _ in range(6):
+            callback = CallBack(request={"route": "media/$media_id", "method": "GET"})
+            await limiter.acquire(callback)
+            limiter.release(callback)
+        self.assertGreater(perf_counter() - start, 0.04)
+
+        snapshot = limiter.snapshot()
+        self.assertEqual(snapshot["route_classes"]["media"]["rate"], 100)
+        self.assertEqual(snapshot["concurrency"]["in_flight"], 0)
+
+
+class TestClientLimits(StandInTestCase):
+    server_options = {"latency": 0.02}
+
+    def create_client(self, *args, **options):
+        limiter = RequestLimiter(
+            concurrency=AIMDLimiter(initial=2, minimum=1, maximum=2)
+        )
+        return super(TestClientLimits, self).create_client(
+            *args, limiter=limiter, **options
+        )
+
+    async def test_concurrency_limit(self):
+        most_in_flight = 0
+
+        def count(_):
+            nonlocal most_in_flight
+            most_in_flight = max(
+                most_in_flight, self.client.limiter.concurrency.in_flight
+            )
+
+        self.client.tracing.add_hook("on_request_sent", count)
+        with use_context(self.context):
+            await asyncio.gather(*[Tag.fetch(1) for _ in range(10)])
+        self.assertEqual(most_in_flight, 2)
+
+
+if __name__ == "__main__":
+    main()
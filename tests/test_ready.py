@@ -0,0 +1,81 @@
+import asyncio
+from unittest import main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Media,
+    Name,
+    Tag,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test waiting for the client to connect and for the cache of models to be preloaded.
+"""
+
+
+class TestReady(StandInTestCase):
+    server_options = {"latency": 0.05}
+    connect_on_setup = False
+
+    def get_preload(self):
+        preload = super(TestReady, self).get_preload()
+        preload.tags = preload.names = True
+        return preload
+
+    async def test_wait_until_connected(self):
+        waiting = asyncio.create_task(self.client.wait_until_connected())
+        await asyncio.sleep(0.05)
+        self.assertFalse(waiting.done())
+        self.assertFalse(self.client.is_ready(Media))
+
+        self.start_connection()
+        await asyncio.wait_for(waiting, 10)
+        self.assertTrue(self.client.connected)
+        # a model that is not preloaded is fetched when needed.
+        self.assertTrue(self.client.is_ready(Media))
+        await asyncio.wait_for(self.client.ready(Media), 1)
+
+        # waiting again returns immediately while connected.
+        await asyncio.wait_for(self.client.wait_until_connected(), 1)
+
+    async def test_ready(self):
+        self.start_connection()
+        await asyncio.wait_for(self.client.wait_until_connected(), 10)
+        self.assertFalse(self.client.is_ready(Tag))
+
+        await asyncio.wait_for(self.client.ready(Tag), 10)
+        self.assertTrue(self.client.is_ready(Tag))
+        with use_context(self.context):
+            self.assertEqual(
+                {tag.id for tag in await Tag.get_all()},
+                set(self.server.get_table("tag")),
+            )
+        self.assertEqual(self.server.requests[("tag", "GET")], 1)
+
+    async def test_ready_all(self):
+        waiting = asyncio.create_task(self.client.ready_all())
+        self.start_connection()
+        await asyncio.wait_for(waiting, 10)
+        self.assertTrue(self.client.is_ready(Tag))
+        self.assertTrue(self.client.is_ready(Name))
+        self.assertTrue(self.client.is_preloaded)
+
+    async def test_failed_preload(self):
+        # a model whose preload failed is still ready, as its objects are fetched when needed.
+        self.server.route_errors["tag"] = "Unavailable."
+        with patch.object(self.client, "logger") as logger:
+            self.start_connection()
+            await asyncio.wait_for(self.client.ready_all(), 10)
+        self.assertTrue(self.client.is_ready(Tag))
+        logger.warning.assert_called_once()
+
+
+if __name__ == "__main__":
+    main()
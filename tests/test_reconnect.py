@@ -0,0 +1,103 @@
+import asyncio
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.exceptions import APIError, ConnectionLost
+from IreneAPIWrapper.models import ReconnectPolicy, basic_call, callbacks, use_context
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test reconnecting with backoff and replaying the requests that were in flight when the connection was lost.
+"""
+
+TAG_REQUEST = {"route": "tag/$tag_id", "tag_id": 1, "method": "GET"}
+INSERT_REQUEST = {"route": "tag/", "name": "Dancer", "method": "POST"}
+
+
+class TestReconnectPolicy(TestCase):
+    def test_backoff(self):
+        policy = ReconnectPolicy(base_delay=1, maximum_delay=10, seed=1)
+        for attempt in range(10):
+            self.assertLessEqual(policy.get_delay(attempt), min(10, 2**attempt))
+        self.assertLessEqual(policy.get_delay(10000), 10)
+
+        # the jitter is reproducible with a seed.
+        first, second = ReconnectPolicy(seed=5), ReconnectPolicy(seed=5)
+        self.assertEqual(
+            [first.get_delay(attempt) for attempt in range(5)],
+            [second.get_delay(attempt) for attempt in range(5)],
+        )
+
+    def test_can_replay(self):
+        policy = ReconnectPolicy()
+        self.assertTrue(policy.can_replay(TAG_REQUEST))
+        self.assertTrue(policy.can_replay({"route": "tag/"}))
+        self.assertFalse(policy.can_replay(INSERT_REQUEST))
+
+
+class TestReconnect(StandInTestCase):
+    def create_client(self, *args, **options):
+        policy = ReconnectPolicy(base_delay=0.01, maximum_delay=0.05)
+        return super(TestReconnect, self).create_client(
+            *args, reconnect_policy=policy, **options
+        )
+
+    async def _drop_in_flight(self):
+        """Send a GET and a POST, and lose the connection before they are answered."""
+        self.server.latency = 0.2
+        loop = asyncio.get_running_loop()
+        with use_context(self.context):
+            fetch = loop.create_task(basic_call(dict(TAG_REQUEST)))
+            insert = loop.create_task(basic_call(dict(INSERT_REQUEST)))
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.client._in_flight), 2)
+        await self.server.drop_connections()
+        return fetch, insert
+
+    async def test_replay(self):
+        fetch, insert = await self._drop_in_flight()
+
+        with self.assertRaises(ConnectionLost) as context:
+            await insert
+        self.assertIsInstance(context.exception, APIError)
+        self.assertNotIn(context.exception.callback.id, callbacks)
+
+        callback = await asyncio.wait_for(fetch, 5)
+        self.assertEqual(callback.response["results"]["name"], "Vocalist")
+        # the first request was sent on the lost connection, which never answered it.
+        self.assertEqual(
+            self.client.metrics.snapshot()["routes"]["GET tag/$tag_id"]["requests"], 2
+        )
+        self.assertEqual(self.server.requests[("tag/$tag_id", "GET")], 1)
+        self.assertTrue(self.client.connected)
+
+        connection = self.client.metrics.snapshot()["connection"]
+        self.assertEqual(connection["connections"], 2)
+        self.assertEqual(connection["disconnects"], 1)
+        self.assertEqual(connection["replayed_requests"], 1)
+        self.assertEqual(connection["lost_requests"], 1)
+        self.assertEqual(connection["downtime"]["count"], 1)
+        self.assertEqual(self.client.metrics.in_flight, 0)
+        self.assertEqual(self.client.limiter.concurrency.in_flight, 0)
+        self.assertIn(
+            "ireneapi_reconnect_attempts_total", self.client.metrics.to_prometheus()
+        )
+
+    async def test_without_reconnect(self):
+        self.client.reconnect = False
+        fetch, insert = await self._drop_in_flight()
+
+        # nothing will send the request again, so it fails instead of waiting for its timeout.
+        for task in (fetch, insert):
+            with self.assertRaises(ConnectionLost):
+                await task
+        await asyncio.wait_for(self.connection, 5)
+        self.assertFalse(self.client.connected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    EASY,
+    GROUP,
+    MEDIUM,
+    NORMAL,
+    AbstractModel,
+    Affiliation,
+    Context,
+    Media,
+    MediaSource,
+    RoundGenerator,
+    use_context,
+)
+
+"""
+Test drawing the media of a whole guessing game from the difficulty index.
+"""
+
+
+def filter_user(person_ids=(), group_ids=()):
+    return SimpleNamespace(
+        gg_filter_active=True,
+        gg_filter_person_ids=list(person_ids),
+        gg_filter_group_ids=list(group_ids),
+    )
+
+
+class TestRoundGenerator(TestCase):
+    def setUp(self):
+        self.context = use_context(Context())
+        self.context.__enter__()
+        solo = Affiliation(1, AbstractModel(1), None, [], "Solo")
+        member = Affiliation(2, AbstractModel(2), AbstractModel(1), [], "Member")
+        # media 1-5 is of the solo person and 6-10 of the group member.
+        for media_id in range(1, 11):
+            file_type = "mp4" if media_id in (5, 10) else "png"
+            Media(
+                media_id,
+                MediaSource(f"{media_id}.{file_type}", media_id, file_type),
+                2 if media_id in (4, 9) else 1,
+                solo if media_id <= 5 else member,
+                True,
+                False,
+            )
+        Media(11, None, 0, solo, True, False)
+
+    def tearDown(self):
+        self.context.__exit__(None, None, None)
+
+    def generate(self, user=None, mode=NORMAL, **kwargs):
+        return sorted(
+            RoundGenerator.generate_media_ids(user, mode, MEDIUM, False, **kwargs)
+        )
+
+    def test_filters(self):
+        # media without faces is never drawn by default.
+        self.assertEqual(self.generate(), list(range(1, 11)))
+        self.assertEqual(self.generate(min_faces=0), list(range(1, 12)))
+        self.assertEqual(self.generate(max_faces=1), [1, 2, 3, 5, 6, 7, 8, 10])
+        self.assertEqual(self.generate(min_faces=2), [4, 9])
+        self.assertEqual(self.generate(file_type="mp4"), [5, 10])
+        self.assertEqual(self.generate(amount=3, file_type="png", min_faces=2), [4, 9])
+
+    def test_user_filter(self):
+        self.assertEqual(self.generate(filter_user([1])), [1, 2, 3, 4, 5])
+        self.assertEqual(self.generate(mode=GROUP), list(range(6, 11)))
+        self.assertEqual(
+            self.generate(filter_user([1], [1]), mode=GROUP), list(range(6, 11))
+        )
+
+        # the member of the filtered group is also a filtered person.
+        user = filter_user([2, 1], [1])
+        for _ in range(20):
+            self.assertEqual(self.generate(user), list(range(1, 11)))
+            media_ids = self.generate(user, amount=6)
+            self.assertEqual(len(set(media_ids)), 6)
+        self.assertEqual(self.generate(user, file_type="mp4"), [5, 10])
+
+    def test_difficulty(self):
+        self.assertEqual(
+            RoundGenerator.generate_media_ids(
+                None, NORMAL, EASY, False, strict_difficulty=True
+            ),
+            [],
+        )
+        self.assertEqual(
+            len(RoundGenerator.generate_media_ids(None, NORMAL, EASY, False)), 10
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from unittest import main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.exceptions import APIError
+from IreneAPIWrapper.models import (
+    Person,
+    Group,
+    Affiliation,
+    Media,
+    User,
+    Tag,
+    TwitchAccount,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test the client and models against the local stand-in IreneAPI server.
+"""
+
+
+class TestStandInServer(StandInTestCase):
+    server_options = {"seed": 42}
+    wait_until_ready = True
+
+    def get_preload(self):
+        preload = super(TestStandInServer, self).get_preload()
+        preload.tags = (
+            preload.persons
+        ) = preload.groups = preload.affiliations = preload.media = True
+        return preload
+
+    async def test_preload(self):
+        with use_context(self.context):
+            person = await Person.get(1, fetch=False)
+            self.assertEqual(str(person.name), "Joohyun Bae")
+            self.assertEqual([str(tag) for tag in person.tags], ["Vocalist"])
+            group = await Group.get(1, fetch=False)
+            self.assertEqual({aff.id for aff in group.affiliations}, {1, 2})
+            self.assertEqual(len(await Media.get_all()), 4)
+
+    async def test_fetch_and_write(self):
+        with use_context(self.context):
+            user = await User.get(1)
+            self.assertEqual(user.balance, 100)
+            self.assertIsNone(await Tag.fetch(404))
+
+            await Tag.insert("Rapper")
+            self.assertEqual(self.server.get_table("tag")[3]["name"], "Rapper")
+            self.assertEqual(str(await Tag.get(3)), "Rapper")
+
+            self.server.live.add("redvelvet")
+            self.assertEqual(
+                await TwitchAccount.check_live_bulk(
+                    [await TwitchAccount.get("redvelvet")]
+                ),
+                {"redvelvet": True},
+            )
+
+    async def test_random_media(self):
+        with use_context(self.context):
+            affiliation = await Affiliation.get(1, fetch=False)
+            media = await Media.fetch(affiliation.id, affiliation=True)
+            self.assertEqual(media.affiliation, affiliation)
+
+            media = await Media.get_random(1, group=True)
+            self.assertIn(media.affiliation.id, {1, 2})
+            self.assertIsNone(await Media.get_random(1, group=True, min_faces=2))
+
+    async def test_error_injection(self):
+        with use_context(self.context):
+            self.server.route_errors["person/$person_id"] = "Internal Server Error"
+            with self.assertRaises(APIError):
+                await Person.fetch(1)
+
+            self.server.route_errors.clear()
+            self.server.error_rate = 1
+            with self.assertRaises(APIError):
+                await User.fetch(1)
+
+
+if __name__ == "__main__":
+    main()
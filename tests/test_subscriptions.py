@@ -0,0 +1,95 @@
+from unittest import IsolatedAsyncioTestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Channel,
+    Context,
+    TikTokAccount,
+    TwitchAccount,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test the indexes of the channels and guilds following Twitch and TikTok accounts.
+"""
+
+
+class TestSubscriptionIndex(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.context = Context()
+        with use_context(self.context):
+            self.channels = [
+                Channel(1, guild_id=10),
+                Channel(2, guild_id=10),
+                Channel(3),
+            ]
+
+    async def test_twitch(self):
+        with use_context(self.context):
+            first = TwitchAccount("first", [self.channels[0]], {self.channels[0]: 5})
+            second = TwitchAccount("second", [self.channels[0], self.channels[1]])
+            self.assertEqual(await TwitchAccount.subbed_in_channel(1), [first, second])
+            self.assertEqual(await TwitchAccount.subbed_in(10), [first, second])
+            self.assertEqual(await first.get_role_id(self.channels[0]), 5)
+
+            # the guild of a channel may only be known after it was indexed.
+            second._sub_in_cache(self.channels[2])
+            self.assertEqual(await TwitchAccount.subbed_in(20), [])
+            self.channels[2].guild_id = 20
+            first._sub_in_cache(self.channels[2])
+            self.assertEqual(set(await TwitchAccount.subbed_in(20)), {first, second})
+
+            first._unsub_in_cache(self.channels[0])
+            self.assertEqual(await TwitchAccount.subbed_in_channel(1), [second])
+            self.assertIsNone(await first.get_role_id(self.channels[0]))
+            second._unsub_in_cache(self.channels[0])
+            second._unsub_in_cache(self.channels[1])
+            self.assertEqual(await TwitchAccount.subbed_in(10), [])
+
+            await first._remove_from_cache()
+            self.assertEqual(await TwitchAccount.subbed_in_channel(3), [second])
+
+    async def test_tiktok(self):
+        with use_context(self.context):
+            account = TikTokAccount("account", [7])
+            account._sub_in_cache(self.channels[0], user_id=8, role_id=5)
+            account._sub_in_cache(channels=[self.channels[1]], user_id=8)
+            self.assertEqual(account.user_ids, [7, 8])
+            self.assertEqual(await TikTokAccount.subbed_in(10), [account])
+            self.assertEqual(await account.get_role_id(self.channels[0]), 5)
+            # the accounts of each service are indexed separately.
+            self.assertEqual(await TwitchAccount.subbed_in_channel(1), [])
+
+            setattr(self.channels[0], "user_id", 8)
+            account._unsub_in_cache(self.channels[0])
+            self.assertEqual(account.user_ids, [7])
+            self.assertEqual(await TikTokAccount.subbed_in_channel(1), [])
+            self.assertEqual(await TikTokAccount.subbed_in(10), [account])
+
+
+class TestSubbedIn(StandInTestCase):
+    async def test_fetch(self):
+        rows = self.server.get_table("twitch")
+        self.server.add_handler(
+            "twitch/filter/$guild_id",
+            "GET",
+            lambda server, request: {
+                "results": {str(key): row for key, row in rows.items()}
+            },
+        )
+        with use_context(self.context):
+            # the index answers by default, and nothing is cached yet.
+            self.assertEqual(await TwitchAccount.subbed_in(1), [])
+            accounts = await TwitchAccount.subbed_in(1, fetch=True)
+            self.assertEqual([account.name for account in accounts], ["redvelvet"])
+            self.assertEqual(await TwitchAccount.subbed_in(1), accounts)
+        self.assertEqual(self.server.requests[("twitch/filter/$guild_id", "GET")], 1)
+
+
+if __name__ == "__main__":
+    main()
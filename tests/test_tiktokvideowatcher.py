@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from unittest import main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Channel,
+    TikTokAccount,
+    TikTokVideoWatcher,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test watching the latest videos of TikTok accounts and emitting the new videos.
+"""
+
+
+class TestTikTokVideoWatcher(StandInTestCase):
+    async def asyncSetUp(self):
+        await super(TestTikTokVideoWatcher, self).asyncSetUp()
+        with use_context(self.context):
+            self.channel = Channel(1, guild_id=1)
+            self.account = TikTokAccount("a", [1], [self.channel], {self.channel: 5})
+        self.watcher = TikTokVideoWatcher(rate=100, burst=100)
+
+    async def poll(self, watcher=None):
+        with use_context(self.context):
+            events = await (watcher or self.watcher).poll([self.account])
+        return [event.video_id for event in events]
+
+    async def test_new_videos(self):
+        received = []
+        self.watcher.add_listener(lambda event: received.append(event))
+
+        # the first video seen is only remembered.
+        self.server.latest_videos["a"] = 100
+        self.assertEqual(await self.poll(), [])
+        self.assertEqual(self.watcher.last_seen, {"a": 100})
+
+        self.server.latest_videos["a"] = 105
+        self.assertEqual(await self.poll(), [105])
+        self.assertEqual(await self.poll(), [])
+        self.assertEqual(received[0].channels, [self.channel])
+        self.assertEqual(received[0].mention_roles, {self.channel: 5})
+
+        # an older video resurfaces after the latest one was deleted.
+        self.server.latest_videos["a"] = 100
+        self.assertEqual(await self.poll(), [])
+        self.assertEqual(self.watcher.last_seen, {"a": 105})
+
+        self.server.latest_videos["a"] = 110
+        self.assertEqual(await self.poll(), [110])
+        self.assertEqual(len(received), 2)
+
+    async def test_failed_account(self):
+        with use_context(self.context):
+            other = TikTokAccount("b", [2], [self.channel])
+        self.server.latest_videos.update({"a": 100, "b": 200})
+        with use_context(self.context):
+            await self.watcher.poll([self.account, other])
+
+        # a malformed response of one account does not hide the videos of the others.
+        self.server.latest_videos.update({"a": 101, "b": 201})
+
+        async def malformed():
+            raise KeyError("results")
+
+        with use_context(self.context), patch.object(
+            other, "get_latest_video_id", malformed
+        ), patch.object(self.client, "logger") as logger:
+            events = await self.watcher.poll([self.account, other])
+        self.assertEqual([event.video_id for event in events], [101])
+        logger.warning.assert_called_once()
+        self.assertEqual(self.watcher.last_seen, {"a": 101, "b": 200})
+
+    async def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "videos.json")
+            watcher = TikTokVideoWatcher(rate=100, burst=100, persist_path=path)
+            self.server.latest_videos["a"] = 100
+            self.assertEqual(await self.poll(watcher), [])
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["last_seen"], {"a": 100})
+
+            # a restarted watcher does not repost an old video.
+            restarted = TikTokVideoWatcher(rate=100, burst=100, persist_path=path)
+            self.server.latest_videos["a"] = 99
+            self.assertEqual(await self.poll(restarted), [])
+            self.server.latest_videos["a"] = 101
+            self.assertEqual(await self.poll(restarted), [101])
+
+
+if __name__ == "__main__":
+    main()
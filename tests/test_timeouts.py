@@ -0,0 +1,126 @@
+import asyncio
+from unittest import main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.exceptions import APIError, RequestTimeout
+from IreneAPIWrapper.models import (
+    AIMDLimiter,
+    NO_TIMEOUT,
+    RequestLimiter,
+    Tag,
+    basic_call,
+    callbacks,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test request timeouts, cancellation and the cleanup of abandoned requests.
+"""
+
+TAG_REQUEST = {"route": "tag/$tag_id", "tag_id": 1, "method": "GET"}
+
+
+class TestTimeouts(StandInTestCase):
+    def create_client(self, *args, **options):
+        # a concurrency limit of 1 queues every request behind the one being sent.
+        limiter = RequestLimiter(
+            concurrency=AIMDLimiter(initial=1, minimum=1, maximum=1)
+        )
+        return super(TestTimeouts, self).create_client(
+            *args, limiter=limiter, **options
+        )
+
+    async def test_timeout(self):
+        with use_context(self.context):
+            self.server.latency = 0.2
+            with self.assertRaises(RequestTimeout) as context:
+                await basic_call(dict(TAG_REQUEST), timeout=0.05)
+            self.assertIsInstance(context.exception, APIError)
+            self.assertNotIn(context.exception.callback.id, callbacks)
+            self.assertEqual(
+                self.client.metrics.snapshot()["routes"]["GET tag/$tag_id"]["timeouts"],
+                1,
+            )
+
+            # the late response is dropped and the next request gets its own response.
+            self.server.latency = 0
+            await asyncio.sleep(0.3)
+            self.assertEqual(self.client.metrics.late_responses, 1)
+            callback = await basic_call(dict(TAG_REQUEST))
+            self.assertEqual(callback.response["results"]["name"], "Vocalist")
+            self.assertNotIn(callback.id, callbacks)
+
+    async def test_default_timeout(self):
+        # a request the API never answers is abandoned after the default timeout.
+        with use_context(self.context):
+            self.assertEqual(self.client.default_timeout, 30.0)
+            self.client.default_timeout = 0.05
+            self.assertEqual(
+                self.client.get_timeout({"route": "tag/", "method": "GET"}), 0.05
+            )
+            self.server.latency = 0.2
+            with self.assertRaises(RequestTimeout) as context:
+                await basic_call(dict(TAG_REQUEST))
+            self.assertEqual(context.exception.timeout, 0.05)
+
+    async def test_no_timeout(self):
+        # a slow request (ex: preloading a whole cache) can opt out of the default timeout.
+        with use_context(self.context):
+            self.client.default_timeout = 0.05
+            self.server.latency = 0.2
+            callback = await basic_call(
+                {"route": "tag/", "method": "GET"}, timeout=NO_TIMEOUT
+            )
+            self.assertEqual(len(callback.response["results"]), 2)
+            self.assertEqual(len(await Tag.fetch_all()), 2)
+            self.assertEqual(
+                self.client.metrics.snapshot()["routes"]["GET tag/"]["timeouts"], 0
+            )
+
+    async def test_zero_timeout(self):
+        # a timeout of 0 expires right away instead of waiting forever.
+        with use_context(self.context):
+            self.server.latency = 0.05
+            with self.assertRaises(RequestTimeout) as context:
+                await basic_call(dict(TAG_REQUEST), timeout=0)
+            self.assertEqual(context.exception.timeout, 0)
+
+    async def test_route_timeouts(self):
+        with use_context(self.context):
+            self.server.latency = 0.2
+            self.client.timeouts["tag"] = 0.05
+            self.assertEqual(self.client.get_timeout(TAG_REQUEST), 0.05)
+            self.assertEqual(
+                self.client.get_timeout({"route": "person/$person_id"}),
+                self.client.default_timeout,
+            )
+            with self.assertRaises(RequestTimeout):
+                await Tag.fetch(1)
+
+    async def test_cancelled_before_sent(self):
+        with use_context(self.context):
+            self.server.latency = 0.1
+            # the concurrency limit is 1, so the second request waits in the queue behind the first.
+            first = asyncio.get_running_loop().create_task(
+                basic_call(dict(TAG_REQUEST))
+            )
+            second = asyncio.get_running_loop().create_task(
+                basic_call({"route": "tag/", "method": "GET"})
+            )
+            await asyncio.sleep(0.02)
+            second.cancel()
+            await first
+            await asyncio.sleep(0.15)
+
+            self.assertTrue(second.cancelled())
+            self.assertEqual(self.server.requests.get(("tag", "GET")), None)
+            self.assertEqual(self.client.limiter.concurrency.in_flight, 0)
+
+
+if __name__ == "__main__":
+    main()
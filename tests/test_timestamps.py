@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from random import Random
+from unittest import TestCase, main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    COMMON_TIMESTAMP_FORMAT,
+    convert_to_common_timestring,
+    convert_to_date,
+    convert_to_timestamp,
+)
+from IreneAPIWrapper.models import _parse_common_timestamp, _timestamps
+
+"""
+Test that the fast timestamp parser is equivalent to datetime.strptime with the common timestamp format.
+"""
+
+
+def strptime(date_string: str) -> datetime:
+    return datetime.strptime(date_string, COMMON_TIMESTAMP_FORMAT)
+
+
+class TestTimestamps(TestCase):
+    def setUp(self):
+        _timestamps.clear()
+
+    def test_random_timestamps(self):
+        rng = Random(39)
+        start = datetime(1900, 1, 1)
+        for _ in range(20000):
+            timestamp = start + timedelta(
+                seconds=rng.randrange(200 * 365 * 24 * 60 * 60)
+            )
+            for timezone in ("GMT", "UTC"):
+                date_string = timestamp.strftime(f"%a, %d %b %Y %H:%M:%S {timezone}")
+                self.assertEqual(
+                    _parse_common_timestamp(date_string), strptime(date_string)
+                )
+                self.assertEqual(
+                    convert_to_timestamp(date_string), strptime(date_string)
+                )
+
+    def test_common_timestrings(self):
+        timestamp = datetime(2022, 2, 28, 23, 59, 59)
+        date_string = convert_to_common_timestring(timestamp)
+        self.assertEqual(convert_to_timestamp(date_string), strptime(date_string))
+        self.assertEqual(convert_to_date(date_string), strptime(date_string).date())
+
+    def test_empty(self):
+        for date_string in (None, ""):
+            self.assertIsNone(convert_to_timestamp(date_string))
+            self.assertIsNone(convert_to_date(date_string))
+
+    def test_memoized(self):
+        date_string = "Sun, 06 Nov 1994 08:49:37 GMT"
+        self.assertIs(
+            convert_to_timestamp(date_string), convert_to_timestamp(date_string)
+        )
+        self.assertEqual(convert_to_timestamp(date_string), strptime(date_string))
+
+    def test_fallback(self):
+        # valid for strptime, but not in the fixed positions of the fast path.
+        for date_string in (
+            "Sun, 6 Nov 1994 08:49:37 GMT",
+            "sun, 06 nov 1994 08:49:37 gmt",
+            "Sun, 06 Nov 1994 8:49:37 GMT",
+        ):
+            self.assertIsNone(_parse_common_timestamp(date_string))
+            self.assertEqual(convert_to_timestamp(date_string), strptime(date_string))
+
+    def test_invalid(self):
+        for date_string in (
+            "Sun, 06 Nov 1994 08:49:37",
+            "Sun, 06 Nov 1994 08:49:37 XYZ",
+            "Abc, 06 Nov 1994 08:49:37 GMT",
+            "Sun, 06 Abc 1994 08:49:37 GMT",
+            "Sun, 31 Feb 1994 08:49:37 GMT",
+            "Sun, 00 Nov 1994 08:49:37 GMT",
+            "Sun, 06 Nov 1994 24:49:37 GMT",
+            "Sun, 06 Nov 1994 08:60:37 GMT",
+            "Sun, 06 Nov 1994 08:49:60 GMT",
+            "Sun, +6 Nov 1994 08:49:37 GMT",
+            "Sun, 06 Nov 1_94 08:49:37 GMT",
+            "Sun, 06 Nov 1994 08-49-37 GMT",
+            "Sun, 06 Nov 1994 08:49:37 GMT ",
+        ):
+            with self.assertRaises(ValueError, msg=date_string):
+                strptime(date_string)
+            with self.assertRaises(ValueError, msg=date_string):
+                convert_to_timestamp(date_string)
+
+
+if __name__ == "__main__":
+    main()
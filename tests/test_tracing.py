@@ -0,0 +1,79 @@
+import asyncio
+from unittest import main
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import Tag, trace_context, use_context
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test the tracing hooks of the client.
+"""
+
+HOOKS = (
+    "on_request_enqueued",
+    "on_request_sent",
+    "on_response_received",
+    "on_model_created",
+)
+
+
+class TestTracing(StandInTestCase):
+    async def asyncSetUp(self):
+        await super(TestTracing, self).asyncSetUp()
+        self.events = []
+        self.hooks = {
+            name: (lambda event, name=name: self.events.append((name, event)))
+            for name in HOOKS
+        }
+        for name, hook in self.hooks.items():
+            self.client.tracing.add_hook(name, hook)
+
+    async def test_hooks(self):
+        with use_context(self.context):
+
+            async def command(name):
+                trace_context.set(name)
+                await Tag.fetch(1)
+
+            await asyncio.gather(command("first"), command("second"))
+
+            self.assertEqual(sorted(name for name, _ in self.events), sorted(HOOKS * 2))
+            for context in ("first", "second"):
+                events = [
+                    (name, event)
+                    for name, event in self.events
+                    if event.context == context
+                ]
+                self.assertEqual([name for name, _ in events], list(HOOKS))
+                self.assertEqual(len({event.callback_id for _, event in events}), 1)
+                self.assertEqual(events[0][1].route, "tag/$tag_id")
+                self.assertGreater(events[2][1].size, 0)
+                self.assertEqual((events[3][1].model, events[3][1].count), ("Tag", 1))
+
+    async def test_failing_hook(self):
+        with use_context(self.context):
+
+            def fail(event):
+                raise RuntimeError
+
+            self.client.tracing.add_hook("on_request_sent", fail)
+            self.assertEqual(str(await Tag.fetch(1)), "Vocalist")
+
+    async def test_remove_hooks(self):
+        with use_context(self.context):
+            for name, hook in self.hooks.items():
+                self.client.tracing.remove_hook(name, hook)
+            self.assertFalse(self.client.tracing.active)
+            await Tag.fetch(1)
+            self.assertEqual(self.events, [])
+
+            with self.assertRaises(ValueError):
+                self.client.tracing.add_hook("on_unknown", print)
+
+
+if __name__ == "__main__":
+    main()
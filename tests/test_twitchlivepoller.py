@@ -0,0 +1,102 @@
+from unittest import main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Channel,
+    TwitchAccount,
+    TwitchLivePoller,
+    basic_call,
+    use_context,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test polling the live status of Twitch accounts in chunks and emitting the changes.
+"""
+
+
+class TestTwitchLivePoller(StandInTestCase):
+    async def asyncSetUp(self):
+        await super(TestTwitchLivePoller, self).asyncSetUp()
+        with use_context(self.context):
+            channel = Channel(1, guild_id=1)
+            self.accounts = [TwitchAccount(name, [channel]) for name in ("a", "b", "c")]
+        self.poller = TwitchLivePoller(chunk_size=2, interval=60, min_interval=15)
+
+    async def poll(self):
+        with use_context(self.context):
+            changes = await self.poller.poll(self.accounts)
+        return [(change.account.id, change.is_live) for change in changes]
+
+    async def test_changes(self):
+        received = []
+
+        async def listener(change):
+            received.append(change.account.id)
+
+        def failing_listener(change):
+            raise RuntimeError
+
+        self.poller.add_listener(failing_listener)
+        self.poller.add_listener(listener)
+
+        self.assertEqual(await self.poll(), [])
+        self.assertEqual(self.poller.interval, 90)
+
+        self.server.live.add("a")
+        self.assertEqual(await self.poll(), [("a", True)])
+        self.assertTrue(self.accounts[0].is_live)
+        self.assertEqual(received, ["a"])
+        self.assertEqual(self.poller.interval, 45)
+
+        self.assertEqual(await self.poll(), [])
+        self.assertEqual(self.poller.interval, 67.5)
+        self.assertEqual(self.server.requests[("twitch/is_live", "GET")], 6)
+
+        self.server.live = {"c"}
+        self.assertEqual(await self.poll(), [("a", False), ("c", True)])
+
+    async def test_initial_state(self):
+        # accounts that are already live when the poller starts do not notify again.
+        self.server.live = {"a", "b"}
+        self.assertEqual(await self.poll(), [])
+        self.assertTrue(self.accounts[0].is_live)
+        self.assertEqual(await self.poll(), [])
+
+        self.server.live = {"b"}
+        self.assertEqual(await self.poll(), [("a", False)])
+
+    async def test_other_checks(self):
+        self.assertEqual(await self.poll(), [])
+
+        # a check outside of the poller already marked the account as live.
+        self.server.live.add("b")
+        with use_context(self.context):
+            await TwitchAccount.check_live_bulk(self.accounts)
+        self.assertTrue(self.accounts[1].is_live)
+        self.assertEqual(await self.poll(), [("b", True)])
+
+    async def test_failed_chunk(self):
+        self.assertEqual(await self.poll(), [])
+        self.server.live = {"a", "c"}
+
+        async def failing_call(request, *args, **kwargs):
+            if "c" in request.get("usernames", []):
+                raise RuntimeError("Malformed response.")
+            return await basic_call(request, *args, **kwargs)
+
+        with patch("IreneAPIWrapper.models.twitchlivepoller.basic_call", failing_call):
+            self.assertEqual(await self.poll(), [("a", True)])
+        self.assertFalse(self.accounts[2].is_live)
+
+        # the account is emitted once its chunk succeeds.
+        self.assertEqual(await self.poll(), [("c", True)])
+
+
+if __name__ == "__main__":
+    main()
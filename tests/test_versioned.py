@@ -0,0 +1,132 @@
+import asyncio
+from unittest import TestCase, main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.models import (
+    Context,
+    Display,
+    Name,
+    Person,
+    Tag,
+    get_version,
+    use_context,
+)
+
+"""
+Test versioning models and caching the cards rendered from them.
+"""
+
+
+class TestVersioned(TestCase):
+    def setUp(self):
+        self.context = use_context(Context())
+        self.context.__enter__()
+
+    def tearDown(self):
+        self.context.__exit__(None, None, None)
+
+    def test_version(self):
+        tag, other_tag = Tag(1, "Vocalist"), Tag(2, "Dancer")
+        self.assertGreater(tag._version, 0)
+        self.assertGreater(other_tag._version, tag._version)
+
+        # setting a versioned attribute changes the version, other attributes do not.
+        version = tag._version
+        tag.name = "Main Vocalist"
+        self.assertGreater(tag._version, version)
+        self.assertEqual(tag.name, "Main Vocalist")
+        version = tag._version
+        tag.id = 3
+        self.assertEqual(tag._version, version)
+        tag.bump_version()
+        self.assertGreater(tag._version, other_tag._version)
+
+        self.assertEqual(get_version(tag, other_tag, None, "text"), tag._version)
+        self.assertEqual(get_version(), 0)
+
+    def test_refresh(self):
+        tag = Tag(1, "Vocalist")
+        fresh = Tag(1, "Main Vocalist")
+        tag._refresh_from(fresh)
+        self.assertEqual(tag.name, "Main Vocalist")
+        self.assertGreater(tag._version, fresh._version)
+
+    def test_cached_card(self):
+        name, unrelated = Name(1, "Seulgi", "Kang"), Name(2, "Irene", "Bae")
+        renders = []
+
+        async def render():
+            renders.append(name.first)
+            return [name.first]
+
+        def get_card():
+            return asyncio.run(name.get_cached_card("card", lambda: [], render))
+
+        self.assertEqual(get_card(), ["Seulgi"])
+        card = get_card()
+        card.append("changed")
+        self.assertEqual(get_card(), ["Seulgi"])
+
+        # a change to another object does not touch the card.
+        unrelated.bump_version()
+        self.assertEqual(get_card(), ["Seulgi"])
+        self.assertEqual(renders, ["Seulgi"])
+
+        name.first = "Kang Seulgi"
+        self.assertEqual(get_card(), ["Kang Seulgi"])
+        self.assertEqual(len(renders), 2)
+
+    def test_person_card(self):
+        name = Name(1, "Seulgi", "Kang")
+        person = Person(
+            1,
+            name,
+            None,
+            Display(1, None, None),
+            None,
+            None,
+            "A",
+            "F",
+            "A person.",
+            163,
+            0,
+            0,
+            [Tag(1, "Vocalist")],
+            [],
+            None,
+            None,
+        )
+
+        async def get_card():
+            return await person.get_card()
+
+        card = asyncio.run(get_card())
+        self.assertIn("Description: A person.", card)
+
+        # plain attribute changes re-render the card.
+        person.call_count += 1
+        self.assertIn("Called: 1 time(s).", asyncio.run(get_card()))
+        person.description = "A singer."
+        self.assertIn("Description: A singer.", asyncio.run(get_card()))
+
+        # so do changes to the objects the card is rendered from.
+        name.first = "Kang Seulgi"
+        self.assertIn("Name: Kang Seulgi Kang", asyncio.run(get_card()))
+        person.tags[0].name = "Main Vocalist"
+        self.assertIn("Tags: Main Vocalist", asyncio.run(get_card()))
+
+        # while changes to other objects do not.
+        with patch.object(person, "_render_card") as render:
+            Name(2, "Irene", "Bae").first = "Joohyun"
+            Tag(2, "Dancer").bump_version()
+            asyncio.run(get_card())
+        render.assert_not_called()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+import asyncio
+import datetime
+from unittest import IsolatedAsyncioTestCase, main
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from IreneAPIWrapper.exceptions import ConnectionLost
+from IreneAPIWrapper.models import (
+    Context,
+    GuessingGame,
+    IreneAPIClient,
+    Media,
+    WriteBehindBuffer,
+    UnscrambleGame,
+    basic_call,
+    game_state_writes,
+    use_context,
+    write_behind,
+)
+from IreneAPIWrapper.testing import StandInTestCase
+
+"""
+Test coalescing writes in memory, retrying the writes that fail and flushing them on disconnect.
+"""
+
+
+class Writer:
+    """Records the states it sends and fails a set amount of times first."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.state = 0
+        self.sent = []
+
+    async def __call__(self):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Write failed.")
+        self.sent.append(self.state)
+
+
+class TestWriteBehindBuffer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.context = Context()
+        # the buffer logs failures with the client of its context.
+        IreneAPIClient("test", 1, context=self.context)
+        self.use_context = use_context(self.context)
+        self.use_context.__enter__()
+        self.buffer = WriteBehindBuffer(interval=60, max_retries=2)
+
+    async def asyncTearDown(self):
+        await self.buffer.stop()
+        self.use_context.__exit__(None, None, None)
+
+    async def test_coalesce(self):
+        writer = Writer()
+        for state in range(1, 4):
+            writer.state = state
+            await self.buffer.stage("key", writer)
+        self.assertEqual(self.buffer.buffered_keys, 1)
+        self.assertEqual(await self.buffer.flush(), 1)
+        self.assertEqual(writer.sent, [3])
+        self.assertEqual(await self.buffer.flush(), 0)
+
+        metrics = self.buffer.get_metrics()
+        self.assertEqual((metrics["staged"], metrics["coalesced"]), (3, 2))
+
+    async def test_retry(self):
+        writer = Writer(failures=2)
+        await self.buffer.stage("key", writer)
+        await self.buffer.flush()
+        await self.buffer.flush()
+        self.assertEqual(writer.sent, [])
+        self.assertEqual(self.buffer.buffered_keys, 1)
+
+        await self.buffer.flush()
+        self.assertEqual(writer.sent, [0])
+        self.assertEqual(self.buffer.buffered_keys, 0)
+        metrics = self.buffer.get_metrics()
+        self.assertEqual((metrics["retries"], metrics["dropped"]), (2, 0))
+
+    async def test_drop(self):
+        writer = Writer(failures=10)
+        await self.buffer.stage("key", writer)
+        for _ in range(3):
+            await self.buffer.flush()
+        self.assertEqual(self.buffer.buffered_keys, 0)
+        self.assertEqual(self.buffer.get_metrics()["dropped"], 1)
+
+        # a key staged again later has all of its retries.
+        await self.buffer.stage("key", writer)
+        await self.buffer.flush()
+        self.assertEqual(self.buffer.buffered_keys, 1)
+
+    async def test_staged_while_failing(self):
+        newer = Writer()
+
+        async def failing_writer():
+            await self.buffer.stage("key", newer)
+            raise RuntimeError("Write failed.")
+
+        await self.buffer.stage("key", failing_writer)
+        await self.buffer.flush()
+        self.assertEqual(self.buffer.get_metrics()["retries"], 0)
+        await self.buffer.flush_key("key")
+        self.assertEqual(newer.sent, [0])
+
+    async def test_stop_retries(self):
+        writer = Writer(failures=2)
+        await self.buffer.stage("key", writer)
+        await self.buffer.stop()
+        self.assertEqual(writer.sent, [0])
+
+    async def test_stop_during_periodic_flush(self):
+        sent = []
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_writer():
+            started.set()
+            await release.wait()
+            sent.append("slow")
+
+        self.buffer.interval = 0.01
+        await self.buffer.stage("key", slow_writer)
+        await asyncio.wait_for(started.wait(), 10)
+
+        # the periodic flush already took the key, so stopping waits for its write instead of cancelling it.
+        stop = asyncio.create_task(self.buffer.stop())
+        await asyncio.sleep(0.02)
+        self.assertFalse(stop.done())
+        release.set()
+        await stop
+        self.assertEqual(sent, ["slow"])
+        self.assertEqual(self.buffer.get_metrics()["dropped"], 0)
+
+    async def test_discard_while_sending(self):
+        release = asyncio.Event()
+
+        async def failing_writer():
+            await release.wait()
+            raise RuntimeError("Write failed.")
+
+        await self.buffer.stage("key", failing_writer)
+        flush = asyncio.create_task(self.buffer.flush())
+        await asyncio.sleep(0)
+        self.buffer.discard("key")
+        release.set()
+        await flush
+        self.assertEqual(self.buffer.get_metrics()["retries"], 0)
+        self.assertEqual(self.buffer.buffered_keys, 0)
+
+    async def test_disabled(self):
+        writer = Writer()
+        self.buffer.enabled = False
+        await self.buffer.stage("key", writer)
+        self.assertEqual(writer.sent, [0])
+        self.assertEqual(self.buffer.buffered_keys, 0)
+
+    async def test_flush_key_waits_for_flush(self):
+        sent = []
+        release = asyncio.Event()
+
+        async def slow_writer():
+            await release.wait()
+            sent.append("first")
+
+        async def writer():
+            sent.append("second")
+
+        await self.buffer.stage("key", slow_writer)
+        flush = asyncio.create_task(self.buffer.flush())
+        await asyncio.sleep(0)
+
+        # the key is being sent by the flush, so there is nothing pending to send.
+        flush_key = asyncio.create_task(self.buffer.flush_key("key"))
+        await asyncio.sleep(0)
+        self.assertFalse(flush_key.done())
+        release.set()
+        self.assertTrue(await flush_key)
+        self.assertEqual(sent, ["first"])
+        await flush
+
+        # a key staged again while it is being sent is written after the write in flight.
+        release.clear()
+        await self.buffer.stage("key", slow_writer)
+        flush = asyncio.create_task(self.buffer.flush())
+        await asyncio.sleep(0)
+        await self.buffer.stage("key", writer)
+        flush_key = asyncio.create_task(self.buffer.flush_key("key"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(flush, flush_key)
+        self.assertEqual(sent, ["first", "first", "second"])
+        self.assertFalse(await self.buffer.flush_key("key"))
+
+
+class TestGameStateOrder(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.context = Context()
+        self.use_context = use_context(self.context)
+        self.use_context.__enter__()
+        self.requests = []
+
+    async def asyncTearDown(self):
+        self.use_context.__exit__(None, None, None)
+
+    async def record(self, request, *args, **kwargs):
+        if request["method"] == "PUT":
+            # the state write is still being sent when the game ends.
+            await asyncio.sleep(0.05)
+        self.requests.append(request["method"])
+
+    async def end_game(self, game, module, update):
+        with patch(f"IreneAPIWrapper.models.{module}.basic_call", self.record):
+            await update
+            flush = asyncio.create_task(game_state_writes.flush())
+            await asyncio.sleep(0)
+            await game.update_end_date(datetime.datetime(2022, 1, 1))
+            await flush
+        self.assertEqual(self.requests, ["PUT", "POST"])
+
+    async def test_guessing_game(self):
+        game = GuessingGame(1, [], [], 1, None, False, None, None)
+        await self.end_game(
+            game, "guessinggame", game.update_media_and_status([1], [2])
+        )
+
+    async def test_unscramble_game(self):
+        game = UnscrambleGame(1, [], 1, None, None, None)
+        await self.end_game(game, "unscramblegame", game.update_status([2]))
+
+
+class TestDisconnect(StandInTestCase):
+    client_options = {"reconnect": False}
+
+    async def test_flush_on_disconnect(self):
+        writer, game_writer = Writer(), Writer()
+        with use_context(self.context):
+            await write_behind.stage("key", writer)
+            await game_state_writes.stage("game", game_writer)
+        await self.client.disconnect()
+        await asyncio.wait_for(self.connection, 10)
+        self.assertEqual((writer.sent, game_writer.sent), ([0], [0]))
+
+    async def test_deleted_media(self):
+        with use_context(self.context):
+            media = await Media.get(1)
+            await media.upsert_guesses(correct=True)
+            await media.delete()
+            # the pending guesses of the deleted media are not written back.
+            self.assertEqual(await write_behind.flush(), 0)
+        self.assertIsNone(self.server.requests.get(("media/$media_id", "POST")))
+        self.assertNotIn(1, self.server.get_table("media"))
+
+    async def test_flush_when_closed(self):
+        await self.client._ws_client.close()
+        await asyncio.wait_for(self.connection, 10)
+
+        writer = Writer()
+        with use_context(self.context):
+            await write_behind.stage("key", writer)
+        await self.client.disconnect()
+        self.assertEqual(writer.sent, [0])
+
+        # a request made after the connection ended fails instead of waiting forever.
+        with use_context(self.context), self.assertRaises(ConnectionLost):
+            await basic_call({"route": "tag/$tag_id", "tag_id": 1, "method": "GET"})
+
+
+if __name__ == "__main__":
+    main()